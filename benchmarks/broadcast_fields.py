@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cost of passing a 2D field to a 3D stencil: masked field, 3D copy or broadcast view.
+
+Usage: python benchmarks/broadcast_fields.py [--backend numpy] [--shape 128 128 80] [--number 10]
+"""
+
+import argparse
+import functools
+import timeit
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+from gt4py import gtscript
+from gt4py.gtscript import IJ, PARALLEL, Field, computation, interval
+
+
+def add_2d(surface: Field[np.float64, IJ], field: Field[np.float64], out: Field[np.float64]):
+    with computation(PARALLEL), interval(...):
+        out = field + surface  # noqa: F841
+
+
+def add_3d(surface: Field[np.float64], field: Field[np.float64], out: Field[np.float64]):
+    with computation(PARALLEL), interval(...):
+        out = field + surface  # noqa: F841
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--shape", type=int, nargs=3, default=[128, 128, 80])
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    shape = tuple(args.shape)
+    masked_stencil = gtscript.stencil(backend=args.backend, definition=add_2d)
+    stencil = gtscript.stencil(backend=args.backend, definition=add_3d)
+    field = gt_storage.ones(args.backend, (0, 0, 0), shape, np.float64)
+    out = gt_storage.zeros(args.backend, (0, 0, 0), shape, np.float64)
+    surface = gt_storage.from_array(
+        np.random.randn(*shape[:2]), args.backend, (0, 0, 0), mask=[True, True, False]
+    )
+
+    def expand():
+        expanded = gt_storage.empty(args.backend, (0, 0, 0), shape, np.float64)
+        expanded[...] = surface.view(np.ndarray)[:, :, np.newaxis]
+        return expanded
+
+    cases = {
+        "masked 2D field": (masked_stencil, lambda: surface),
+        "3D copy": (stencil, expand),
+        "broadcast_to": (stencil, lambda: surface.broadcast_to(shape)),
+    }
+
+    print(f"{'case':<20}{'setup [ms]':>12}{'run [ms]':>12}{'extra memory [MiB]':>20}")
+    for name, (case_stencil, make_input) in cases.items():
+        setup_time = min(timeit.repeat(make_input, number=args.number, repeat=3))
+        surface_input = make_input()
+        run = functools.partial(case_stencil, surface_input, field, out)
+        run_time = min(timeit.repeat(run, number=args.number, repeat=3))
+        extra_bytes = 0 if np.shares_memory(surface_input, surface) else surface_input.nbytes
+        print(
+            f"{name:<20}{1e3 * setup_time / args.number:>12.3f}"
+            f"{1e3 * run_time / args.number:>12.3f}{extra_bytes / 2 ** 20:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Cost of template rendering and source formatting in eve code generators.
+
+Usage: python benchmarks/eve_codegen.py [--loops 20] [--number 3]
+"""
+
+import argparse
+import contextlib
+import timeit
+
+import oir_trees
+
+from eve import codegen
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+
+
+def legacy_render_values(self, **kwargs):
+    """Render the template compiling its f-string again in every call."""
+    return eval(self.definition, {}, kwargs or {})
+
+
+@contextlib.contextmanager
+def legacy_format_templates():
+    render_values = codegen.FormatTemplate.render_values
+    codegen.FormatTemplate.render_values = legacy_render_values
+    try:
+        yield
+    finally:
+        codegen.FormatTemplate.render_values = render_values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    def measure(run):
+        return min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(stencil)
+
+    def generate():
+        return gtcpp_codegen.GTCppCodegen.apply(
+            gtcpp, gt_backend_t="cpu_ifirst", format_source=False
+        )
+
+    with legacy_format_templates():
+        legacy_time = measure(generate)
+    compiled_time = measure(generate)
+    print(f"{'case':<24}{'legacy [ms]':>14}{'new [ms]':>14}{'speedup':>10}")
+    print(
+        f"{'GTCppCodegen':<24}{1e3 * legacy_time:>14.1f}{1e3 * compiled_time:>14.1f}"
+        f"{legacy_time / compiled_time:>10.2f}"
+    )
+
+    python_source = "\n".join(
+        f"def function_{i}(a,b):\n  return (a+{i})*b" for i in range(20 * args.loops)
+    )
+    formatter = codegen.SOURCE_FORMATTERS["python"]
+    uncached_time = measure(lambda: formatter(python_source))
+    cached_time = measure(lambda: codegen.format_source("python", python_source))
+    print(
+        f"{'format_source(python)':<24}{1e3 * uncached_time:>14.1f}{1e3 * cached_time:>14.1f}"
+        f"{uncached_time / cached_time:>10.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
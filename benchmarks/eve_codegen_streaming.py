@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Peak memory and time of writing generated sources to files, with and without streaming.
+
+Usage: python benchmarks/eve_codegen_streaming.py [--loops 20] [--number 3]
+"""
+
+import argparse
+import functools
+import pathlib
+import tempfile
+import timeit
+import tracemalloc
+
+import oir_trees
+
+from eve import codegen
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(stencil)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "computation.hpp"
+
+        def write_string(format_source):
+            path.write_text(
+                gtcpp_codegen.GTCppCodegen.apply(
+                    gtcpp, gt_backend_t="cpu_ifirst", format_source=format_source
+                )
+            )
+
+        def write_streamed(format_source):
+            with codegen.SourceFileSink(path) as sink:
+                gtcpp_codegen.GTCppCodegen.apply_to(
+                    sink, gtcpp, gt_backend_t="cpu_ifirst", format_source=format_source
+                )
+
+        # formatted sources are piped through clang-format (if available) when streamed
+        print(f"{'case':<24}{'time [ms]':>12}{'peak [KiB]':>14}")
+        for format_source in (False, True):
+            for name, write in {"string": write_string, "streamed": write_streamed}.items():
+                name += " (formatted)" if format_source else ""
+                run = functools.partial(write, format_source)
+                time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+                tracemalloc.start()
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{name:<24}{1e3 * time:>12.1f}{peak / 1024:>14.0f}")
+        print(f"Generated source of {path.stat().st_size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
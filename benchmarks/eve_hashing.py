@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Cost of hashing and comparing eve trees, with pickling and with structural hashes.
+
+Usage: python benchmarks/eve_hashing.py [--loops 10] [--number 3]
+"""
+
+import argparse
+import pickle
+import timeit
+
+import oir_trees
+import xxhash
+
+import eve
+from eve.utils import shash
+
+
+def pickle_shash(*args):
+    return xxhash.xxh64(pickle.dumps(args)).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=10)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    other = eve.NodeTranslator().visit(stencil)
+    different = oir_trees.make_stencil(n_loops=args.loops, n_stmts=9)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR trees with {n_nodes} nodes and leaves")
+
+    cases = {
+        "shash": (lambda: pickle_shash(stencil), lambda: shash(stencil)),
+        "equal trees": (lambda: stencil == other, lambda: stencil.structurally_equal(other)),
+        "different trees": (
+            lambda: stencil == different,
+            lambda: stencil.structurally_equal(different),
+        ),
+    }
+
+    print(f"{'case':<18}{'pickle/== [ms]':>16}{'structural [ms]':>17}{'speedup':>10}")
+    for name, (legacy_run, run) in cases.items():
+        legacy_time = min(timeit.repeat(legacy_run, number=args.number, repeat=3)) / args.number
+        structural_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        print(
+            f"{name:<18}{1e3 * legacy_time:>16.1f}{1e3 * structural_time:>17.1f}"
+            f"{legacy_time / structural_time:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Cost of eve tree iterators on a large OIR tree, compared to recursive generators.
+
+Usage: python benchmarks/eve_iterators.py [--loops 20] [--number 3]
+"""
+
+import argparse
+import collections.abc
+import timeit
+
+import oir_trees
+
+import eve
+from gtc import oir
+
+
+def generic_iter_children(node):
+    """Children of tree values, re-scanning the fields of nodes."""
+    if isinstance(node, eve.Node):
+        return (
+            getattr(node, name)
+            for name in node.__fields__
+            if not (name.endswith("_") or name.endswith("__"))
+        )
+    elif isinstance(node, collections.abc.Sequence) and eve.utils.is_collection(node):
+        return iter(node)
+    elif isinstance(node, collections.abc.Set):
+        return iter(node)
+    elif isinstance(node, collections.abc.Mapping):
+        return node.values()
+    return iter(())
+
+
+def legacy_iter_tree_pre(node):
+    yield node
+    for child in generic_iter_children(node):
+        yield from legacy_iter_tree_pre(child)
+
+
+def legacy_iter_tree_post(node):
+    for child in generic_iter_children(node):
+        yield from legacy_iter_tree_post(child)
+    yield node
+
+
+def legacy_iter_tree_levels(node, queue=None):
+    queue = queue or []
+    yield node
+    queue.extend(generic_iter_children(node))
+    if queue:
+        yield from legacy_iter_tree_levels(queue.pop(0), queue)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    def count(iterator):
+        return sum(1 for _ in iterator)
+
+    cases = {
+        "pre-order": (
+            lambda: count(legacy_iter_tree_pre(stencil)),
+            lambda: count(eve.iterators.iter_tree_pre(stencil)),
+        ),
+        "post-order": (
+            lambda: count(legacy_iter_tree_post(stencil)),
+            lambda: count(eve.iterators.iter_tree_post(stencil)),
+        ),
+        "if_isinstance query": (
+            lambda: count(
+                eve.utils.xiter(legacy_iter_tree_pre(stencil)).if_isinstance(oir.FieldAccess)
+            ),
+            lambda: count(stencil.iter_tree().if_isinstance(oir.FieldAccess)),
+        ),
+    }
+    print(f"{'case':<22}{'recursive [ms]':>16}{'iterative [ms]':>16}{'speedup':>10}")
+    for name, (legacy_run, run) in cases.items():
+        assert legacy_run() == run()
+        legacy_time = min(timeit.repeat(legacy_run, number=args.number, repeat=3)) / args.number
+        iterative_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        print(
+            f"{name:<22}{1e3 * legacy_time:>16.1f}{1e3 * iterative_time:>16.1f}"
+            f"{legacy_time / iterative_time:>10.2f}"
+        )
+
+    # the recursive levels traversal needs one frame per node
+    try:
+        legacy_time = timeit.timeit(lambda: count(legacy_iter_tree_levels(stencil)), number=1)
+        legacy_levels = f"{1e3 * legacy_time:>16.1f}"
+    except RecursionError:
+        legacy_levels = f"{'RecursionError':>16}"
+    iterative_time = (
+        min(
+            timeit.repeat(
+                lambda: count(eve.iterators.iter_tree_levels(stencil)),
+                number=args.number,
+                repeat=3,
+            )
+        )
+        / args.number
+    )
+    print(f"{'levels':<22}{legacy_levels}{1e3 * iterative_time:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Cost of common subexpression elimination with parallel visiting of horizontal executions.
+
+Usage: python benchmarks/eve_parallel.py [--loops 20] [--workers 4] [--number 3]
+"""
+
+import argparse
+import functools
+import timeit
+
+import oir_trees
+
+import eve
+from eve import parallel
+from gtc.passes.oir_optimizations.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    def run():
+        CommonSubexpressionElimination().visit(stencil)
+
+    def run_with_new_workers(n_workers):
+        with parallel.workers(n_workers):
+            run()
+
+    print(f"{'workers':<24}{'time [ms]':>12}{'speedup':>10}")
+    serial_time = None
+    for n_workers in sorted({1, args.workers}):
+        # worker processes are started once and shared by all the runs in the context
+        with parallel.workers(n_workers):
+            time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        serial_time = serial_time or time
+        print(f"{n_workers:<24}{1e3 * time:>12.1f}{serial_time / time:>10.2f}")
+
+    if args.workers > 1:
+        time = (
+            min(
+                timeit.repeat(
+                    functools.partial(run_with_new_workers, args.workers),
+                    number=args.number,
+                    repeat=3,
+                )
+            )
+            / args.number
+        )
+        name = f"{args.workers} (new processes)"
+        print(f"{name:<24}{1e3 * time:>12.1f}{serial_time / time:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
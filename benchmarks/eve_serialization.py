@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Size and speed of eve serialization of OIR trees compared to plain pickle.
+
+Usage: python benchmarks/eve_serialization.py [--loops 20] [--number 3]
+"""
+
+import argparse
+import functools
+import pickle
+import timeit
+
+import oir_trees
+
+import eve
+from eve import serialization
+from gtc.passes.pass_manager import run_oir_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    def measure(run):
+        return min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+
+    cases = {
+        "pickle": (lambda: pickle.dumps(stencil, protocol=5), pickle.loads),
+        "eve.serialization": (lambda: serialization.dumps(stencil), serialization.loads),
+    }
+
+    print(f"{'case':<20}{'size [KiB]':>12}{'dump [ms]':>12}{'load [ms]':>12}")
+    for name, (dumps, loads) in cases.items():
+        data = dumps()
+        assert loads(data) == stencil
+        print(
+            f"{name:<20}{len(data) / 2 ** 10:>12.1f}{1e3 * measure(dumps):>12.1f}"
+            f"{1e3 * measure(functools.partial(loads, data)):>12.1f}"
+        )
+
+    pipeline_time = measure(lambda: run_oir_pipeline(stencil))
+    print(f"{'OIR pipeline':<20}{'':>12}{'':>12}{1e3 * pipeline_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Memory and construction time of OIR-like trees with pydantic nodes and slotted nodes.
+
+Usage: python benchmarks/eve_slotted_nodes.py [--executions 200] [--number 3]
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from typing import List, Union
+
+import eve
+from eve.datamodels import SlottedNode
+from gtc import common, oir
+
+
+class CartesianOffset(SlottedNode, frozen=True):
+    i: int
+    j: int
+    k: int
+
+
+class Expr(SlottedNode):
+    dtype: common.DataType
+
+
+class FieldAccess(Expr):
+    name: str
+    offset: CartesianOffset
+
+
+class Literal(Expr):
+    value: str
+
+
+class BinaryOp(Expr):
+    op: common.ArithmeticOperator
+    left: Expr
+    right: Expr
+
+
+class AssignStmt(SlottedNode):
+    left: FieldAccess
+    right: Expr
+
+
+class HorizontalExecution(SlottedNode):
+    body: List[AssignStmt]
+
+
+def make_tree(
+    n_executions: int, n_stmts: int, slotted: bool
+) -> List[Union[oir.HorizontalExecution, HorizontalExecution]]:
+    dtype = common.DataType.FLOAT64
+    if slotted:
+        offset_cls, access_cls, literal_cls = CartesianOffset, FieldAccess, Literal
+        binary_op_cls, assign_cls = BinaryOp, AssignStmt
+
+        def make_execution(body):
+            return HorizontalExecution(body=body)
+
+    else:
+        offset_cls, access_cls, literal_cls = common.CartesianOffset, oir.FieldAccess, oir.Literal
+        binary_op_cls, assign_cls = oir.BinaryOp, oir.AssignStmt
+
+        def make_execution(body):
+            return oir.HorizontalExecution(body=body, mask=None, declarations=[])
+
+    def access(name, i=0, j=0, k=0):
+        return access_cls(name=name, offset=offset_cls(i=i, j=j, k=k), dtype=dtype)
+
+    def update(index):
+        value = binary_op_cls(
+            op=common.ArithmeticOperator.ADD,
+            left=binary_op_cls(
+                op=common.ArithmeticOperator.MUL,
+                left=access("in_field", i=1),
+                right=literal_cls(value=str(index), dtype=dtype),
+                dtype=dtype,
+            ),
+            right=access("in_field", j=-1),
+            dtype=dtype,
+        )
+        return assign_cls(left=access("tmp"), right=value)
+
+    return [
+        make_execution([update(index) for index in range(n_stmts)]) for _ in range(n_executions)
+    ]
+
+
+def allocated_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()  # noqa: F841  # keep the tree alive until the measurement
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--executions", type=int, default=200)
+    parser.add_argument("--stmts", type=int, default=10)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    def build(slotted):
+        return lambda: make_tree(args.executions, args.stmts, slotted)
+
+    n_nodes = sum(
+        1 for node in eve.iter_tree(build(True)()) if isinstance(node, eve.concepts.AbstractNode)
+    )
+    print(f"Trees with {n_nodes} nodes")
+
+    tree = build(True)()
+    cases = {
+        "pydantic nodes": build(False),
+        "slotted nodes": build(True),
+        "NodeTranslator copy": lambda: eve.NodeTranslator().visit(tree),
+    }
+
+    print(f"{'case':<22}{'time [ms]':>12}{'memory [MiB]':>15}{'bytes/node':>12}")
+    for name, run in cases.items():
+        run_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        memory = allocated_bytes(run)
+        print(
+            f"{name:<22}{1e3 * run_time:>12.1f}{memory / 2 ** 20:>15.2f}"
+            f"{memory / n_nodes:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+"""Cost of keeping the symbol table of a large OIR stencil up to date.
+
+Usage: python benchmarks/eve_symbol_tables.py [--loops 20] [--number 10]
+"""
+
+import argparse
+import timeit
+
+import oir_trees
+
+import eve
+from eve.traits import _CollectSymbols
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    declarations = list(stencil.declarations)
+    assert "tmp" in stencil.symtable_
+
+    def full_collection():
+        stencil.declarations = list(declarations)
+        return _CollectSymbols.apply(stencil.__dict__)["tmp"]
+
+    def incremental_collection():
+        stencil.declarations = list(declarations)
+        return stencil.symtable_["tmp"]
+
+    def copied_collection():
+        # symbols cached in the shared child nodes are reused by the new symbol table
+        return stencil.copy(update={"declarations": list(declarations)}).symtable_["tmp"]
+
+    cases = {
+        "full collection": full_collection,
+        "incremental": incremental_collection,
+        "copied stencil": copied_collection,
+        "lookup only": lambda: stencil.symtable_["tmp"],
+    }
+
+    print(f"{'case':<20}{'time [ms]':>12}")
+    for name, run in cases.items():
+        run_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        print(f"{name:<20}{1e3 * run_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
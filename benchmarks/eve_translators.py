@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cost of copying trees with eve translators, with and without trusted construction.
+
+Usage: python benchmarks/eve_translators.py [--loops 10] [--number 3]
+"""
+
+import argparse
+import contextlib
+import timeit
+
+import oir_trees
+
+import eve
+from gtc.passes.pass_manager import run_oir_pipeline
+
+
+@contextlib.contextmanager
+def trusted_construction(enabled):
+    eve.NodeTranslator.trusted_construction = enabled
+    try:
+        yield
+    finally:
+        eve.NodeTranslator.trusted_construction = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=10)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    cases = {
+        "NodeTranslator copy": lambda: eve.NodeTranslator().visit(stencil),
+        "OIR pipeline": lambda: run_oir_pipeline(stencil),
+    }
+
+    print(f"{'case':<24}{'validated [ms]':>16}{'trusted [ms]':>14}{'speedup':>10}")
+    for name, run in cases.items():
+        with trusted_construction(False):
+            validated_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        trusted_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        print(
+            f"{name:<24}{1e3 * validated_time:>16.1f}{1e3 * trusted_time:>14.1f}"
+            f"{validated_time / trusted_time:>10.2f}"
+        )
+
+    validation_time = min(
+        timeit.repeat(lambda: eve.validate_tree(stencil), number=args.number, repeat=3)
+    )
+    print(f"{'validate_tree':<24}{1e3 * validation_time / args.number:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
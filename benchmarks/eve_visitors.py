@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cost of the visitor dispatch of eve visitors on a large OIR tree.
+
+Usage: python benchmarks/eve_visitors.py [--loops 20] [--number 3]
+"""
+
+import argparse
+import contextlib
+import timeit
+
+import oir_trees
+
+import eve
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+from gtc.passes.oir_extents import compute_horizontal_execution_extents
+
+
+def legacy_visit(self, node, **kwargs):
+    """Dispatch looking up the visitor method of every node by name."""
+    visitor = self.generic_visit
+
+    method_name = "visit_" + node.__class__.__name__
+    if hasattr(self, method_name):
+        visitor = getattr(self, method_name)
+    elif isinstance(node, eve.Node):
+        for node_class in node.__class__.__mro__[1:]:
+            method_name = "visit_" + node_class.__name__
+            if hasattr(self, method_name):
+                visitor = getattr(self, method_name)
+                break
+
+            if node_class is eve.Node:
+                break
+
+    return visitor(node, **kwargs)
+
+
+@contextlib.contextmanager
+def legacy_dispatch():
+    cached_visit = eve.NodeVisitor.visit
+    eve.NodeVisitor.visit = legacy_visit
+    try:
+        yield
+    finally:
+        eve.NodeVisitor.visit = cached_visit
+
+
+class AccessCounter(eve.NodeVisitor):
+    def visit_FieldAccess(self, node, *, counts, **kwargs):
+        counts[node.name] = counts.get(node.name, 0) + 1
+        self.generic_visit(node, counts=counts, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    stencil = oir_trees.make_stencil(n_loops=args.loops)
+    gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(stencil)
+    n_nodes = sum(1 for _ in eve.iterators.iter_tree(stencil))
+    print(f"OIR tree with {n_nodes} nodes and leaves")
+
+    cases = {
+        "NodeVisitor": lambda: AccessCounter().visit(stencil, counts={}),
+        "extents analysis": lambda: compute_horizontal_execution_extents(stencil),
+        "OIRToGTCpp": lambda: oir_to_gtcpp.OIRToGTCpp().visit(stencil),
+        "GTCppCodegen": lambda: gtcpp_codegen.GTCppCodegen().visit(
+            gtcpp, gt_backend_t="cpu_ifirst", offset_limit=gtcpp_codegen._offset_limit(gtcpp)
+        ),
+    }
+
+    print(f"{'case':<20}{'legacy [ms]':>14}{'cached [ms]':>14}{'speedup':>10}")
+    for name, run in cases.items():
+        with legacy_dispatch():
+            legacy_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        cached_time = min(timeit.repeat(run, number=args.number, repeat=3)) / args.number
+        print(
+            f"{name:<20}{1e3 * legacy_time:>14.1f}{1e3 * cached_time:>14.1f}"
+            f"{legacy_time / cached_time:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
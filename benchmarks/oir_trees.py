@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Large synthetic OIR trees for the IR benchmarks."""
+
+from gtc import common, oir
+
+
+def make_stencil(n_loops: int = 20, n_executions: int = 10, n_stmts: int = 10) -> oir.Stencil:
+    """Stencil with `n_loops` vertical loops of `n_executions` horizontal executions each.
+
+    Every horizontal execution contains `n_stmts` stencil updates of a temporary
+    from the sum of shifted accesses to an input field.
+    """
+    dtype = common.DataType.FLOAT64
+
+    def access(name, i=0, j=0, k=0):
+        return oir.FieldAccess(name=name, offset=common.CartesianOffset(i=i, j=j, k=k), dtype=dtype)
+
+    def update(index):
+        value = oir.BinaryOp(
+            op=common.ArithmeticOperator.ADD,
+            left=oir.BinaryOp(
+                op=common.ArithmeticOperator.MUL,
+                left=access("in_field", i=1),
+                right=oir.Literal(value=str(index), dtype=dtype),
+            ),
+            right=access("in_field", j=-1),
+        )
+        return oir.AssignStmt(left=access("tmp"), right=value)
+
+    def horizontal_execution():
+        return oir.HorizontalExecution(
+            body=[update(index) for index in range(n_stmts)], mask=None, declarations=[]
+        )
+
+    interval = oir.Interval(start=common.AxisBound.start(), end=common.AxisBound.end())
+    vertical_loops = [
+        oir.VerticalLoop(
+            loop_order=common.LoopOrder.PARALLEL,
+            sections=[
+                oir.VerticalLoopSection(
+                    interval=interval,
+                    horizontal_executions=[horizontal_execution() for _ in range(n_executions)],
+                )
+            ],
+            caches=[],
+        )
+        for _ in range(n_loops)
+    ]
+    return oir.Stencil(
+        name="large_stencil",
+        params=[oir.FieldDecl(name="in_field", dtype=dtype)],
+        vertical_loops=vertical_loops,
+        declarations=[oir.Temporary(name="tmp", dtype=dtype)],
+    )
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cost of creating views of storages compared to plain NumPy arrays.
+
+Usage: python benchmarks/storage_views.py [--backend gtmc] [--number 100000]
+"""
+
+import argparse
+import functools
+import timeit
+
+import numpy as np
+
+import gt4py.storage as gt_storage
+
+
+CASES = {
+    "slice": lambda field: field[1:-1, 1:-1, :],
+    "index": lambda field: field[:, :, 3],
+    "full view": lambda field: field[...],
+    "transpose": lambda field: field.transpose(2, 1, 0),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="gtmc")
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    storage = gt_storage.zeros(
+        backend=args.backend, default_origin=(3, 3, 0), shape=(64, 64, 80), dtype=np.float64
+    )
+    array = storage.view(np.ndarray)
+
+    print(f"{'case':<24}{'ndarray [us]':>14}{'Storage [us]':>14}{'ratio':>8}")
+    for name, view in CASES.items():
+        array_time = min(
+            timeit.repeat(functools.partial(view, array), number=args.number, repeat=3)
+        )
+        storage_time = min(
+            timeit.repeat(functools.partial(view, storage), number=args.number, repeat=3)
+        )
+        print(
+            f"{name:<24}{1e6 * array_time / args.number:>14.3f}"
+            f"{1e6 * storage_time / args.number:>14.3f}{storage_time / array_time:>8.1f}"
+        )
+
+    checked_time = min(
+        timeit.repeat(lambda: storage[...].is_stencil_view, number=args.number // 10, repeat=3)
+    )
+    print(f"{'full view + check':<24}{'':>14}{1e6 * checked_time / (args.number // 10):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
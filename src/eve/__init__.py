@@ -24,7 +24,8 @@ on some of the previous ones):
   - utils
   - concepts <-> iterators  (circular dependency only inside methods, it should be safe)
   - traits, visitors
-  - codegen
+  - codegen, serialization
+  - parallel
 
 """
 
@@ -63,7 +64,7 @@ from .type_definitions import (
     SymbolName,
     SymbolRef,
 )
-from .visitors import NodeMutator, NodeTranslator, NodeVisitor
+from .visitors import NodeMutator, NodeTranslator, NodeVisitor, validate_tree
 
 
 __all__ = [
@@ -99,4 +100,5 @@ __all__ = [
     "iter_tree",
     "in_field",
     "out_field",
+    "validate_tree",
 ]
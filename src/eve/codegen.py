@@ -20,24 +20,31 @@
 from __future__ import annotations
 
 import abc
+import codecs
 import collections.abc
 import contextlib
+import functools
+import hashlib
 import inspect
+import io
 import os
+import pathlib
 import re
 import string
 import sys
 import textwrap
+import threading
 import types
 import typing
 from subprocess import PIPE, Popen, run
 
 import black
 import jinja2
+from mako import runtime as mako_rt
 from mako import template as mako_tpl
 
 from . import exceptions, utils
-from .concepts import CollectionNode, LeafNode, Node, TreeNode
+from .concepts import AbstractNode, CollectionNode, LeafNode, Node, TreeNode
 from .typingx import (
     Any,
     Callable,
@@ -52,6 +59,7 @@ from .typingx import (
     Sequence,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
     cast,
@@ -64,6 +72,9 @@ SourceFormatter = Callable[[str], str]
 #: Global dict storing registered formatters.
 SOURCE_FORMATTERS: Dict[str, SourceFormatter] = {}
 
+#: Command line builders of registered formatters which can format sources piped to them.
+_PIPED_FORMATTER_COMMANDS: Dict[SourceFormatter, Callable[..., List[str]]] = {}
+
 
 class FormatterNameError(exceptions.EveRuntimeError):
     """Run-time error registering a new source code formatter."""
@@ -156,6 +167,21 @@ if _CLANG_FORMAT_EXECUTABLE is not None:
         sort_includes: bool = False,
     ) -> str:
         """Format C++ source code using clang-format."""
+        args = _clang_format_command(
+            style=style, fallback_style=fallback_style, sort_includes=sort_includes
+        )
+        p = Popen(args, stdout=PIPE, stdin=PIPE, encoding="utf8")
+        formatted_source, _ = p.communicate(input=source)
+        assert isinstance(formatted_source, str)
+
+        return formatted_source
+
+    def _clang_format_command(
+        *,
+        style: Optional[str] = None,
+        fallback_style: Optional[str] = None,
+        sort_includes: bool = False,
+    ) -> List[str]:
         assert isinstance(_CLANG_FORMAT_EXECUTABLE, str)
         args = [_CLANG_FORMAT_EXECUTABLE]
         if style:
@@ -165,19 +191,72 @@ if _CLANG_FORMAT_EXECUTABLE is not None:
         if sort_includes:
             args.append("--sort-includes")
 
-        p = Popen(args, stdout=PIPE, stdin=PIPE, encoding="utf8")
-        formatted_source, _ = p.communicate(input=source)
-        assert isinstance(formatted_source, str)
+        return args
+
+    _PIPED_FORMATTER_COMMANDS[format_cpp_source] = _clang_format_command
+
+
+class _FormattedSourcesCache:
+    """LRU cache of formatted sources bounded by the memory size of the cached sources.
+
+    Sources are stored by the SHA-256 digest of the language, formatter arguments
+    and source text, thus the (potentially large) unformatted sources are not kept.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._sources: collections.OrderedDict[bytes, str] = collections.OrderedDict()
+
+    @staticmethod
+    def key(language: str, source: str, kwargs: Mapping[str, Any]) -> bytes:
+        digest = hashlib.sha256(f"{language}\0{sorted(kwargs.items())!r}\0".encode())
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        result = self._sources.get(key, None)
+        if result is not None:
+            self._sources.move_to_end(key)
+        return result
+
+    def add(self, key: bytes, formatted_source: str) -> None:
+        size = sys.getsizeof(formatted_source)
+        if key in self._sources or size > self.max_size:
+            return
+        self._sources[key] = formatted_source
+        self.size += size
+        while self.size > self.max_size:
+            _, evicted = self._sources.popitem(last=False)
+            self.size -= sys.getsizeof(evicted)
+
+    def clear(self) -> None:
+        self._sources.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._sources)
 
-        return formatted_source
+
+#: Cache of formatted sources (up to 64 MiB)
+_formatted_sources = _FormattedSourcesCache(max_size=64 * 2 ** 20)
 
 
 def format_source(language: str, source: str, *, skip_errors: bool = True, **kwargs: Any) -> str:
-    """Format source code if a formatter exists for the specific language."""
+    """Format source code if a formatter exists for the specific language.
+
+    Formatted sources are cached by content, thus formatting an already formatted
+    source again (e.g. when regenerating the same code) does not run the formatter.
+    """
+    key = _formatted_sources.key(language, source, kwargs)
+    result = _formatted_sources.get(key)
+    if result is not None:
+        return result
+
     formatter = SOURCE_FORMATTERS.get(language, None)
     try:
         if formatter:
-            return formatter(source, **kwargs)  # type: ignore # Callable does not support **kwargs
+            result = formatter(source, **kwargs)  # type: ignore # Callable does not support **kwargs
         else:
             raise FormattingError(f"Missing formatter for '{language}' language")
     except Exception as e:
@@ -188,6 +267,86 @@ def format_source(language: str, source: str, *, skip_errors: bool = True, **kwa
                 f"Something went wrong when trying to format '{language}' source code"
             ) from e
 
+    assert isinstance(result, str)
+    _formatted_sources.add(key, result)
+    return result
+
+
+class _SlicedTextSink:
+    def __init__(self, sink: TextSink, slice_size: int = io.DEFAULT_BUFFER_SIZE) -> None:
+        self.sink = sink
+        self.slice_size = slice_size
+
+    def write(self, text: str) -> int:
+        for start in range(0, len(text), self.slice_size):
+            self.sink.write(text[start : start + self.slice_size])
+        return len(text)
+
+
+@contextlib.contextmanager
+def formatting_sink(language: str, sink: TextSink, **kwargs: Any) -> Iterator[TextSink]:
+    r"""Context manager providing a sink which formats the text written to `sink`.
+
+    If the formatter of the language runs as an external command (e.g. clang-format),
+    the text is piped to it while it is being generated and the formatted output is
+    copied to `sink`. Otherwise, the complete text is formatted at exit with
+    :func:`format_source`. Contrary to :func:`format_source`, formatting errors
+    of piped sources are always raised, since the original text is not kept.
+
+    Examples:
+        >>> output = io.StringIO()
+        >>> with formatting_sink("python", output) as sink:
+        ...     _ = sink.write("x  =  1")
+        >>> output.getvalue()
+        'x = 1\n'
+
+    """
+    formatter = SOURCE_FORMATTERS.get(language, None)
+    command = _PIPED_FORMATTER_COMMANDS.get(formatter, None) if formatter else None
+    if command is None:
+        buffer = io.StringIO()
+        yield buffer
+        sink.write(format_source(language, buffer.getvalue(), **kwargs))
+        return
+
+    process = Popen(command(**kwargs), stdout=PIPE, stdin=PIPE, encoding="utf8")
+    assert process.stdin is not None and process.stdout is not None
+    stdout = process.stdout
+    copy_errors: List[BaseException] = []
+
+    def _copy_output() -> None:
+        try:
+            for chunk in iter(functools.partial(stdout.read, io.DEFAULT_BUFFER_SIZE), ""):
+                sink.write(chunk)
+        except BaseException as e:
+            copy_errors.append(e)
+            stdout.close()
+
+    # the output is consumed concurrently, the formatter may write before reading everything
+    reader = threading.Thread(target=_copy_output, daemon=True)
+    reader.start()
+    stdin = process.stdin
+    try:
+        # large texts are written in slices to avoid an encoded copy of the whole text
+        yield _SlicedTextSink(stdin)
+        stdin.close()
+    except BrokenPipeError as e:
+        process.kill()
+        raise FormattingError(f"'{language}' formatter exited before reading the source") from e
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        with contextlib.suppress(OSError):
+            stdin.close()
+        reader.join()
+        process.wait()
+
+    if copy_errors:
+        raise FormattingError(f"Error writing formatted '{language}' source") from copy_errors[0]
+    if process.returncode != 0:
+        raise FormattingError(f"'{language}' formatter failed with exit code {process.returncode}")
+
 
 class Name:
     """Text formatter with different case styles for symbol names in source code."""
@@ -221,6 +380,105 @@ class Name:
 AnyTextSequence = Union[Sequence[str], "TextBlock"]
 
 
+@typing.runtime_checkable
+class TextSink(Protocol):
+    """Protocol of the targets of streamed code generation (e.g. :class:`io.StringIO`)."""
+
+    def write(self, text: str) -> int:
+        ...
+
+
+class SourceFileSink:
+    """Buffered text sink writing generated sources incrementally to a file.
+
+    Chunks are encoded and written to a temporary file next to the target path,
+    which only replaces the target when the sink is closed without errors. The
+    hash of the written contents is computed on the fly.
+
+    Args:
+        path: Target file path.
+        encoding: Text encoding of the file.
+        hash_algorithm: Name of the :mod:`hashlib` algorithm for the contents hash.
+        buffer_size: Size in bytes of the file buffer (at least 2, see :func:`open`).
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as tmp_dir:
+        ...     with SourceFileSink(os.path.join(tmp_dir, "source.cpp")) as sink:
+        ...         sink.write("int main() { return 0; }")
+        ...     print(open(os.path.join(tmp_dir, "source.cpp")).read())
+        24
+        int main() { return 0; }
+
+    """
+
+    path: pathlib.Path
+    encoding: str
+    size: int
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        encoding: str = "utf-8",
+        hash_algorithm: str = "sha256",
+        buffer_size: int = io.DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.encoding = encoding
+        self.size = 0
+        self._hash = hashlib.new(hash_algorithm)
+        self._encoder = codecs.getincrementalencoder(encoding)()
+        self._slice_size = buffer_size = max(buffer_size, 2)
+        self._tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self._file: Optional[io.BufferedWriter] = open(  # type: ignore  # open() returns BinaryIO
+            self._tmp_path, "wb", buffering=buffer_size
+        )
+
+    def write(self, text: str) -> int:
+        if self._file is None:
+            raise ValueError(f"Write to closed sink of '{self.path}'")
+        # large texts are encoded in slices to avoid an encoded copy of the whole text
+        for start in range(0, len(text), self._slice_size):
+            data = self._encoder.encode(text[start : start + self._slice_size])
+            self._hash.update(data)
+            self._file.write(data)
+            self.size += len(data)
+        return len(text)
+
+    def close(self) -> None:
+        """Flush the written contents and move them to the target path."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._tmp_path.replace(self.path)
+
+    def discard(self) -> None:
+        """Close the sink removing the written contents."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._tmp_path.unlink()
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    @property
+    def hexdigest(self) -> str:
+        """Hash of the contents written so far."""
+        return self._hash.hexdigest()
+
+    def __enter__(self) -> SourceFileSink:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
 class TextBlock:
     """A block of source code represented as a sequence of text lines.
 
@@ -383,6 +641,21 @@ class Template(Protocol):
 
         return self.render_values(**mapping)
 
+    def render_to(
+        self, sink: TextSink, mapping: Optional[Mapping[str, str]] = None, **kwargs: Any
+    ) -> None:
+        """Render the template writing the result to a text sink.
+
+        Same as :meth:`render`, but template engines supporting it write the
+        rendered text to `sink` incrementally instead of returning it.
+        """
+        if not mapping:
+            mapping = {}
+        if kwargs:
+            mapping = {**mapping, **kwargs}
+
+        self.render_values_to(sink, **mapping)
+
     @abc.abstractmethod
     def __init__(self, definition: Any, **kwargs: Any) -> None:
         pass
@@ -403,6 +676,10 @@ class Template(Protocol):
         """
         pass
 
+    def render_values_to(self, sink: TextSink, **kwargs: Any) -> None:
+        """Render the template writing the result to a text sink (see :meth:`render_values`)."""
+        sink.write(self.render_values(**kwargs))
+
 
 class BaseTemplate(Template):
     """Helper class to add source location info of template definitions."""
@@ -433,14 +710,22 @@ class FormatTemplate(BaseTemplate):
     """Template adapter to render regular strings as fully-featured f-strings."""
 
     definition: str
+    definition_code: types.CodeType
 
     def __init__(self, definition: str, **kwargs: Any) -> None:
         super().__init__()
         self.definition = f'(f"""{definition}""")'
+        try:
+            self.definition_code = compile(self.definition, "<FormatTemplate>", "eval")
+        except SyntaxError as e:
+            message = "Error in FormatTemplate"
+            if self.definition_loc:
+                message += f" created at {self.definition_loc[0]}:{self.definition_loc[1]}"
+            raise TemplateDefinitionError(message, definition=definition) from e
 
     def render_values(self, **kwargs: Any) -> str:
         try:
-            result = eval(self.definition, {}, kwargs or {})
+            result = eval(self.definition_code, {}, kwargs or {})
             assert isinstance(result, str)
             return result
         except Exception as e:
@@ -510,15 +795,25 @@ class JinjaTemplate(BaseTemplate):
         try:
             return self.definition.render(**kwargs)
         except Exception as e:
-            message = f"<{type(self).__name__}>"
-            if self.definition_loc:
-                message += f" (created at {self.definition_loc[0]}:{self.definition_loc[1]})"
-            try:
-                message += f" rendering error at template line: {e.lineno}."  # type: ignore  # assume Jinja exception
-            except Exception:
-                message += " rendering error."
+            raise self._rendering_error(e) from e
 
-            raise TemplateRenderingError(message, template=self) from e
+    def render_values_to(self, sink: TextSink, **kwargs: Any) -> None:
+        try:
+            for chunk in self.definition.generate(**kwargs):
+                sink.write(chunk)
+        except Exception as e:
+            raise self._rendering_error(e) from e
+
+    def _rendering_error(self, e: Exception) -> TemplateRenderingError:
+        message = f"<{type(self).__name__}>"
+        if self.definition_loc:
+            message += f" (created at {self.definition_loc[0]}:{self.definition_loc[1]})"
+        try:
+            message += f" rendering error at template line: {e.lineno}."  # type: ignore  # assume Jinja exception
+        except Exception:
+            message += " rendering error."
+
+        return TemplateRenderingError(message, template=self)
 
 
 class MakoTemplate(BaseTemplate):
@@ -550,15 +845,40 @@ class MakoTemplate(BaseTemplate):
             assert isinstance(result, str)
             return result
         except Exception as e:
-            message = f"<{type(self).__name__}>"
-            if self.definition_loc:
-                message += f" (created at {self.definition_loc[0]}:{self.definition_loc[1]})"
-            try:
-                message += f" rendering error at template line: {e.lineno}, column: {getattr(e, 'pos', '?')}"  # type: ignore  # assume Mako exception
-            except Exception:
-                message += " rendering error."
+            raise self._rendering_error(e) from e
 
-            raise TemplateRenderingError(message, template=self) from e
+    def render_values_to(self, sink: TextSink, **kwargs: Any) -> None:
+        try:
+            self.definition.render_context(mako_rt.Context(sink, **kwargs))
+        except Exception as e:
+            raise self._rendering_error(e) from e
+
+    def _rendering_error(self, e: Exception) -> TemplateRenderingError:
+        message = f"<{type(self).__name__}>"
+        if self.definition_loc:
+            message += f" (created at {self.definition_loc[0]}:{self.definition_loc[1]})"
+        try:
+            message += f" rendering error at template line: {e.lineno}, column: {getattr(e, 'pos', '?')}"  # type: ignore  # assume Mako exception
+        except Exception:
+            message += " rendering error."
+
+        return TemplateRenderingError(message, template=self)
+
+
+#: Placeholder of the streamed root node template output in TemplatedGenerator.apply_to()
+_STREAMED_TEXT_MARK = "\0<eve.codegen streamed text>\0"
+
+
+def _node_rendering_error(
+    e: TemplateRenderingError, key: Optional[str], node: AbstractNode
+) -> TemplateRenderingError:
+    # New exception with extra information (the original cause should be kept by the caller)
+    return TemplateRenderingError(
+        f"Error in '{key}' template when rendering node '{node}'.\n"
+        + getattr(e, "message", str(e)),
+        **e.info,
+        node=node,
+    )
 
 
 class TemplatedGenerator(NodeVisitor):
@@ -608,9 +928,17 @@ class TemplatedGenerator(NodeVisitor):
     :meth:`generic_visit()` at the end with additional keyword arguments which will
     be forwarded to the node template.
 
+    Generated code can also be streamed to a :class:`TextSink` with :meth:`apply_to()`,
+    in which case the template of the root node writes its output directly to the sink
+    instead of building the complete source string in memory.
+
     """
 
     __templates__: ClassVar[Mapping[str, Template]]
+    _template_table_: ClassVar[Dict[Type[AbstractNode], Tuple[Optional[Template], Optional[str]]]]
+
+    _streamed_node: Optional[Node] = None
+    _streamed_rendering: Optional[Callable[[TextSink], None]] = None
 
     @classmethod
     def __init_subclass__(cls, *, inherit_templates: bool = True, **kwargs: Any) -> None:
@@ -636,6 +964,7 @@ class TemplatedGenerator(NodeVisitor):
         )
 
         cls.__templates__ = types.MappingProxyType(templates)
+        cls._template_table_ = {}
 
     @typing.overload
     @classmethod
@@ -663,6 +992,42 @@ class TemplatedGenerator(NodeVisitor):
         """
         return cast(Union[str, Collection[str]], cls().visit(root, **kwargs))
 
+    @classmethod
+    def apply_to(cls, sink: TextSink, root: Node, **kwargs: Any) -> None:
+        """Public method to build a class instance and visit an IR node writing to a sink.
+
+        The output is the same as the one returned by :meth:`apply()`, but the template
+        of the root node is rendered directly into `sink`. Visitor methods of the root
+        node class can only add text around the template output (which is rendered
+        once per occurrence in the visitor result), other transformations of it
+        raise a :class:`TemplateRenderingError`.
+
+        Args:
+            sink: A text sink (e.g. a :class:`SourceFileSink` instance).
+            root: An IR node.
+            ``**kwargs`` (optional): custom extra parameters forwarded to `visit_NODE_TYPE_NAME()`.
+
+        """
+        generator = cls()
+        generator._streamed_node = root
+        result = generator.visit(root, **kwargs)
+        assert isinstance(result, str)
+        if generator._streamed_rendering is None:
+            sink.write(result)
+            return
+
+        head, *pieces = result.split(_STREAMED_TEXT_MARK)
+        if not pieces:
+            raise TemplateRenderingError(
+                f"Output of the root node '{type(root).__name__}' template cannot be streamed"
+                " since it has been transformed by its visitor method (use 'apply()' instead)",
+                node=root,
+            )
+        sink.write(head)
+        for piece in pieces:
+            generator._streamed_rendering(sink)
+            sink.write(piece)
+
     @classmethod
     def generic_dump(cls, node: TreeNode, **kwargs: Any) -> str:
         """Class-specific ``dump()`` function for primitive types.
@@ -673,9 +1038,23 @@ class TemplatedGenerator(NodeVisitor):
 
     def generic_visit(self, node: TreeNode, **kwargs: Any) -> Union[str, Collection[str]]:
         result: Union[str, Collection[str]] = ""
-        if isinstance(node, Node):
+        if isinstance(node, AbstractNode):
             template, key = self.get_template(node)
             if template:
+                if node is self._streamed_node:
+                    # rendering is deferred to apply_to() to write directly to the sink
+                    self._streamed_node = None
+                    self._streamed_rendering = functools.partial(
+                        self._render_node_template_to,
+                        template=template,
+                        key=key,
+                        node=node,
+                        transformed_children=self.transform_children(node, **kwargs),
+                        transformed_impl_fields=self.transform_impl_fields(node, **kwargs),
+                        **kwargs,
+                    )
+                    return _STREAMED_TEXT_MARK
+
                 try:
                     result = self.render_template(
                         template,
@@ -685,13 +1064,7 @@ class TemplatedGenerator(NodeVisitor):
                         **kwargs,
                     )
                 except TemplateRenderingError as e:
-                    # Raise a new exception with extra information keeping the original cause
-                    raise TemplateRenderingError(
-                        f"Error in '{key}' template when rendering node '{node}'.\n"
-                        + getattr(e, "message", str(e)),
-                        **e.info,
-                        node=node,
-                    ) from e.__cause__
+                    raise _node_rendering_error(e, key, node) from e.__cause__
 
         elif isinstance(
             node, (collections.abc.Sequence, collections.abc.Set)
@@ -708,19 +1081,27 @@ class TemplatedGenerator(NodeVisitor):
         """Get a template for a node instance (see class documentation)."""
         template: Optional[Template] = None
         template_key = None
-        if isinstance(node, Node):
+        if isinstance(node, AbstractNode):
+            try:
+                return self._template_table_[node.__class__]
+            except KeyError:
+                pass
             for node_class in node.__class__.__mro__:
                 template_key = node_class.__name__
                 template = self.__templates__.get(template_key, None)
                 if template is not None or node_class is Node:
                     break
+            self._template_table_[node.__class__] = (
+                template,
+                None if template is None else template_key,
+            )
 
         return template, None if template is None else template_key
 
     def render_template(
         self,
         template: Template,
-        node: Node,
+        node: AbstractNode,
         transformed_children: Mapping[str, Any],
         transformed_impl_fields: Mapping[str, Any],
         **kwargs: Any,
@@ -737,8 +1118,48 @@ class TemplatedGenerator(NodeVisitor):
             **kwargs,
         )
 
-    def transform_children(self, node: Node, **kwargs: Any) -> Dict[str, Any]:
+    def render_template_to(
+        self,
+        sink: TextSink,
+        template: Template,
+        node: AbstractNode,
+        transformed_children: Mapping[str, Any],
+        transformed_impl_fields: Mapping[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        """Render a template using node instance data writing the result to a sink."""
+        template.render_to(
+            sink,
+            **transformed_children,
+            **transformed_impl_fields,
+            _children=transformed_children,
+            _impl=transformed_impl_fields,
+            _this_node=node,
+            _this_generator=self,
+            _this_module=sys.modules[type(self).__module__],
+            **kwargs,
+        )
+
+    def _render_node_template_to(
+        self,
+        sink: TextSink,
+        *,
+        template: Template,
+        key: Optional[str],
+        node: AbstractNode,
+        transformed_children: Mapping[str, Any],
+        transformed_impl_fields: Mapping[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        try:
+            self.render_template_to(
+                sink, template, node, transformed_children, transformed_impl_fields, **kwargs
+            )
+        except TemplateRenderingError as e:
+            raise _node_rendering_error(e, key, node) from e.__cause__
+
+    def transform_children(self, node: AbstractNode, **kwargs: Any) -> Dict[str, Any]:
         return {key: self.visit(value, **kwargs) for key, value in node.iter_children()}
 
-    def transform_impl_fields(self, node: Node, **kwargs: Any) -> Dict[str, Any]:
+    def transform_impl_fields(self, node: AbstractNode, **kwargs: Any) -> Dict[str, Any]:
         return {key: self.visit(value, **kwargs) for key, value in node.iter_impl_fields()}
@@ -19,19 +19,26 @@
 
 from __future__ import annotations
 
+import abc
+import enum
 import functools
+import pickle
+import struct
+import typing
 
 import pydantic
 import pydantic.generics
+import xxhash
 
 from . import iterators, utils
-from .type_definitions import NOTHING, IntEnum, Str, StrEnum
+from .type_definitions import NOTHING, IntEnum, SourceLocation, Str, StrEnum
 from .typingx import (
     Any,
     AnyNoArgCallable,
     ClassVar,
     Dict,
     Generator,
+    Iterable,
     List,
     Optional,
     Set,
@@ -118,12 +125,172 @@ _EVE_NODE_INTERNAL_SUFFIX = "__"
 _EVE_NODE_IMPL_SUFFIX = "_"
 
 AnyNode = TypeVar("AnyNode", bound="BaseNode")
+AnyAbstractNode = TypeVar("AnyAbstractNode", bound="AbstractNode")
 ValueNode = Union[bool, bytes, int, float, str, IntEnum, StrEnum]
 LeafNode = Union[AnyNode, ValueNode]
 CollectionNode = Union[List[LeafNode], Dict[Any, LeafNode], Set[LeafNode]]
 TreeNode = Union[AnyNode, CollectionNode]
 
 
+_HASHED_VALUE_TYPES = (type(None), bool, int, float, str, bytes, enum.Enum)
+
+
+def _combine_hashes(tag: str, hashes: Iterable[int]) -> int:
+    hashes = list(hashes)
+    data = tag.encode() + struct.pack(f"<{len(hashes)}Q", *hashes)
+    return xxhash.xxh64(data).intdigest()
+
+
+#: Cache of the hashes of leaf values by (type, value)
+_value_hashes: Dict[Tuple[Type, Any], int] = {}
+_MAX_CACHED_VALUE_HASHES = 2 ** 16
+
+#: Cache of the node types: ``None`` for other types, otherwise whether the nodes are frozen
+_node_types: Dict[Type, Optional[bool]] = {}
+
+
+def _node_type_frozen(value_type: Type) -> Optional[bool]:
+    try:
+        return _node_types[value_type]
+    except KeyError:
+        pass
+
+    frozen: Optional[bool] = None
+    if issubclass(value_type, BaseNode):
+        frozen = not value_type.__config__.allow_mutation
+    elif issubclass(value_type, AbstractNode):
+        frozen = value_type.__node_frozen__  # type: ignore[attr-defined]  # SlottedNode
+    _node_types[value_type] = frozen
+    return frozen
+
+
+#: Cache of the names of the children included in the structural hash of node types
+_hashed_children: Dict[Type, Tuple[str, ...]] = {}
+
+
+def _is_source_location_type(type_hint: Any) -> bool:
+    if isinstance(type_hint, type):
+        return issubclass(type_hint, SourceLocation)
+    return any(_is_source_location_type(arg) for arg in typing.get_args(type_hint))
+
+
+def _node_hashed_children(node_type: Type) -> Tuple[str, ...]:
+    """Names of the children of a node type excluding source locations (like `loc`)."""
+    try:
+        return _hashed_children[node_type]
+    except KeyError:
+        pass
+
+    names = []
+    for name, metadata in node_type.__node_children__.items():
+        definition = metadata["definition"]
+        # pydantic fields (with Optional unwrapped) or datamodels attributes
+        type_hint = getattr(definition, "type_", None) or getattr(definition, "type", None)
+        if not _is_source_location_type(type_hint):
+            names.append(name)
+    _hashed_children[node_type] = result = tuple(names)
+    return result
+
+
+def _value_hash(value: Any) -> int:
+    value_type = type(value)
+    try:
+        return _value_hashes[value_type, value]
+    except KeyError:
+        hashable = True
+    except TypeError:
+        hashable = False
+
+    if isinstance(value, _HASHED_VALUE_TYPES):
+        if isinstance(value, float) and value_type is float:
+            # adding a positive zero turns a negative zero (equal to it) into a positive zero
+            value = value + 0.0
+        data = f"{value_type.__qualname__}:{value!r}"
+        result = xxhash.xxh64(data.encode()).intdigest()
+    else:
+        result = xxhash.xxh64(value_type.__qualname__.encode() + pickle.dumps(value)).intdigest()
+    if hashable:
+        if len(_value_hashes) >= _MAX_CACHED_VALUE_HASHES:
+            _value_hashes.clear()
+        _value_hashes[value_type, value] = result
+    return result
+
+
+def _structural_hash(value: Any, memo: Dict[int, int]) -> Tuple[int, bool]:
+    """Compute the structural hash of a tree value and whether it can change by node mutations.
+
+    Hashes of immutable subtrees are cached in the nodes, while hashes of mutable
+    nodes are only kept in `memo` (by node id) for the duration of a single call.
+    """
+    value_type = type(value)
+    frozen = _node_type_frozen(value_type)
+    if frozen is not None:
+        cached = getattr(value, "_shash_", None)
+        if cached is not None:
+            return cached, True
+        if not frozen and id(value) in memo:
+            return memo[id(value)], False
+
+        child_hashes = []
+        for name in _node_hashed_children(value_type):
+            child_hash, child_frozen = _structural_hash(getattr(value, name), memo)
+            child_hashes.append(child_hash)
+            frozen = frozen and child_frozen
+        result = _combine_hashes(f"{value_type.__module__}.{value_type.__qualname__}", child_hashes)
+        if frozen:
+            object.__setattr__(value, "_shash_", result)
+        else:
+            memo[id(value)] = result
+        return result, frozen
+
+    if isinstance(value, (list, tuple)):
+        hashed_items = [_structural_hash(item, memo) for item in value]
+        item_hashes: Iterable[int] = (item_hash for item_hash, _ in hashed_items)
+    elif isinstance(value, dict):
+        hashed_items = []
+        for key, item in value.items():
+            item_hash, frozen = _structural_hash(item, memo)
+            key_hash = _structural_hash(key, memo)[0]
+            hashed_items.append((_combine_hashes("", (key_hash, item_hash)), frozen))
+        item_hashes = sorted(item_hash for item_hash, _ in hashed_items)
+    elif isinstance(value, (set, frozenset)):
+        hashed_items = [_structural_hash(item, memo) for item in value]
+        item_hashes = sorted(item_hash for item_hash, _ in hashed_items)
+    elif isinstance(value, pydantic.BaseModel):
+        # not pickled, since the pickled state also contains the unordered set of fields set
+        hashed_items = [_structural_hash(getattr(value, name), memo) for name in value.__fields__]
+        item_hashes = (item_hash for item_hash, _ in hashed_items)
+    else:
+        return _value_hash(value), True
+
+    return (
+        _combine_hashes(value_type.__qualname__, item_hashes),
+        all(frozen for _, frozen in hashed_items),
+    )
+
+
+def _structurally_equal(first: Any, second: Any, memo: Dict[int, int]) -> bool:
+    if first is second:
+        return True
+    value_type = type(first)
+    if value_type is not type(second):
+        return False
+    if _node_type_frozen(value_type) is not None:
+        return _structural_hash(first, memo)[0] == _structural_hash(second, memo)[0] and all(
+            _structurally_equal(getattr(first, name), getattr(second, name), memo)
+            for name in _node_hashed_children(value_type)
+        )
+    if isinstance(first, (list, tuple)):
+        return len(first) == len(second) and all(
+            _structurally_equal(a, b, memo) for a, b in zip(first, second)
+        )
+    if isinstance(first, dict):
+        return first.keys() == second.keys() and all(
+            _structurally_equal(value, second[key], memo) for key, value in first.items()
+        )
+    return first == second
+
+
 class NodeMetaclass(pydantic.main.ModelMetaclass):
     """Custom metaclass for Node classes.
 
@@ -183,6 +350,10 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
 
     """
 
+    # Cached structural hash of immutable subtrees and symbols defined in the node
+    # (see eve.traits.SymbolTable), not copied or pickled with the node
+    __slots__ = ("_shash_", "_symbols_")
+
     __node_impl_fields__: ClassVar[NodeImplFieldMetadataDict]
     __node_children__: ClassVar[NodeChildrenMetadataDict]
 
@@ -198,6 +369,54 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
             raise TypeError(f"id_ is not an 'str' instance ({type(v)})")
         return v
 
+    @classmethod
+    def construct_trusted(cls: Type[AnyNode], **values: Any) -> AnyNode:
+        """Create a node from field values which are known to be valid, without validation.
+
+        Values are neither converted nor checked, and validators do not run, except for
+        the creation of the unique `id_` and the collection of the symbol table of nodes
+        with :class:`eve.traits.SymbolTableTrait`. Values of derived fields have to be
+        passed explicitly and trees built this way can be checked with :func:`eve.validate_tree`.
+        """
+        if values.get("id_") is None:
+            values["id_"] = utils.UIDGenerator.sequential_id(prefix=cls.__qualname__)
+        node = cls.construct(**values)
+        if hasattr(cls, "collect_symbols"):
+            node.collect_symbols()  # type: ignore  # see SymbolTableTrait
+        return node
+
+    def structural_hash(self) -> int:
+        """Stable hash of the node class and the children values.
+
+        Implementation fields (like ``id_``) and source locations (like ``loc``) are
+        excluded. The hash is computed bottom-up and cached only in the nodes of
+        immutable subtrees (only :class:`FrozenNode` instances), so hashes of mutable
+        nodes are computed again in every call.
+        """
+        return _structural_hash(self, {})[0]
+
+    def structurally_equal(self, other: Any) -> bool:
+        """Check if `other` is a node of the same class with structurally equal children.
+
+        Unlike ``==``, implementation fields (like ``id_``) and source locations (like
+        ``loc``) are ignored and comparisons of subtrees with different structural hashes
+        return early.
+        """
+        return _structurally_equal(self, other, {})
+
+    def copy(self: AnyNode, **kwargs: Any) -> AnyNode:
+        result = super().copy(**kwargs)
+        symbols = getattr(self, "_symbols_", None)
+        if symbols is not None and not kwargs:
+            # shallow copies (e.g. made by pydantic validation) share the same children,
+            # thus only the symbols defined by the node itself change (see eve.traits)
+            if any(node is self for node in symbols.values()):
+                symbols = {name: result if node is self else node for name, node in symbols.items()}
+            object.__setattr__(result, "_symbols_", symbols)
+        if hasattr(result, "collect_symbols"):
+            result.collect_symbols()  # type: ignore  # see SymbolTableTrait
+        return result
+
     def iter_impl_fields(self) -> Generator[Tuple[str, Any], None, None]:
         for name, _ in self.__fields__.items():
             if name.endswith(_EVE_NODE_IMPL_SUFFIX) and not name.endswith(
@@ -206,15 +425,12 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
                 yield name, getattr(self, name)
 
     def iter_children(self) -> Generator[Tuple[str, Any], None, None]:
-        for name, _ in self.__fields__.items():
-            if not (
-                name.endswith(_EVE_NODE_IMPL_SUFFIX) or name.endswith(_EVE_NODE_INTERNAL_SUFFIX)
-            ):
-                yield name, getattr(self, name)
+        for name in self.__node_children__:
+            yield name, getattr(self, name)
 
     def iter_children_values(self) -> Generator[Any, None, None]:
-        for _, node in self.iter_children():
-            yield node
+        for name in self.__node_children__:
+            yield getattr(self, name)
 
     def iter_tree_pre(self) -> utils.XIterator:
         return iterators.iter_tree_pre(self)
@@ -241,6 +457,33 @@ class Node(BaseNode):
     pass
 
 
+class AbstractNode(abc.ABC):
+    """Abstract base class of the nodes handled by visitors, iterators and code generators.
+
+    Both :class:`Node` and :class:`eve.datamodels.SlottedNode` classes are registered
+    as virtual subclasses.
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def construct_trusted(cls: Type[AnyAbstractNode], **values: Any) -> AnyAbstractNode:
+        """Create a node from field values which are known to be valid, without validation."""
+        pass
+
+    @abc.abstractmethod
+    def iter_impl_fields(self) -> Generator[Tuple[str, Any], None, None]:
+        """Iterate over the names and values of the implementation fields."""
+        pass
+
+    @abc.abstractmethod
+    def iter_children(self) -> Generator[Tuple[str, Any], None, None]:
+        """Iterate over the names and values of the children."""
+        pass
+
+
+AbstractNode.register(Node)
+
+
 class FrozenNode(Node):
     """Default public name for an inmutable base node class."""
 
@@ -84,7 +84,7 @@ from typing import (
 
 import attr
 
-from eve import typingx, utils
+from eve import concepts, iterators, typingx, utils
 from eve.concepts import NOTHING
 from eve.typingx import NonDataDescriptor
 
@@ -632,6 +632,7 @@ def _make_datamodel(
     unsafe_hash: bool,
     frozen: bool,
     instantiable: bool,
+    slots: bool = False,
 ) -> Type:
     """Actual implementation of the Data Model creation.
 
@@ -714,7 +715,7 @@ def _make_datamodel(
 
     cls.__class_getitem__ = _make_data_model_class_getitem()
 
-    attr_settings = {"auto_attribs": True, "slots": False, "kw_only": True}
+    attr_settings = {"auto_attribs": True, "slots": slots, "kw_only": True}
     hash_arg = None if not unsafe_hash else True
     new_cls = attr.define(  # type: ignore[attr-defined]  # attr.define is not visible for mypy
         **attr_settings,
@@ -725,7 +726,9 @@ def _make_datamodel(
         frozen=frozen,
         hash=hash_arg,
     )(cls)
-    assert new_cls is cls
+    # Slotted classes have to be created again
+    assert new_cls is cls or slots
+    cls = new_cls
 
     # Final postprocessing
     cls.__pretty__ = _make_devtools_pretty()
@@ -740,6 +743,7 @@ def _make_datamodel(
             unsafe_hash=unsafe_hash,
             frozen=frozen,
             instantiable=instantiable,
+            slots=slots,
         ),
     )
     setattr(
@@ -825,7 +829,15 @@ def _make_concrete_with_cache(
             concrete_cls,
             **{
                 name: getattr(params, name)
-                for name in ("repr", "eq", "order", "unsafe_hash", "frozen", "instantiable")
+                for name in (
+                    "repr",
+                    "eq",
+                    "order",
+                    "unsafe_hash",
+                    "frozen",
+                    "instantiable",
+                    "slots",
+                )
             },
         )
 
@@ -1201,6 +1213,7 @@ def datamodel(
     unsafe_hash: bool = False,
     frozen: bool = False,
     instantiable: bool = True,
+    slots: bool = False,
 ) -> Union[Type, Callable[[Type], Type]]:
     """Add generated special methods to classes according to the specified attributes (class decorator).
 
@@ -1229,6 +1242,9 @@ def datamodel(
             ``__delattr__()`` methods should not be defined in the class.
         instantiable: If ``False`` the class will contain an invalid ``__init__()``
             method that raises an exception.
+        slots: If ``True``, a new class using ``__slots__`` instead of a per-instance
+            ``__dict__`` is returned, which reduces the memory footprint of the
+            instances and speeds up the access to the fields.
 
     Note:
         Currently implemented using :func:`attr.s` from `attrs <https://www.attrs.org/>`_
@@ -1243,6 +1259,7 @@ def datamodel(
             unsafe_hash=unsafe_hash,
             frozen=frozen,
             instantiable=instantiable,
+            slots=slots,
         )
 
     # This works for both @datamodel or @datamodel() decorations
@@ -1255,7 +1272,9 @@ class DataModel(DataModelTp):
     Inheriting from this class is equivalent to apply the :func:`datamodel`
     decorator to a class, except that all descendants will be also converted
     automatically in Data Models (which does not happen when explicitly
-    applying the decorator).
+    applying the decorator). Slotted Data Models can only be created with
+    the decorator (or :class:`SlottedNode`), since the class has to be
+    created again.
 
     See :func:`datamodel` for the description of the parameters.
     """
@@ -1285,6 +1304,132 @@ class DataModel(DataModelTp):
         )
 
 
+# -- Nodes --
+class _SlottedNodeMetaclass(type):
+    """Metaclass turning the subclasses of :class:`SlottedNode` into slotted Data Models."""
+
+    def __new__(
+        mcls: Type[_SlottedNodeMetaclass],
+        name: str,
+        bases: Tuple[Type, ...],
+        namespace: Dict[str, Any],
+        *,
+        frozen: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> _SlottedNodeMetaclass:
+        # other class keywords are forwarded to __init_subclass__ (missing in the type stubs)
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)  # type: ignore[call-overload]
+        if "__attrs_attrs__" in namespace or not any(isinstance(base, mcls) for base in bases):
+            # Copy of the class created by attrs with the slots, or root class
+            return cls
+
+        if frozen is None:
+            frozen = any(getattr(base, "__node_frozen__", False) for base in bases)
+        cls = _make_datamodel(
+            cls,
+            repr=True,
+            eq=True,
+            order=False,
+            unsafe_hash=False,
+            frozen=frozen,
+            instantiable=True,
+            slots=True,
+        )
+        cls.__node_frozen__ = frozen
+        cls.__node_impl_fields__ = {}
+        cls.__node_children__ = {}
+        for field_attr in cls.__attrs_attrs__:
+            if field_attr.name.endswith(concepts._EVE_NODE_IMPL_SUFFIX):
+                if not field_attr.name.endswith(concepts._EVE_NODE_INTERNAL_SUFFIX):
+                    cls.__node_impl_fields__[field_attr.name] = {"definition": field_attr}
+            else:
+                cls.__node_children__[field_attr.name] = {"definition": field_attr}
+
+        return cls
+
+    def __init__(cls, name: str, bases: Tuple[Type, ...], namespace: Dict[str, Any], **kwargs: Any):
+        super().__init__(name, bases, namespace)
+
+
+class SlottedNode(metaclass=_SlottedNodeMetaclass):
+    """Base class of compact IR nodes implemented as slotted Data Models.
+
+    Subclasses are slotted Data Models (see :func:`datamodel`) with the children
+    and implementation fields of :class:`eve.Node` (field names ending with "_"
+    are implementation fields), but without the per-instance ``__dict__`` and
+    ``id_`` of pydantic nodes. Values are checked with the strict type validators
+    of Data Models and never converted. Frozen nodes are defined with the
+    ``frozen=True`` class keyword, which is inherited by the subclasses.
+
+    Slotted nodes are registered as virtual subclasses of
+    :class:`eve.concepts.AbstractNode`, so visitors, translators, iterators and
+    code generators handle them like regular nodes.
+    """
+
+    __slots__ = ("_shash_",)
+
+    __node_frozen__: ClassVar[bool] = False
+    __node_impl_fields__: ClassVar[Dict[str, Dict[str, Attribute]]] = {}
+    __node_children__: ClassVar[Dict[str, Dict[str, Attribute]]] = {}
+
+    @classmethod
+    def construct_trusted(cls: Type[SlottedNodeT], **values: Any) -> SlottedNodeT:
+        """Create a node from field values which are known to be valid, without validation."""
+        node = object.__new__(cls)
+        for field_attr in cls.__attrs_attrs__:  # type: ignore[attr-defined]  # added by attrs
+            if field_attr.name in values:
+                value = values[field_attr.name]
+            elif isinstance(field_attr.default, attr.Factory):  # type: ignore[arg-type]  # attr.Factory is a class
+                factory = field_attr.default.factory
+                value = factory(node) if field_attr.default.takes_self else factory()
+            elif field_attr.default is not attr.NOTHING:
+                value = field_attr.default
+            else:
+                raise TypeError(f"Missing value for '{field_attr.name}' field.")
+            object.__setattr__(node, field_attr.name, value)
+        return node
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        for field_attr in self.__attrs_attrs__:  # type: ignore[attr-defined]  # added by attrs
+            yield field_attr.name, getattr(self, field_attr.name)
+
+    def iter_impl_fields(self) -> Generator[Tuple[str, Any], None, None]:
+        for name in self.__node_impl_fields__:
+            yield name, getattr(self, name)
+
+    def iter_children(self) -> Generator[Tuple[str, Any], None, None]:
+        for name in self.__node_children__:
+            yield name, getattr(self, name)
+
+    def iter_children_values(self) -> Generator[Any, None, None]:
+        for name in self.__node_children__:
+            yield getattr(self, name)
+
+    def iter_tree_pre(self) -> utils.XIterator:
+        return iterators.iter_tree_pre(self)
+
+    def iter_tree_post(self) -> utils.XIterator:
+        return iterators.iter_tree_post(self)
+
+    def iter_tree_levels(self) -> utils.XIterator:
+        return iterators.iter_tree_levels(self)
+
+    iter_tree = iter_tree_pre
+
+    def structural_hash(self) -> int:
+        """Stable hash of the node class and the children values (see :meth:`eve.Node.structural_hash`)."""
+        return concepts._structural_hash(self, {})[0]
+
+    def structurally_equal(self, other: Any) -> bool:
+        """Check if `other` is a node of the same class with structurally equal children."""
+        return concepts._structurally_equal(self, other, {})
+
+
+SlottedNodeT = TypeVar("SlottedNodeT", bound=SlottedNode)
+
+concepts.AbstractNode.register(SlottedNode)
+
+
 # TODO(egparedes): implement type coercing
 # TODO: def _make_type_coercer(type_hint: Type[T]) -> Callable[[Any], T]:
 # TODO:     return type_hint if isinstance(type_hint, type) else lambda x: x  # type: ignore
@@ -22,8 +22,8 @@ from __future__ import annotations
 import collections.abc
 
 from . import concepts, utils
-from .type_definitions import Enum
-from .typingx import Any, Generator, Iterable, List, Optional, Tuple, Union
+from .type_definitions import Enum, IntEnum
+from .typingx import Any, Deque, Dict, Generator, Iterable, Optional, Tuple, Type, Union
 
 
 try:
@@ -37,6 +37,37 @@ except ModuleNotFoundError:
 KeyValue = Tuple[Union[int, str], Any]
 TreeIterationItem = Union[Any, Tuple[KeyValue, Any]]
 
+_NOTHING = object()
+
+
+class _ChildrenKind(IntEnum):
+    LEAF = 0
+    NODE = 1
+    SEQUENCE = 2
+    SET = 3
+    MAPPING = 4
+
+
+#: Cache of the kind of children iteration by value type
+_children_kinds: Dict[Type, _ChildrenKind] = {}
+
+
+def _children_kind(node_type: Type) -> _ChildrenKind:
+    if issubclass(node_type, concepts.AbstractNode):
+        kind = _ChildrenKind.NODE
+    elif issubclass(node_type, collections.abc.Sequence) and not issubclass(
+        node_type, (str, bytes)
+    ):
+        kind = _ChildrenKind.SEQUENCE
+    elif issubclass(node_type, collections.abc.Set):
+        kind = _ChildrenKind.SET
+    elif issubclass(node_type, collections.abc.Mapping):
+        kind = _ChildrenKind.MAPPING
+    else:
+        kind = _ChildrenKind.LEAF
+    _children_kinds[node_type] = kind
+    return kind
+
 
 def generic_iter_children(
     node: concepts.TreeNode, *, with_keys: bool = False
@@ -49,17 +80,21 @@ def generic_iter_children(
             Defaults to `False`.
 
     """
-    children_iterator: Iterable[Union[Any, Tuple[KeyValue, Any]]] = iter(())
-    if isinstance(node, concepts.Node):
-        children_iterator = node.iter_children() if with_keys else node.iter_children_values()
-    elif isinstance(node, collections.abc.Sequence) and utils.is_collection(node):
-        children_iterator = enumerate(node) if with_keys else iter(node)
-    elif isinstance(node, collections.abc.Set):
-        children_iterator = zip(node, node) if with_keys else iter(node)  # type: ignore  # problems with iter(Set)
-    elif isinstance(node, collections.abc.Mapping):
-        children_iterator = node.items() if with_keys else node.values()
-
-    return children_iterator
+    node_type = type(node)
+    kind = _children_kinds.get(node_type, None)
+    if kind is None:
+        kind = _children_kind(node_type)
+
+    if kind is _ChildrenKind.LEAF:
+        return ()
+    elif kind is _ChildrenKind.NODE:
+        return node.iter_children() if with_keys else node.iter_children_values()  # type: ignore  # node is a Node
+    elif kind is _ChildrenKind.SEQUENCE:
+        return enumerate(node) if with_keys else iter(node)  # type: ignore  # node is a Sequence
+    elif kind is _ChildrenKind.SET:
+        return zip(node, node) if with_keys else iter(node)  # type: ignore  # problems with iter(Set)
+    else:
+        return node.items() if with_keys else node.values()  # type: ignore  # node is a Mapping
 
 
 class TraversalOrder(Enum):
@@ -80,14 +115,18 @@ def iter_tree_pre(
             Defaults to `False`.
 
     """
-    if with_keys:
-        yield __key__, node
-        for key, child in generic_iter_children(node, with_keys=True):
-            yield from iter_tree_pre(child, with_keys=True, __key__=key)
-    else:
-        yield node
-        for child in generic_iter_children(node, with_keys=False):
-            yield from iter_tree_pre(child, with_keys=False)
+    # Explicit stack of children iterators instead of nested generators
+    yield (__key__, node) if with_keys else node
+    stack = [iter(generic_iter_children(node, with_keys=with_keys))]
+    while stack:
+        item: Any = next(stack[-1], _NOTHING)
+        if item is _NOTHING:
+            stack.pop()
+            continue
+        yield item
+        stack.append(
+            iter(generic_iter_children(item[1] if with_keys else item, with_keys=with_keys))
+        )
 
 
 @utils.as_xiter
@@ -102,23 +141,21 @@ def iter_tree_post(
             Defaults to `False`.
 
     """
-    if with_keys:
-        for key, child in generic_iter_children(node, with_keys=True):
-            yield from iter_tree_post(child, with_keys=True, __key__=key)
-        yield __key__, node
-    else:
-        for child in generic_iter_children(node, with_keys=False):
-            yield from iter_tree_post(child, with_keys=False)
-        yield node
+    # Explicit stack of (item, children iterator) pairs instead of nested generators
+    root_item = (__key__, node) if with_keys else node
+    stack = [(root_item, iter(generic_iter_children(node, with_keys=with_keys)))]
+    while stack:
+        item: Any = next(stack[-1][1], _NOTHING)
+        if item is _NOTHING:
+            yield stack.pop()[0]
+            continue
+        children = generic_iter_children(item[1] if with_keys else item, with_keys=with_keys)
+        stack.append((item, iter(children)))
 
 
 @utils.as_xiter
 def iter_tree_levels(
-    node: concepts.TreeNode,
-    *,
-    with_keys: bool = False,
-    __key__: Optional[Any] = None,
-    __queue__: Optional[List] = None,
+    node: concepts.TreeNode, *, with_keys: bool = False, __key__: Optional[Any] = None
 ) -> Generator[TreeIterationItem, None, None]:
     """Create a tree traversal iterator by levels (Breadth-First Search).
 
@@ -128,19 +165,12 @@ def iter_tree_levels(
             Defaults to `False`.
 
     """
-    __queue__ = __queue__ or []
-    if with_keys:
-        yield __key__, node
-        __queue__.extend(generic_iter_children(node, with_keys=True))
-        if __queue__:
-            key, child = __queue__.pop(0)
-            yield from iter_tree_levels(child, with_keys=True, __key__=key, __queue__=__queue__)
-    else:
-        yield node
-        __queue__.extend(generic_iter_children(node, with_keys=False))
-        if __queue__:
-            child = __queue__.pop(0)
-            yield from iter_tree_levels(child, with_keys=False, __queue__=__queue__)
+    queue: Deque[TreeIterationItem] = collections.deque()
+    queue.append((__key__, node) if with_keys else node)
+    while queue:
+        item = queue.popleft()
+        yield item
+        queue.extend(generic_iter_children(item[1] if with_keys else item, with_keys=with_keys))
 
 
 def iter_tree(
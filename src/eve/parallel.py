@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Parallel execution of visitors over independent nodes.
+
+Passes can opt in by visiting lists of independent subtrees (e.g. all horizontal
+executions of a stencil) with :func:`map_visit`, which runs the visitor in worker
+processes when enabled with :func:`workers` (nodes are exchanged with
+:mod:`eve.serialization`) and otherwise in the current process.
+
+Results are always the same, independently of the number of workers. Worker processes
+generate provisional sequential unique ids (see :class:`eve.utils.UIDGenerator`), which
+are replaced when loading the results by the ids that visiting the nodes in order in
+the current process would have generated.
+"""
+
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import copy
+import os
+
+from . import serialization, utils
+from .typingx import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from .visitors import NodeVisitor
+
+
+#: Start of the provisional sequential ids generated in worker processes
+_PROVISIONAL_IDS_START = 10 ** 15
+
+_max_workers: int = 1
+_executor: Optional[concurrent.futures.Executor] = None
+
+
+@contextlib.contextmanager
+def workers(max_workers: Optional[int]) -> Iterator[None]:
+    """Use up to `max_workers` worker processes in :func:`map_visit` inside the context.
+
+    ``None`` uses as many workers as processors, and ``1`` (the default outside any
+    context) visits all nodes in the current process. The worker processes are started
+    on first use and shared by all :func:`map_visit` calls inside the context.
+    """
+    global _max_workers, _executor
+    previous = _max_workers, _executor
+    _max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    _executor = None
+    try:
+        yield
+    finally:
+        if _executor is not None:
+            _executor.shutdown()
+        _max_workers, _executor = previous
+
+
+def _shared_executor() -> concurrent.futures.Executor:
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ProcessPoolExecutor(_max_workers)
+    return _executor
+
+
+def _visit_chunk(data: bytes) -> Tuple[List[List[Tuple[str, Optional[str], Optional[int]]]], bytes]:
+    visitor, nodes, kwargs = serialization.loads(data)
+    results = []
+    generated_ids = []
+    # visits in worker processes run sequentially (the shared executor belongs to the parent)
+    with workers(1), utils.UIDGenerator.sequence_block(
+        _PROVISIONAL_IDS_START, _PROVISIONAL_IDS_START
+    ):
+        for node in nodes:
+            with utils.UIDGenerator.recording() as recorded:
+                results.append(copy.copy(visitor).visit(node, **kwargs))
+            generated_ids.append(recorded)
+
+    provisional_ids = {uid for recorded in generated_ids for uid, _, _ in recorded}
+
+    def provisional_id(value: Any) -> Optional[str]:
+        return value if value.__class__ is str and value in provisional_ids else None
+
+    return generated_ids, serialization.dumps(results, persistent_id=provisional_id)
+
+
+def _chunks(n_items: int, n_chunks: int) -> List[Tuple[int, int]]:
+    size, remainder = divmod(n_items, n_chunks)
+    bounds = [0]
+    for i in range(n_chunks):
+        bounds.append(bounds[-1] + size + (1 if i < remainder else 0))
+    return [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if start < end]
+
+
+def map_visit(
+    visitor: NodeVisitor,
+    nodes: Sequence[Any],
+    *,
+    max_workers: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """Visit independent nodes with copies of `visitor` and return the results in order.
+
+    The visitor should not keep state between visits of different nodes, since each
+    node is visited by a (shallow) copy and changes of the visitor are not kept.
+    Sequential unique ids generated in the visits should be used only as complete
+    strings (e.g. node ids or names), otherwise they are not replaced in the results.
+    Visitors, nodes, keyword arguments and results need to be serializable with
+    :mod:`eve.serialization` when visiting in worker processes.
+
+    Without `executor`, the visits run in the pool shared inside the :func:`workers`
+    context, or in a new pool if `max_workers` is given.
+
+    Args:
+        visitor: visitor applied to each node.
+        nodes: independent nodes (or other values) to visit.
+        max_workers: number of worker processes, by default the one set by :func:`workers`.
+        executor: process pool executor running the visits.
+        ``**kwargs``: keyword arguments forwarded to every ``visitor.visit()`` call.
+
+    """
+    n_workers = _max_workers if max_workers is None else max_workers
+    if len(nodes) <= 1 or (executor is None and n_workers <= 1):
+        return [copy.copy(visitor).visit(node, **kwargs) for node in nodes]
+
+    results: List[Any] = []
+    with contextlib.ExitStack() as stack:
+        if executor is None:
+            if max_workers is None:
+                executor = _shared_executor()
+            else:
+                executor = stack.enter_context(concurrent.futures.ProcessPoolExecutor(max_workers))
+        if n_workers <= 1:
+            # explicit executor outside of a workers() context
+            n_workers = os.cpu_count() or 1
+        # a few chunks per worker balance the load without sending every node separately
+        chunks = _chunks(len(nodes), min(4 * n_workers, len(nodes)))
+        chunk_results = executor.map(
+            _visit_chunk,
+            [serialization.dumps((visitor, nodes[start:end], kwargs)) for start, end in chunks],
+        )
+
+        for generated_ids, data in chunk_results:
+            # the same ids as generated by visiting the nodes in order in this process
+            final_ids: Dict[str, str] = {
+                uid: utils.UIDGenerator.sequential_id(prefix=prefix, width=width)
+                for recorded in generated_ids
+                for uid, prefix, width in recorded
+            }
+            results.extend(serialization.loads(data, persistent_load=final_ids.__getitem__))
+
+    return results
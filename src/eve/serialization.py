@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Compact binary serialization of node trees, e.g. to cache IRs between pipeline stages.
+
+The format is a short versioned header followed by a pickle (protocol 5) stream, in
+which every node is stored as the tuple of its field values and the node class with
+the names of its fields (the node *schema*) is stored only once per class. Nodes are
+loaded without validation, as with :meth:`eve.Node.construct_trusted`, but loading
+fails if the fields of a serialized class do not match its current definition.
+
+Since the format is based on :mod:`pickle`, only data from trusted sources should
+ever be loaded.
+"""
+
+
+from __future__ import annotations
+
+import io
+import pickle
+import struct
+
+from . import concepts, exceptions
+from .typingx import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Type
+
+
+#: Version of the serialization format, increased on incompatible changes.
+FORMAT_VERSION = 1
+
+_MAGIC = b"EVE-IR"
+_HEADER = struct.Struct("<6sH")
+_PICKLE_PROTOCOL = 5
+
+
+class _NodeSchema:
+    """Node class and names of the serialized fields, stored once per class in a stream."""
+
+    __slots__ = ("node_class", "field_names", "field_set", "is_model", "symtable_index")
+
+    def __init__(self, node_class: Type, field_names: Tuple[str, ...]) -> None:
+        self.node_class = node_class
+        self.field_names = field_names
+        self.field_set = set(field_names)
+        self.is_model = issubclass(node_class, concepts.BaseNode)
+        # symbol tables are collected again after loading (see SymbolTableTrait)
+        self.symtable_index: Optional[int] = (
+            field_names.index("symtable_")
+            if self.is_model and hasattr(node_class, "collect_symbols")
+            else None
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _load_schema, (self.node_class, self.field_names)
+
+
+#: Schemas of node classes (`None` for types which are not nodes)
+_schemas: Dict[Type, Optional[_NodeSchema]] = {}
+
+
+def _node_schema(value_type: Type) -> Optional[_NodeSchema]:
+    try:
+        return _schemas[value_type]
+    except KeyError:
+        pass
+
+    schema = None
+    if concepts._node_type_frozen(value_type) is not None:
+        if issubclass(value_type, concepts.BaseNode):
+            field_names = tuple(value_type.__fields__.keys())
+        else:
+            # eve.datamodels.SlottedNode
+            field_names = tuple(a.name for a in value_type.__attrs_attrs__)  # type: ignore
+        schema = _NodeSchema(value_type, field_names)
+    _schemas[value_type] = schema
+    return schema
+
+
+def _load_schema(node_class: Type, field_names: Tuple[str, ...]) -> _NodeSchema:
+    schema = _node_schema(node_class)
+    if schema is None or schema.field_names != field_names:
+        raise exceptions.EveValueError(
+            f"Serialized fields {field_names} of '{node_class.__qualname__}' do not match "
+            f"its current definition ({schema.field_names if schema else 'not a node'})."
+        )
+    return schema
+
+
+def _load_node(schema: _NodeSchema, values: Tuple[Any, ...]) -> Any:
+    node = object.__new__(schema.node_class)
+    if schema.is_model:
+        object.__setattr__(node, "__dict__", dict(zip(schema.field_names, values)))
+        object.__setattr__(node, "__fields_set__", schema.field_set.copy())
+        if schema.symtable_index is not None:
+            node.collect_symbols()
+    else:
+        for name, value in zip(schema.field_names, values):
+            object.__setattr__(node, name, value)
+    return node
+
+
+class _NodePickler(pickle.Pickler):
+    def reducer_override(self, obj: Any) -> Any:
+        schema = _node_schema(type(obj))
+        if schema is None:
+            return NotImplemented
+
+        if schema.is_model:
+            node_dict = obj.__dict__
+            values: List[Any] = [node_dict.get(name) for name in schema.field_names]
+            if schema.symtable_index is not None:
+                values[schema.symtable_index] = None
+        else:
+            values = [getattr(obj, name) for name in schema.field_names]
+        return _load_node, (schema, tuple(values))
+
+
+def dump(
+    tree: Any, file: BinaryIO, *, persistent_id: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """Write the serialized `tree` (a node or a collection of nodes) to a binary file.
+
+    As in :mod:`pickle`, values for which `persistent_id` returns an id other than
+    ``None`` are stored as this id and replaced by the `persistent_load` function of
+    :func:`load`.
+    """
+    file.write(_HEADER.pack(_MAGIC, FORMAT_VERSION))
+    pickler = _NodePickler(file, protocol=_PICKLE_PROTOCOL)
+    if persistent_id is not None:
+        pickler.persistent_id = persistent_id  # type: ignore  # pickle supports this override
+    pickler.dump(tree)
+
+
+def dumps(tree: Any, *, persistent_id: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize `tree` (a node or a collection of nodes) to bytes."""
+    buffer = io.BytesIO()
+    dump(tree, buffer, persistent_id=persistent_id)
+    return buffer.getvalue()
+
+
+def load(file: BinaryIO, *, persistent_load: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Read a tree serialized with :func:`dump` from a binary file (without validation).
+
+    Raises:
+        EveValueError: if the data is not a serialized tree in the current format or
+            the fields of a serialized node class have changed.
+
+    """
+    header = file.read(_HEADER.size)
+    magic, version = _HEADER.unpack(header) if len(header) == _HEADER.size else (None, None)
+    if magic != _MAGIC:
+        raise exceptions.EveValueError("Data is not a serialized eve tree.")
+    if version != FORMAT_VERSION:
+        raise exceptions.EveValueError(
+            f"Unsupported serialization format version {version} (expected {FORMAT_VERSION})."
+        )
+    unpickler = pickle.Unpickler(file)
+    if persistent_load is not None:
+        unpickler.persistent_load = persistent_load  # type: ignore  # pickle supports this override
+    return unpickler.load()
+
+
+def loads(data: bytes, *, persistent_load: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Load a tree serialized with :func:`dumps` (without validation)."""
+    return load(io.BytesIO(data), persistent_load=persistent_load)
@@ -19,11 +19,28 @@
 
 from __future__ import annotations
 
+import collections.abc
+import types
+
 import pydantic
 
-from . import concepts, visitors
+from . import concepts, utils, visitors
 from .type_definitions import SymbolName
-from .typingx import Any, Dict, Type
+from .typingx import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    ValuesView,
+)
 
 
 class _CollectSymbols(visitors.NodeVisitor):
@@ -47,8 +64,139 @@ class _CollectSymbols(visitors.NodeVisitor):
         return instance.collected
 
 
+#: Cached symbols of child nodes without symbols
+_NO_SYMBOLS: Mapping[str, Any] = types.MappingProxyType({})
+
+
+def _child_symbols(value: Any, symbols: Dict[str, Any]) -> None:
+    """Add the symbols defined in a scope child to `symbols`, caching them in the child nodes."""
+    if isinstance(value, concepts.BaseNode):
+        cached = getattr(value, "_symbols_", None)
+        if cached is None:
+            collector = _CollectSymbols()
+            collector.visit(value)
+            cached = collector.collected or _NO_SYMBOLS
+            object.__setattr__(value, "_symbols_", cached)
+        symbols.update(cached)
+    elif isinstance(value, collections.abc.Mapping):
+        for item in value.values():
+            _child_symbols(item, symbols)
+    elif isinstance(value, collections.abc.Collection) and utils.is_collection(value):
+        for item in value:
+            _child_symbols(item, symbols)
+
+
+def _collection_items(value: Any) -> Optional[Tuple[Any, ...]]:
+    if isinstance(value, collections.abc.Mapping):
+        return tuple(value.values())
+    if isinstance(value, collections.abc.Collection) and utils.is_collection(value):
+        return tuple(value)
+    return None
+
+
+class SymbolTable(collections.abc.Mapping):
+    """Mapping of the symbols defined in a scope, collected lazily from the scope children.
+
+    The symbols are collected on first access and cached in the child nodes of the scope
+    (i.e. the field values of the node and the nodes in field collections). Therefore,
+    symbol tables of scopes rebuilt with some of the same child nodes (e.g. with new
+    lists of children or with :meth:`eve.Node.copy`) only collect the symbols of the
+    new child nodes. After the first access, only replaced children are collected again.
+    In debug mode (i.e. ``__debug__``), the items of the collections of children are also
+    checked, to detect children added or replaced in place. Child nodes are assumed
+    not to be modified in place after their symbols have been collected.
+    """
+
+    def __init__(self, fields: MutableMapping[str, Any]) -> None:
+        self._fields = fields
+        #: Child value and its collection items (in debug mode) by field name
+        self._collected_children: Dict[str, Tuple[Any, Optional[Tuple[Any, ...]]]] = {}
+        self._symbols: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], Any], None, None]:
+        # replaced by the validator of SymbolTableTrait
+        yield lambda value: value
+
+    def _rebind(self, fields: MutableMapping[str, Any]) -> None:
+        self._fields = fields
+
+    @property
+    def symbols(self) -> Dict[str, Any]:
+        symbols = self._symbols
+        if symbols is None or not self._is_up_to_date():
+            symbols = self._symbols = self._collect()
+        return symbols
+
+    def _children(self) -> Iterator[Tuple[str, Any]]:
+        for name, value in self._fields.items():
+            if not name.endswith("_"):
+                yield name, value
+
+    def _is_up_to_date(self) -> bool:
+        collected_children = self._collected_children
+        for name, value in self._children():
+            collected = collected_children.get(name, None)
+            if collected is None or collected[0] is not value:
+                return False
+            if __debug__ and collected[1] is not None:
+                items, current_items = collected[1], _collection_items(value)
+                if current_items is None or len(items) != len(current_items):
+                    return False
+                if any(item is not current for item, current in zip(items, current_items)):
+                    return False
+        return True
+
+    def _collect(self) -> Dict[str, Any]:
+        collected_children = {}
+        symbols: Dict[str, Any] = {}
+        for name, value in self._children():
+            collected_children[name] = (value, _collection_items(value) if __debug__ else None)
+            _child_symbols(value, symbols)
+        self._collected_children = collected_children
+        return symbols
+
+    def __getitem__(self, key: str) -> Any:
+        return self.symbols[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.symbols
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.symbols.get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        return self.symbols.keys()
+
+    def items(self) -> ItemsView[str, Any]:
+        return self.symbols.items()
+
+    def values(self) -> ValuesView[Any]:
+        return self.symbols.values()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SymbolTable):
+            return self.symbols == other.symbols
+        if isinstance(other, collections.abc.Mapping):
+            return self.symbols == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.symbols)})"
+
+
 class SymbolTableTrait(concepts.Model):
-    symtable_: Dict[str, Any] = pydantic.Field(default_factory=dict)
+    symtable_: SymbolTable = None  # type: ignore  # set by the validator
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self.symtable_._rebind(self.__dict__)
 
     @staticmethod
     def _collect_symbols(root_node: concepts.TreeNode) -> Dict[str, Any]:
@@ -58,8 +206,12 @@ class SymbolTableTrait(concepts.Model):
     def _collect_symbols_validator(  # type: ignore  # validators are classmethods
         cls: Type[SymbolTableTrait], values: Dict[str, Any]
     ) -> Dict[str, Any]:
-        values["symtable_"] = cls._collect_symbols(values)
+        values["symtable_"] = SymbolTable(values)
         return values
 
     def collect_symbols(self) -> None:
-        self.symtable_ = self._collect_symbols(self)
+        """Collect the symbols again from the current children (on first access).
+
+        Symbols cached in child nodes are reused (see :class:`SymbolTable`).
+        """
+        self.__dict__["symtable_"] = SymbolTable(self.__dict__)
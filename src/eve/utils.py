@@ -20,9 +20,11 @@
 from __future__ import annotations
 
 import collections.abc
+import contextlib
 import enum
 import functools
 import hashlib
+import io
 import itertools
 import operator
 import pickle
@@ -289,13 +291,25 @@ def register_subclasses(*subclasses: Type) -> Callable[[Type], Type]:
     return _decorator
 
 
+class _StructuralHashPickler(pickle.Pickler):
+    """Pickler replacing objects with a `structural_hash()` method (e.g. nodes) by their hash."""
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[str, int]]:
+        structural_hash = getattr(type(obj), "structural_hash", None)
+        if structural_hash is None:
+            return None
+        return ("structural_hash", structural_hash(obj))
+
+
 def shash(*args: Any, hash_algorithm: Optional[Any] = None) -> str:
     """Stable hash function.
 
     It provides a customizable hash function for any kind of data.
     Unlike the builtin `hash` function, it is stable (same hash value across
     interpreter reboots) and it does not use hash customizations on user
-    classes (it uses `pickle` internally to get a byte stream).
+    classes (it uses `pickle` internally to get a byte stream). Objects
+    with a `structural_hash()` method, like Eve nodes, are hashed with it
+    instead of being pickled.
 
     Arguments:
         hash_algorithm: object implementing the `hash algorithm` interface
@@ -309,7 +323,9 @@ def shash(*args: Any, hash_algorithm: Optional[Any] = None) -> str:
     elif isinstance(hash_algorithm, str):
         hash_algorithm = hashlib.new(hash_algorithm)
 
-    hash_algorithm.update(pickle.dumps(args))
+    stream = io.BytesIO()
+    _StructuralHashPickler(stream).dump(args)
+    hash_algorithm.update(stream.getvalue())
     result = hash_algorithm.hexdigest()
     assert isinstance(result, str)
 
@@ -456,6 +472,8 @@ class UIDGenerator:
 
     #: Constantly increasing counter for generation of sequential unique ids
     __counter = itertools.count(1)
+    #: Generated sequential ids and their arguments (only inside :meth:`recording`)
+    __recorded: Optional[List[Tuple[str, Optional[str], Optional[int]]]] = None
 
     @classmethod
     def random_id(cls, *, prefix: Optional[str] = None, width: int = 8) -> str:
@@ -473,7 +491,10 @@ class UIDGenerator:
             raise ValueError(f"Width must be a positive number ({width} provided).")
         count = next(cls.__counter)
         s = f"{count:0{width}}" if width else f"{count}"
-        return f"{prefix}_{s}" if prefix else f"{s}"
+        result = f"{prefix}_{s}" if prefix else f"{s}"
+        if cls.__recorded is not None:
+            cls.__recorded.append((result, prefix, width))
+        return result
 
     @classmethod
     def reset_sequence(cls, start: int = 1) -> None:
@@ -488,6 +509,53 @@ class UIDGenerator:
             warnings.warn("Unsafe reset of global UIDGenerator", RuntimeWarning)
         cls.__counter = itertools.count(start)
 
+    @classmethod
+    def reserve_sequence(cls, size: int) -> int:
+        """Reserve a block of `size` sequential ids (not generated afterwards) and return its start."""
+        start = next(cls.__counter)
+        cls.__counter = itertools.count(start + size)
+        return start
+
+    @classmethod
+    @contextlib.contextmanager
+    def sequence_block(cls, start: int, size: int) -> Iterator[None]:
+        """Generate the sequential ids from the block ``[start, start + size)`` inside the context.
+
+        The block should have been reserved with :meth:`reserve_sequence` before, and the
+        global sequence continues as before the context at exit.
+
+        Raises:
+            RuntimeError: if more than `size` ids were generated inside the context.
+
+        """
+        counter = cls.__counter
+        cls.__counter = itertools.count(start)
+        try:
+            yield
+        finally:
+            block_counter, cls.__counter = cls.__counter, counter
+        if next(block_counter) > start + size:
+            raise RuntimeError(f"More than {size} sequential ids generated in the reserved block")
+
+    @classmethod
+    @contextlib.contextmanager
+    def recording(cls) -> Iterator[List[Tuple[str, Optional[str], Optional[int]]]]:
+        """Record the sequential ids generated inside the context.
+
+        The yielded list is filled with the generated ids and the `prefix` and `width`
+        arguments used to generate them, e.g. to generate the same ids again in another
+        process with :meth:`sequential_id`.
+        """
+        previous = cls.__recorded
+        recorded: List[Tuple[str, Optional[str], Optional[int]]] = []
+        cls.__recorded = recorded
+        try:
+            yield recorded
+        finally:
+            cls.__recorded = previous
+            if previous is not None:
+                previous.extend(recorded)
+
 
 # -- Iterators --
 S = TypeVar("S")
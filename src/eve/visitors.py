@@ -21,24 +21,57 @@ from __future__ import annotations
 
 import collections.abc
 import copy
+import inspect
 import operator
+import types
 
 from . import concepts, iterators, utils
 from .concepts import NOTHING
 from .typingx import (
     Any,
     Callable,
+    ClassVar,
     Collection,
     Dict,
     Iterable,
+    List,
     MutableSequence,
     MutableSet,
     Tuple,
+    Type,
     Union,
 )
 
 
-class NodeVisitor:
+VisitorFunc = Callable[..., Any]
+
+
+class _NodeVisitorMeta(type):
+    """Metaclass invalidating the dispatch tables of visitors when visitor methods change."""
+
+    def __init__(
+        cls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any
+    ) -> None:
+        super().__init__(name, bases, namespace)
+        cls._dispatch_table_: Dict[Type, VisitorFunc] = {}
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name.startswith("visit_") or name == "generic_visit":
+            cls._clear_dispatch_tables()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if name.startswith("visit_") or name == "generic_visit":
+            cls._clear_dispatch_tables()
+
+    def _clear_dispatch_tables(cls) -> None:
+        cls._dispatch_table_.clear()
+        for subclass in cls.__subclasses__():
+            subclass._clear_dispatch_tables()
+
+
+class NodeVisitor(metaclass=_NodeVisitorMeta):
     """Simple node visitor class based on :class:`ast.NodeVisitor`.
 
     A NodeVisitor instance walks a node tree and calls a visitor
@@ -64,7 +97,11 @@ class NodeVisitor:
         3. ``self.generic_visit()``.
 
     This dispatching mechanism is implemented in the main :meth:`visit`
-    method and can be overriden in subclasses.
+    method and can be overriden in subclasses. The visitor function found
+    for a node class is cached per visitor class, so visitor functions have
+    to be defined in the class (not in the instances). The cache is cleared
+    when ``visit_`` methods are added to or removed from the class or
+    its bases after the creation of the class.
 
     Note that return values are not forwarded to the caller in the default
     :meth:`generic_visit` implementation. If you want to return a value from
@@ -102,23 +139,36 @@ class NodeVisitor:
 
     """
 
+    _dispatch_table_: ClassVar[Dict[Type, VisitorFunc]]
+
     def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
-
-        method_name = "visit_" + node.__class__.__name__
-        if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
-        elif isinstance(node, concepts.Node):
-            for node_class in node.__class__.__mro__[1:]:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
+        try:
+            visitor = self._dispatch_table_[node.__class__]
+        except KeyError:
+            visitor = self._dispatch_table_[node.__class__] = self._find_visitor(node.__class__)
+
+        return visitor(self, node, **kwargs)
+
+    @classmethod
+    def _find_visitor(cls, node_class: Type) -> VisitorFunc:
+        method_name = "generic_visit"
+        if hasattr(cls, "visit_" + node_class.__name__):
+            method_name = "visit_" + node_class.__name__
+        elif issubclass(node_class, concepts.AbstractNode):
+            for base in node_class.__mro__[1:]:
+                if hasattr(cls, "visit_" + base.__name__):
+                    method_name = "visit_" + base.__name__
                     break
 
-                if node_class is concepts.Node:
+                if base is concepts.Node:
                     break
 
-        return visitor(node, **kwargs)
+        visitor = inspect.getattr_static(cls, method_name)
+        if isinstance(visitor, types.FunctionType):
+            return visitor
+        else:
+            # e.g. static or class methods
+            return lambda self, node, **kwargs: getattr(self, method_name)(node, **kwargs)
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         for child in iterators.generic_iter_children(node):
@@ -134,7 +184,11 @@ class NodeTranslator(NodeVisitor):
     the node will be removed from its location in the output tree,
     otherwise it will be replaced with this new value. The default visitor
     method (:meth:`generic_visit`) returns a `deepcopy` of the original
-    node.
+    node. Copies of subtrees left unchanged by the visitor methods are
+    created with :meth:`eve.Node.construct_trusted`, skipping the validation
+    of the nodes (unless :attr:`trusted_construction` is disabled). Therefore,
+    visitor methods should not modify the nodes returned by
+    :meth:`generic_visit` in place, but create new nodes instead.
 
     Keep in mind that if the node you're operating on has child nodes
     you must either transform the child nodes yourself or call the
@@ -149,33 +203,55 @@ class NodeTranslator(NodeVisitor):
 
     """
 
+    #: Copy unchanged subtrees in :meth:`generic_visit` without validating them again
+    trusted_construction: ClassVar[bool] = True
+
     _memo_dict_: Dict[int, Any]
+    #: Last original value and copy created by :meth:`generic_visit` for an unchanged subtree
+    _unchanged_copy_: Tuple[Any, Any] = (NOTHING, NOTHING)
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         result: Any = None
-        if isinstance(node, (concepts.Node, collections.abc.Collection)) and utils.is_collection(
-            node
-        ):
-            tmp_items: Collection[concepts.TreeNode] = []
-            if isinstance(node, concepts.Node):
-                tmp_items = {
-                    key: self.visit(value, **kwargs) for key, value in node.iter_children()
-                }
-                result = node.__class__(  # type: ignore
-                    **{key: value for key, value in node.iter_impl_fields()},
-                    **{key: value for key, value in tmp_items.items() if value is not NOTHING},
-                )
+        unchanged = self.trusted_construction
+        if isinstance(
+            node, (concepts.AbstractNode, collections.abc.Collection)
+        ) and utils.is_collection(node):
+            if isinstance(node, concepts.AbstractNode):
+                tmp_children: Dict[str, Any] = {}
+                for name, child in node.iter_children():
+                    tmp_children[name] = self.visit(child, **kwargs)
+                    unchanged = unchanged and self._is_unchanged_copy(child, tmp_children[name])
+                if unchanged:
+                    # the children are (copies of) already validated nodes
+                    result = node.__class__.construct_trusted(
+                        **{key: value for key, value in node.iter_impl_fields()}, **tmp_children
+                    )
+                else:
+                    result = node.__class__(  # type: ignore
+                        **{key: value for key, value in node.iter_impl_fields()},
+                        **{
+                            key: value
+                            for key, value in tmp_children.items()
+                            if value is not NOTHING
+                        },
+                    )
 
             elif isinstance(node, (collections.abc.Sequence, collections.abc.Set)):
                 # Sequence or set: create a new container instance with the new values
-                tmp_items = [self.visit(value, **kwargs) for value in node]
+                tmp_values: List[Any] = []
+                for item in node:
+                    tmp_values.append(self.visit(item, **kwargs))
+                    unchanged = unchanged and self._is_unchanged_copy(item, tmp_values[-1])
                 result = node.__class__(  # type: ignore
-                    value for value in tmp_items if value is not NOTHING
+                    value for value in tmp_values if value is not NOTHING
                 )
 
             elif isinstance(node, collections.abc.Mapping):
                 # Mapping: create a new mapping instance with the new values
-                tmp_items = {key: self.visit(value, **kwargs) for key, value in node.items()}
+                tmp_items: Dict[Any, Any] = {}
+                for key, item in node.items():
+                    tmp_items[key] = self.visit(item, **kwargs)
+                    unchanged = unchanged and self._is_unchanged_copy(item, tmp_items[key])
                 result = node.__class__(  # type: ignore
                     {key: value for key, value in tmp_items.items() if value is not NOTHING}
                 )
@@ -185,8 +261,36 @@ class NodeTranslator(NodeVisitor):
                 self._memo_dict_ = {}
             result = copy.deepcopy(node, memo=self._memo_dict_)
 
+        if unchanged:
+            self._unchanged_copy_ = (node, result)
+
         return result
 
+    def _is_unchanged_copy(self, value: Any, new_value: Any) -> bool:
+        """Check if `new_value` is the copy of `value` made by :meth:`generic_visit`."""
+        original, unchanged_copy = self._unchanged_copy_
+        return original is value and unchanged_copy is new_value
+
+
+class _TreeValidator(NodeTranslator):
+    trusted_construction = False
+
+    def visit_Node(self, node: concepts.Node, **kwargs: Any) -> concepts.Node:
+        # other implementation fields (e.g. symbol tables) are derived from the children
+        return node.__class__(
+            id_=node.id_,
+            **{key: self.visit(value, **kwargs) for key, value in node.iter_children()},
+        )
+
+
+def validate_tree(node: concepts.TreeNode) -> concepts.TreeNode:
+    """Return a copy of the tree where all nodes have been validated again.
+
+    Checks trees built with :meth:`eve.Node.construct_trusted`, for example by
+    :class:`NodeTranslator` instances, at the boundaries between passes.
+    """
+    return _TreeValidator().visit(node)
+
 
 class NodeMutator(NodeVisitor):
     """Special `NodeVisitor` to modify nodes in place.
@@ -217,15 +321,15 @@ class NodeMutator(NodeVisitor):
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         result: Any = node
-        if isinstance(node, (concepts.Node, collections.abc.Collection)) and utils.is_collection(
-            node
-        ):
+        if isinstance(
+            node, (concepts.AbstractNode, collections.abc.Collection)
+        ) and utils.is_collection(node):
             items: Iterable[Tuple[Any, Any]] = []
             tmp_items: Collection[concepts.TreeNode] = []
             set_op: Union[Callable[[Any, str, Any], None], Callable[[Any, int, Any], None]]
             del_op: Union[Callable[[Any, str], None], Callable[[Any, int], None]]
 
-            if isinstance(node, concepts.Node):
+            if isinstance(node, concepts.AbstractNode):
                 items = list(node.iter_children())
                 set_op = setattr
                 del_op = delattr
@@ -24,6 +24,7 @@ from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional,
 
 import jinja2
 
+from eve import codegen
 from gt4py import definitions as gt_definitions
 from gt4py import ir as gt_ir
 from gt4py import utils as gt_utils
@@ -386,6 +387,7 @@ class BasePyExtBackend(BaseBackend):
             **super().extra_cache_info,
             "pyext_file_path": pyext_file_path,
             "pyext_md5": pyext_md5,
+            "pyext_sources_sha256": self.builder.backend_data.get("pyext_sources_sha256", {}),
         }
 
     @property
@@ -412,14 +414,21 @@ class BasePyExtBackend(BaseBackend):
         )
         pyext_build_path.mkdir(parents=True, exist_ok=True)
         sources = []
+        sources_sha256 = {}
         for key, source in pyext_sources.items():
             src_file_path = pyext_build_path / key
             src_ext = src_file_path.suffix
             if src_ext not in [".h", ".hpp"]:
                 sources.append(str(src_file_path))
 
-            if source is not gt_utils.NOTHING:
+            if callable(source):
+                # streamed source: generated code is written to the file incrementally
+                with codegen.SourceFileSink(src_file_path) as sink:
+                    source(sink)
+                sources_sha256[key] = sink.hexdigest
+            elif source is not gt_utils.NOTHING:
                 src_file_path.write_text(source)
+                sources_sha256[key] = hashlib.sha256(source.encode()).hexdigest()
 
         pyext_target_file_path = self.builder.pkg_path
         qualified_pyext_name = self.pyext_module_path
@@ -440,7 +449,11 @@ class BasePyExtBackend(BaseBackend):
         assert module_name == qualified_pyext_name
 
         self.builder.with_backend_data(
-            {"pyext_module_name": module_name, "pyext_file_path": file_path}
+            {
+                "pyext_module_name": module_name,
+                "pyext_file_path": file_path,
+                "pyext_sources_sha256": sources_sha256,
+            }
         )
 
         return module_name, file_path
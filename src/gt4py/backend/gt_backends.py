@@ -58,6 +58,9 @@ def x86_is_compatible_layout(field: "Storage") -> bool:
     if len(field.strides) < len(flattened_layout):
         return False
     for dim in reversed(np.argsort(flattened_layout)):
+        if field.strides[dim] == 0:
+            # broadcast dimension, see `Storage.broadcast_to`
+            continue
         if field.strides[dim] < stride:
             return False
         stride = field.strides[dim]
@@ -94,6 +97,9 @@ def mc_is_compatible_layout(field: "Storage") -> bool:
     if len(field.strides) < len(flattened_layout):
         return False
     for dim in reversed(np.argsort(flattened_layout)):
+        if field.strides[dim] == 0:
+            # broadcast dimension, see `Storage.broadcast_to`
+            continue
         if field.strides[dim] < stride:
             return False
         stride = field.strides[dim]
@@ -112,6 +118,9 @@ def cuda_is_compatible_layout(field: "Storage") -> bool:
     if len(field.strides) < len(flattened_layout):
         return False
     for dim in reversed(np.argsort(flattened_layout)):
+        if field.strides[dim] == 0:
+            # broadcast dimension, see `Storage.broadcast_to`
+            continue
         if field.strides[dim] < stride:
             return False
         stride = field.strides[dim]
@@ -600,7 +609,7 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
             ir = self.builder.implementation_ir
         # Generate source
         if not self.builder.options._impl_opts.get("disable-code-generation", False):
-            gt_pyext_sources: Dict[str, Any] = self.make_extension_sources(ir=ir)
+            gt_pyext_sources: Dict[str, Any] = self.make_extension_sources(ir=ir, streamed=True)
             gt_pyext_sources = {**gt_pyext_sources["computation"], **gt_pyext_sources["bindings"]}
         else:
             # Pass NOTHING to the self.builder means try to reuse the source code files
@@ -623,8 +632,13 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         result = self.build_extension_module(gt_pyext_sources, pyext_opts, uses_cuda=uses_cuda)
         return result
 
-    def make_extension_sources(self, *, ir) -> Dict[str, Dict[str, str]]:
-        """Generate the source for the stencil independently from use case."""
+    def make_extension_sources(self, *, ir, streamed: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate the source for the stencil independently from use case.
+
+        If `streamed` is set and the extension generator supports it, functions writing each
+        source to a text sink (see :class:`eve.codegen.TextSink`) are returned instead.
+        """
         if "computation_src" in self.builder.backend_data:
             return self.builder.backend_data["computation_src"]
         class_name = self.pyext_class_name if self.builder.stencil_id else self.builder.options.name
@@ -636,12 +650,17 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         gt_pyext_generator = self.PYEXT_GENERATOR_CLASS(
             class_name, module_name, self.GT_BACKEND_T, self.builder.options
         )
-        gt_pyext_sources = gt_pyext_generator(ir)
+        streamed = streamed and hasattr(gt_pyext_generator, "source_writers")
+        if streamed:
+            gt_pyext_sources = gt_pyext_generator.source_writers(ir)
+        else:
+            gt_pyext_sources = gt_pyext_generator(ir)
         final_ext = ".cu" if self.languages and self.languages["computation"] == "cuda" else ".cpp"
         comp_src = gt_pyext_sources["computation"]
         for key in [k for k in comp_src.keys() if k.endswith(".src")]:
             comp_src[key.replace(".src", final_ext)] = comp_src.pop(key)
-        self.builder.backend_data["computation_src"] = gt_pyext_sources
+        if not streamed:
+            self.builder.backend_data["computation_src"] = gt_pyext_sources
         return gt_pyext_sources
 
 
@@ -14,10 +14,14 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+import os
+import pickle
+import warnings
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
-from eve import codegen
+from eve import codegen, parallel, serialization
 from eve.codegen import MakoTemplate as as_mako
+from eve.exceptions import EveValueError
 from gt4py import backend as gt_backend
 from gt4py import gt_src_manager
 from gt4py.backend import BaseGTBackend, CLIBackendMixin
@@ -33,17 +37,18 @@ from gt4py.backend.gt_backends import (
     x86_is_compatible_layout,
 )
 from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
-from gtc import gtir_to_oir
+from gtc import gtir_to_oir, oir
 from gtc.common import DataType
 from gtc.gtcpp import gtcpp, gtcpp_codegen, oir_to_gtcpp
 from gtc.passes.gtir_dtype_resolver import resolve_dtype
 from gtc.passes.gtir_prune_unused_parameters import prune_unused_parameters
+from gtc.passes.gtir_simplifier import simplify
 from gtc.passes.gtir_upcaster import upcast
-from gtc.passes.oir_optimizations.horizontal_execution_merging import GreedyMerging
-from gtc.passes.oir_optimizations.temporaries import TemporariesToScalars
+from gtc.passes.pass_manager import run_oir_pipeline
 
 
 if TYPE_CHECKING:
+    from gt4py.ir.nodes import StencilDefinition
     from gt4py.stencil_object import StencilObject
 
 
@@ -54,17 +59,17 @@ class GTCGTExtGenerator:
         self.gt_backend_t = gt_backend_t
         self.options = options
 
-    def __call__(self, definition_ir) -> Dict[str, Dict[str, str]]:
-        gtir = DefIRToGTIR.apply(definition_ir)
-        gtir_without_unused_params = prune_unused_parameters(gtir)
-        dtype_deduced = resolve_dtype(gtir_without_unused_params)
-        upcasted = upcast(dtype_deduced)
-        oir = gtir_to_oir.GTIRToOIR().visit(upcasted)
-        oir = self._optimize_oir(oir)
-        gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
-        implementation = gtcpp_codegen.GTCppCodegen.apply(gtcpp, gt_backend_t=self.gt_backend_t)
+    def __call__(self, ir: Union["StencilDefinition", oir.Stencil]) -> Dict[str, Dict[str, str]]:
+        gtcpp = self._make_gtcpp(ir)
+        format_source = self.options.format_source
+        implementation = gtcpp_codegen.GTCppCodegen.apply(
+            gtcpp, gt_backend_t=self.gt_backend_t, format_source=format_source
+        )
         bindings = GTCppBindingsCodegen.apply(
-            gtcpp, module_name=self.module_name, gt_backend_t=self.gt_backend_t
+            gtcpp,
+            module_name=self.module_name,
+            gt_backend_t=self.gt_backend_t,
+            format_source=format_source,
         )
         bindings_ext = ".cu" if self.gt_backend_t == "gpu" else ".cpp"
         return {
@@ -72,10 +77,60 @@ class GTCGTExtGenerator:
             "bindings": {"bindings" + bindings_ext: bindings},
         }
 
-    def _optimize_oir(self, oir):
-        oir = GreedyMerging().visit(oir)
-        oir = TemporariesToScalars().visit(oir)
-        return oir
+    def source_writers(
+        self, ir: Union["StencilDefinition", oir.Stencil]
+    ) -> Dict[str, Dict[str, Callable[[codegen.TextSink], None]]]:
+        """Return functions streaming each source of the generator to a sink."""
+        gtcpp = self._make_gtcpp(ir)
+        format_source = self.options.format_source
+
+        def write_implementation(sink: codegen.TextSink) -> None:
+            gtcpp_codegen.GTCppCodegen.apply_to(
+                sink, gtcpp, gt_backend_t=self.gt_backend_t, format_source=format_source
+            )
+
+        def write_bindings(sink: codegen.TextSink) -> None:
+            GTCppBindingsCodegen.apply_to(
+                sink,
+                gtcpp,
+                module_name=self.module_name,
+                gt_backend_t=self.gt_backend_t,
+                format_source=format_source,
+            )
+
+        bindings_ext = ".cu" if self.gt_backend_t == "gpu" else ".cpp"
+        return {
+            "computation": {"computation.hpp": write_implementation},
+            "bindings": {"bindings" + bindings_ext: write_bindings},
+        }
+
+    def _make_gtcpp(self, ir: Union["StencilDefinition", oir.Stencil]) -> gtcpp.Program:
+        optimized_oir = ir if isinstance(ir, oir.Stencil) else self.make_oir(ir)
+        return oir_to_gtcpp.OIRToGTCpp().visit(optimized_oir)
+
+    def make_oir(self, definition_ir: "StencilDefinition") -> oir.Stencil:
+        """Lower the definition IR to OIR and optimize it."""
+        gtir = DefIRToGTIR.apply(definition_ir)
+        gtir_without_unused_params = prune_unused_parameters(gtir)
+        dtype_deduced = resolve_dtype(gtir_without_unused_params)
+        upcasted = upcast(dtype_deduced)
+        simplified = simplify(upcasted)
+        return self._optimize_oir(gtir_to_oir.GTIRToOIR().visit(simplified))
+
+    def _optimize_oir(self, stencil: oir.Stencil) -> oir.Stencil:
+        backend_opts = self.options.backend_opts
+        build_info = self.options.build_info
+        stats = [] if build_info is not None else None
+        with parallel.workers(backend_opts.get("oir_workers", 1)):
+            stencil = run_oir_pipeline(
+                stencil,
+                backend_opts.get("oir_pipeline", None),
+                validate=backend_opts.get("validate_oir", False),
+                stats=stats,
+            )
+        if build_info is not None:
+            build_info["oir_pipeline"] = stats
+        return stencil
 
 
 class GTCppBindingsCodegen(codegen.TemplatedGenerator):
@@ -172,18 +227,106 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
     )
 
     @classmethod
-    def apply(cls, root, *, module_name="stencil", **kwargs) -> str:
+    def apply(cls, root, *, module_name="stencil", format_source=True, **kwargs) -> str:
         generated_code = cls().visit(root, module_name=module_name, **kwargs)
-        formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
-        return formatted_code
+        if format_source:
+            generated_code = codegen.format_source("cpp", generated_code, style="LLVM")
+        return generated_code
+
+    @classmethod
+    def apply_to(cls, sink, root, *, module_name="stencil", format_source=True, **kwargs) -> None:
+        if format_source:
+            with codegen.formatting_sink("cpp", sink, style="LLVM") as formatted_sink:
+                super().apply_to(formatted_sink, root, module_name=module_name, **kwargs)
+        else:
+            super().apply_to(sink, root, module_name=module_name, **kwargs)
+
+
+def _pass_names(value: str) -> List[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
 
 
 class GTCGTBaseBackend(BaseGTBackend, CLIBackendMixin):
-    options = BaseGTBackend.GT_BACKEND_OPTS
+    options = {
+        **BaseGTBackend.GT_BACKEND_OPTS,
+        "oir_pipeline": {
+            "versioning": True,
+            "description": "Names of the OIR passes to apply (see gtc.passes.pass_manager)",
+            "type": _pass_names,
+        },
+        "validate_oir": {
+            "versioning": False,
+            "description": "Validate the OIR and check the pass postconditions after every pass",
+            "type": bool,
+        },
+        "oir_workers": {
+            "versioning": False,
+            "description": "Number of worker processes for OIR passes supporting it (see eve.parallel)",
+            "type": int,
+        },
+    }
     PYEXT_GENERATOR_CLASS = GTCGTExtGenerator  # type: ignore
 
     def _generate_extension(self, uses_cuda: bool) -> Tuple[str, str]:
-        return self.make_extension(gt_version=2, ir=self.builder.definition_ir, uses_cuda=uses_cuda)
+        return self.make_extension(gt_version=2, ir=self.make_oir(), uses_cuda=uses_cuda)
+
+    def generate_computation(self, *, ir: Any = None) -> Dict[str, Union[str, Dict]]:
+        dir_name = f"{self.builder.options.name}_src"
+        return {dir_name: self._make_extension_sources(ir)["computation"]}
+
+    def generate_bindings(
+        self, language_name: str, *, ir: Any = None
+    ) -> Dict[str, Union[str, Dict]]:
+        if language_name != "python":
+            return super().generate_bindings(language_name)
+        dir_name = f"{self.builder.options.name}_src"
+        return {dir_name: self._make_extension_sources(ir)["bindings"]}
+
+    def _make_extension_sources(self, ir: Optional[oir.Stencil]) -> Dict[str, Dict[str, Any]]:
+        # the (cached) optimized OIR is only needed if the sources have not been generated yet
+        if ir is None and "computation_src" not in self.builder.backend_data:
+            ir = self.make_oir()
+        return self.make_extension_sources(ir=ir)
+
+    def make_oir(self) -> oir.Stencil:
+        """
+        Load the optimized OIR of the stencil from the cache or lower the definition IR.
+
+        Newly lowered OIR is stored in the IR cache of the caching strategy, which is shared by
+        all GTC backends. The cached OIR is ignored when rebuilding the stencil. Whether the OIR
+        has been loaded from the cache is recorded as ``"oir_cached"`` in the build info.
+        """
+        build_info = self.builder.options.build_info
+        cache_path = self.builder.caching.ir_cache_path("oir")
+        if cache_path is not None and not self.builder.options.rebuild and cache_path.exists():
+            try:
+                with cache_path.open("rb") as cache_file:
+                    cached_oir = serialization.load(cache_file)
+            except (EveValueError, EOFError, pickle.UnpicklingError) as e:
+                warnings.warn(
+                    f"Ignoring outdated or corrupted OIR cache file '{cache_path}' ({e})",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            else:
+                if build_info is not None:
+                    build_info["oir_cached"] = True
+                return cached_oir
+
+        generator = self.PYEXT_GENERATOR_CLASS(
+            self.pyext_class_name, self.pyext_module_name, self.GT_BACKEND_T, self.builder.options
+        )
+        optimized_oir = generator.make_oir(self.builder.definition_ir)
+        if build_info is not None:
+            build_info["oir_cached"] = False
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # write and rename to avoid reading incomplete files from concurrent builds
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("wb") as cache_file:
+                serialization.dump(optimized_oir, cache_file)
+            tmp_path.replace(cache_path)
+        return optimized_oir
 
     def generate(self) -> Type["StencilObject"]:
         self.check_options(self.builder.options)
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 import numpy as np
 
 from gt4py import backend as gt_backend
+from gt4py import config as gt_config
 from gt4py import definitions as gt_definitions
 from gt4py import ir as gt_ir
 from gt4py.utils import text as gt_text
@@ -139,6 +140,12 @@ class NumPySourceGenerator(PythonSourceGenerator):
         self, name: str, dtype: gt_ir.DataType, extent: gt_definitions.Extent
     ) -> List[str]:
         source_lines = super().make_temporary_field(name, dtype, extent)
+        if gt_config.storage_settings["memory_accounting"]:
+            source_lines.append(
+                "_gt_accounting.register_temporary({name}, {stencil!r}, {name!r})".format(
+                    name=name, stencil=self.impl_node.name
+                )
+            )
         source_lines.extend(self._make_field_origin(name, extent.to_boundary().lower_indices))
 
         return source_lines
@@ -390,6 +397,12 @@ class NumPyModuleGenerator(gt_backend.BaseModuleGenerator):
             interval_k_end_name="interval_k_end",
         )
 
+    def generate_imports(self) -> str:
+        source = super().generate_imports()
+        if gt_config.storage_settings["memory_accounting"]:
+            source += "\nfrom gt4py.storage import accounting as _gt_accounting"
+        return source
+
     def generate_module_members(self) -> str:
         return ""
 
@@ -443,3 +456,13 @@ class NumPyBackend(gt_backend.BaseBackend, gt_backend.PurePythonBackendCLIMixin)
     languages = {"computation": "python", "bindings": []}
 
     MODULE_GENERATOR_CLASS = NumPyModuleGenerator
+
+    @classmethod
+    def filter_options_for_id(
+        cls, options: gt_definitions.BuildOptions
+    ) -> gt_definitions.BuildOptions:
+        filtered_options = super().filter_options_for_id(options)
+        # the temporaries accounting hook is only generated if enabled
+        if gt_config.storage_settings["memory_accounting"]:
+            filtered_options.backend_opts["memory_accounting"] = True
+        return filtered_options
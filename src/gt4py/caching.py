@@ -59,6 +59,20 @@ class CachingStrategy(abc.ABC):
         """Calculate the file path where caching info for the current process should be stored."""
         raise NotImplementedError
 
+    def ir_cache_path(self, ir_name: str) -> Optional[pathlib.Path]:
+        """
+        Calculate the file path where an intermediate representation of the stencil can be cached.
+
+        Backends can store serialized IR trees (see :py:mod:`eve.serialization`) in this file
+        to avoid lowering the stencil again when regenerating it. The default is no IR caching.
+
+        Parameters
+        ----------
+        ir_name:
+            Short name of the IR, used as file extension (e.g. ``"oir"``)
+        """
+        return None
+
     @abc.abstractmethod
     def generate_cache_info(self) -> Dict[str, Any]:
         """
@@ -199,6 +213,20 @@ class JITCachingStrategy(CachingStrategy):
         """Get the cache info file path from the stencil module path."""
         return self.builder.module_path.parent / f"{self.builder.module_path.stem}.cacheinfo"
 
+    def ir_cache_path(self, ir_name: str) -> Optional[pathlib.Path]:
+        """
+        Get the IR cache file path from the stencil name and fingerprint.
+
+        IR files are not stored per backend, so that backends sharing the same lowering steps
+        and options (and thus stencil versions) can also share the cached IR. The GT4Py version
+        is also part of the file name, since the lowering steps may change between versions.
+        """
+        ir_root = self.backend_root_path.parent / "ir"
+        gt4py_version = gt4py.utils.slugify(gt4py.__version__)
+        return ir_root.joinpath(*self.builder.options.qualified_name.split(".")) / (
+            f"{self.builder.options.name}__{self.stencil_id.version}__{gt4py_version}.{ir_name}"
+        )
+
     def generate_cache_info(self) -> Dict[str, Any]:
         return {
             "backend": self.builder.backend.name,
@@ -72,3 +72,18 @@ cache_settings: Dict[str, Any] = {
 }
 
 code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
+
+storage_settings: Dict[str, Any] = {
+    # recycle the buffers of released CPU storages (see gt4py.storage.allocators)
+    "memory_pool": os.environ.get("GT_STORAGE_MEMORY_POOL", "0").lower() in ("1", "true", "on"),
+    "memory_pool_max_bytes": (
+        int(os.environ["GT_STORAGE_MEMORY_POOL_MAX_BYTES"])
+        if "GT_STORAGE_MEMORY_POOL_MAX_BYTES" in os.environ
+        else None
+    ),
+    # record live storages and temporaries (see gt4py.storage.accounting)
+    "memory_accounting": os.environ.get("GT_STORAGE_MEMORY_ACCOUNTING", "0").lower()
+    in ("1", "true", "on"),
+    # threads initializing large CPU storages in parallel (see gt4py.storage.numa)
+    "first_touch_threads": int(os.environ.get("GT_STORAGE_FIRST_TOUCH_THREADS", "1")),
+}
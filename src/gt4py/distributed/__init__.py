@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Domain decomposition of stencil computations over several processes.
+
+The horizontal domain is split into a grid of subdomains (:class:`Decomposition`), every
+distributed field holds one storage with halo per subdomain (:class:`DistributedStorage`),
+an :class:`Executor` runs stencils on all subdomains in parallel worker processes and
+a :class:`Transport` exchanges the halos between subdomains. The default
+:class:`SharedMemoryTransport` copies halos between subdomain storages allocated in shared
+memory (see :class:`gt4py.storage.storage.SharedMemoryStorage`).
+
+Examples
+--------
+>>> decomposition = Decomposition((128, 128, 80), (2, 2), periodic=(True, True))  # doctest: +SKIP
+>>> halo = required_halo([diffusion])  # doctest: +SKIP
+>>> u = DistributedStorage.from_array(u0, "numpy", decomposition, halo)  # doctest: +SKIP
+>>> with Executor(max_workers=4) as executor:  # doctest: +SKIP
+...     for step in range(n_steps):
+...         executor.exchange(u)
+...         executor.run(diffusion, u, u_new, alpha=0.1)
+...         u, u_new = u_new, u
+"""
+
+from .decomposition import Decomposition, DistributedStorage, HaloTransfer, required_halo
+from .executor import Executor
+from .transport import SharedMemoryTransport, Transport
+
+
+__all__ = [
+    "Decomposition",
+    "DistributedStorage",
+    "Executor",
+    "HaloTransfer",
+    "SharedMemoryTransport",
+    "Transport",
+    "required_halo",
+]
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gt4py import backend as gt_backend
+from gt4py import storage as gt_storage
+
+
+#: Lower and upper halo width of the three dimensions
+Halo = Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]
+
+#: Index of a region of a (subdomain) storage
+Index = Tuple[slice, ...]
+
+
+def _split(size: int, parts: int) -> List[Tuple[int, int]]:
+    return [(size * part // parts, size * (part + 1) // parts) for part in range(parts)]
+
+
+def required_halo(stencils: Iterable, fields: Optional[Iterable[str]] = None) -> Halo:
+    """Largest halo accessed by the stencils (in `field_info[...].boundary`) of any of the fields.
+
+    Parameters
+    ----------
+    stencils: iterable of :class:`gt4py.StencilObject`
+        Stencils which access the fields.
+    fields: iterable of str, optional
+        Only consider the fields with these names (default: all fields).
+    """
+    halo = [[0, 0], [0, 0], [0, 0]]
+    for stencil in stencils:
+        for name, info in stencil.field_info.items():
+            if info is None or (fields is not None and name not in fields):
+                continue
+            for dim, (lower, upper) in enumerate(info.boundary):
+                halo[dim][0] = max(halo[dim][0], lower)
+                halo[dim][1] = max(halo[dim][1], upper)
+    return tuple((lower, upper) for lower, upper in halo)
+
+
+class HaloTransfer(NamedTuple):
+    """Copy of the region `src_index` of subdomain `src_rank` to `dst_index` of `dst_rank`."""
+
+    src_rank: int
+    dst_rank: int
+    src_index: Index
+    dst_index: Index
+
+
+class Decomposition:
+    """Split of a 3-D domain into a grid of subdomains along the horizontal dimensions.
+
+    Subdomains are numbered in I-major order, i.e. ``rank = j_block * layout[0] + i_block``.
+
+    Parameters
+    ----------
+    domain: tuple of ints
+        Global (compute) domain size.
+    layout: tuple of ints
+        Number of subdomains along I and J.
+    periodic: tuple of bools
+        Whether the domain wraps around along I and J.
+    """
+
+    def __init__(
+        self,
+        domain: Sequence[int],
+        layout: Sequence[int],
+        periodic: Sequence[bool] = (False, False),
+    ):
+        if len(domain) != 3 or len(layout) != 2 or len(periodic) != 2:
+            raise ValueError("Decompositions require a 3-D domain split along I and J.")
+        if any(parts < 1 or parts > size for parts, size in zip(layout, domain)):
+            raise ValueError(f"Invalid layout {tuple(layout)} for domain {tuple(domain)}.")
+        self.domain = tuple(int(size) for size in domain)
+        self.layout = tuple(int(parts) for parts in layout)
+        self.periodic = tuple(bool(wraps) for wraps in periodic)
+        self._bounds = [_split(size, parts) for size, parts in zip(self.domain, self.layout)]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(domain={self.domain}, layout={self.layout}, "
+            f"periodic={self.periodic})"
+        )
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Decomposition)
+            and (
+                self.domain,
+                self.layout,
+                self.periodic,
+            )
+            == (other.domain, other.layout, other.periodic)
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of subdomains."""
+        return self.layout[0] * self.layout[1]
+
+    def block(self, rank: int) -> Tuple[int, int]:
+        """Position of subdomain `rank` in the grid of subdomains."""
+        return rank % self.layout[0], rank // self.layout[0]
+
+    def rank(self, block: Sequence[int]) -> Optional[int]:
+        """Rank of the subdomain at `block` (wrapped if periodic, `None` outside the domain)."""
+        position = list(block)
+        for dim in range(2):
+            if self.periodic[dim]:
+                position[dim] %= self.layout[dim]
+            elif not 0 <= position[dim] < self.layout[dim]:
+                return None
+        return position[1] * self.layout[0] + position[0]
+
+    def bounds(self, rank: int) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]:
+        """Global index range of subdomain `rank` along I, J and K."""
+        block = self.block(rank)
+        return self._bounds[0][block[0]], self._bounds[1][block[1]], (0, self.domain[2])
+
+    def shape(self, rank: int) -> Tuple[int, int, int]:
+        """Compute domain size of subdomain `rank`."""
+        return tuple(stop - start for start, stop in self.bounds(rank))
+
+    def halo_transfers(self, halo: Halo) -> List[List[HaloTransfer]]:
+        """Transfers filling the horizontal halos of all subdomains, in two phases.
+
+        The I halos are filled first, then the J halos including the I halo regions, so
+        that the corners are exchanged as well. Transfers of a phase are independent and
+        a phase may only start when the previous one is completed.
+        """
+        phases: List[List[HaloTransfer]] = [[], []]
+        for rank in range(self.size):
+            block = self.block(rank)
+            shape = self.shape(rank)
+            for dim in range(2):
+                lower, upper = halo[dim]
+                for direction, width in ((-1, lower), (1, upper)):
+                    neighbor_block = list(block)
+                    neighbor_block[dim] += direction
+                    neighbor = self.rank(neighbor_block)
+                    if not width or neighbor is None:
+                        continue
+                    neighbor_size = self.shape(neighbor)[dim]
+                    if width > neighbor_size:
+                        raise ValueError(
+                            f"Halo width {width} exceeds the size {neighbor_size} of subdomain "
+                            f"{neighbor} along dimension {dim}."
+                        )
+                    if direction < 0:
+                        dst = slice(0, lower)
+                        src = slice(neighbor_size, neighbor_size + lower)
+                    else:
+                        dst = slice(lower + shape[dim], lower + shape[dim] + upper)
+                        src = slice(lower, lower + upper)
+                    if dim == 0:
+                        # interior rows only, the corners are filled in the second phase
+                        rows = slice(halo[1][0], halo[1][0] + shape[1])
+                        src_index, dst_index = (src, rows, slice(None)), (dst, rows, slice(None))
+                    else:
+                        src_index, dst_index = (slice(None), src), (slice(None), dst)
+                    phases[dim].append(HaloTransfer(neighbor, rank, src_index, dst_index))
+        return phases
+
+
+class DistributedStorage:
+    """Field distributed over the subdomains of a :class:`Decomposition`.
+
+    Holds one storage per subdomain, with the compute domain of the subdomain plus `halo`
+    points and the default origin at the first compute point. For CPU backends, the
+    storages are allocated in shared memory so they can be passed to worker processes
+    without copying.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        decomposition: Decomposition,
+        halo: Halo,
+        dtype,
+        *,
+        shared_memory: Optional[bool] = None,
+    ):
+        if shared_memory is None:
+            shared_memory = gt_backend.from_name(backend).storage_info["device"] == "cpu"
+        self.backend = backend
+        self.decomposition = decomposition
+        self.halo = tuple((int(lower), int(upper)) for lower, upper in halo)
+        self.dtype = np.dtype(dtype)
+        self._halo_transfers: Optional[List[List[HaloTransfer]]] = None
+        default_origin = tuple(lower for lower, _ in self.halo)
+        self.storages = []
+        for rank in range(decomposition.size):
+            storage = gt_storage.empty(
+                backend,
+                default_origin,
+                self.local_shape(rank),
+                self.dtype,
+                shared_memory=shared_memory,
+            )
+            storage[...] = 0
+            self.storages.append(storage)
+
+    @classmethod
+    def from_array(
+        cls, data, backend: str, decomposition: Decomposition, halo: Halo, **kwargs
+    ) -> "DistributedStorage":
+        """Create a distributed storage and scatter the global (compute domain) `data` into it."""
+        data = np.asarray(data)
+        result = cls(backend, decomposition, halo, kwargs.pop("dtype", data.dtype), **kwargs)
+        result.scatter(data)
+        return result
+
+    def __getitem__(self, rank: int):
+        return self.storages[rank]
+
+    def __len__(self) -> int:
+        return len(self.storages)
+
+    def local_shape(self, rank: int) -> Tuple[int, int, int]:
+        """Shape of the storage of subdomain `rank` (compute domain and halo)."""
+        return tuple(
+            size + lower + upper
+            for size, (lower, upper) in zip(self.decomposition.shape(rank), self.halo)
+        )
+
+    def _interior(self, rank: int) -> Index:
+        return tuple(
+            slice(lower, lower + size)
+            for size, (lower, _) in zip(self.decomposition.shape(rank), self.halo)
+        )
+
+    def scatter(self, data) -> None:
+        """Copy the global compute domain `data` to the compute domains of the subdomains."""
+        data = np.asarray(data)
+        if data.shape != self.decomposition.domain:
+            raise ValueError(
+                f"Data of shape {data.shape} does not match the domain {self.decomposition.domain}."
+            )
+        for rank, storage in enumerate(self.storages):
+            global_index = tuple(slice(*bounds) for bounds in self.decomposition.bounds(rank))
+            storage[self._interior(rank)] = data[global_index]
+
+    def gather(self) -> np.ndarray:
+        """Return the global compute domain as a :class:`numpy.ndarray`."""
+        result = np.empty(self.decomposition.domain, dtype=self.dtype)
+        for rank, storage in enumerate(self.storages):
+            storage.device_to_host()
+            global_index = tuple(slice(*bounds) for bounds in self.decomposition.bounds(rank))
+            result[global_index] = storage.view(np.ndarray)[self._interior(rank)]
+        return result
+
+    def halo_transfers(self) -> List[List[HaloTransfer]]:
+        if self._halo_transfers is None:
+            self._halo_transfers = self.decomposition.halo_transfers(self.halo)
+        return self._halo_transfers
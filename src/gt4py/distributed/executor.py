@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import concurrent.futures
+from typing import Any, Dict, Optional, Tuple
+
+from gt4py import utils as gt_utils
+from gt4py.storage.storage import SharedMemoryStorage
+
+from .decomposition import Decomposition, DistributedStorage
+from .transport import SharedMemoryTransport, Transport
+
+
+class _StencilReference:
+    """Picklable reference to a generated stencil, loaded from its module file by workers."""
+
+    def __init__(self, stencil):
+        stencil_class = type(stencil)
+        self.class_name = stencil_class.__name__
+        self.module_name = stencil_class.__module__
+        self.file_name = stencil_class._file_name
+        self.gt_id = stencil_class._gt_id_
+
+    def load(self):
+        stencil = _loaded_stencils.get(self.file_name, None)
+        if stencil is None:
+            module = gt_utils.make_module_from_file(self.class_name, self.file_name)
+            stencil_class = getattr(module, self.class_name)
+            stencil_class.__module__ = self.module_name
+            stencil_class._gt_id_ = self.gt_id
+            stencil_class._file_name = self.file_name
+            stencil = _loaded_stencils[self.file_name] = stencil_class()
+        return stencil
+
+
+#: Stencils loaded by the current (worker) process by module file name
+_loaded_stencils: Dict[str, Any] = {}
+
+
+def _run_subdomain(stencil_reference: _StencilReference, args: Tuple, kwargs: Dict) -> None:
+    stencil_reference.load()(*args, **kwargs)
+
+
+class Executor:
+    """Run stencils on all subdomains of distributed storages in parallel worker processes.
+
+    Parameters
+    ----------
+    max_workers: int, optional
+        Number of worker processes (default: number of CPUs).
+    transport: :class:`Transport`, optional
+        Used by :meth:`exchange`, by default a :class:`SharedMemoryTransport` executing the
+        transfers in the worker processes.
+    mp_context: optional
+        `multiprocessing` context used to start the workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        transport: Optional[Transport] = None,
+        mp_context=None,
+    ):
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=mp_context)
+        self.transport = transport if transport is not None else SharedMemoryTransport(self._pool)
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._pool.shutdown()
+
+    def exchange(self, *fields: DistributedStorage) -> None:
+        """Fill the halos of the subdomain storages of `fields` from their neighbors."""
+        self.transport.exchange(fields)
+
+    def run(self, stencil, *args, **kwargs) -> None:
+        """Call `stencil` on the compute domain of every subdomain, in parallel.
+
+        :class:`DistributedStorage` arguments are replaced by their subdomain storages,
+        all other arguments are passed unchanged. The stencil has to be generated with a
+        CPU backend to run in the worker processes, otherwise the subdomains are computed
+        one after another by the calling process.
+        """
+        if "domain" in kwargs or "origin" in kwargs:
+            raise ValueError("The domain and origin of distributed stencil calls are implicit.")
+        decompositions = [
+            arg.decomposition
+            for arg in (*args, *kwargs.values())
+            if isinstance(arg, DistributedStorage)
+        ]
+        if not decompositions:
+            raise ValueError("Distributed stencil calls require distributed storage arguments.")
+        decomposition: Decomposition = decompositions[0]
+        if any(other != decomposition for other in decompositions[1:]):
+            raise ValueError("All distributed storages must have the same decomposition.")
+
+        def local(arg, rank):
+            return arg[rank] if isinstance(arg, DistributedStorage) else arg
+
+        calls = [
+            (
+                tuple(local(arg, rank) for arg in args),
+                {
+                    name: local(arg, rank)
+                    for name, arg in {**kwargs, "domain": decomposition.shape(rank)}.items()
+                },
+            )
+            for rank in range(decomposition.size)
+        ]
+        in_shared_memory = all(
+            isinstance(storage, SharedMemoryStorage)
+            for arg in (*args, *kwargs.values())
+            if isinstance(arg, DistributedStorage)
+            for storage in arg.storages
+        )
+        if not in_shared_memory:
+            for call_args, call_kwargs in calls:
+                stencil(*call_args, **call_kwargs)
+            return
+
+        reference = _StencilReference(stencil)
+        futures = [
+            self._pool.submit(_run_subdomain, reference, call_args, call_kwargs)
+            for call_args, call_kwargs in calls
+        ]
+        for future in futures:
+            future.result()
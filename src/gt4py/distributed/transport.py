@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import abc
+import concurrent.futures
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gt4py.storage.storage import SharedMemoryStorage
+
+from .decomposition import HaloTransfer
+
+
+if TYPE_CHECKING:
+    from .decomposition import DistributedStorage
+
+
+class Transport(abc.ABC):
+    """Exchange the halos of distributed storages.
+
+    Implementations execute the transfers returned by
+    :meth:`DistributedStorage.halo_transfers`, phase by phase. A message passing transport
+    (e.g. MPI, with one subdomain per process) would only post the sends and receives of
+    the transfers involving the subdomains whose storages are available locally.
+    """
+
+    @abc.abstractmethod
+    def exchange(self, fields: Sequence["DistributedStorage"]) -> None:
+        pass
+
+
+def _copy_transfers(transfers: Sequence[Tuple[HaloTransfer, np.ndarray, np.ndarray]]) -> None:
+    for transfer, src, dst in transfers:
+        dst[transfer.dst_index] = src[transfer.src_index]
+
+
+class SharedMemoryTransport(Transport):
+    """Copy halos directly between subdomain storages mapped by all processes.
+
+    Parameters
+    ----------
+    executor: :class:`concurrent.futures.Executor`, optional
+        The transfers into each subdomain are executed as a separate task of this (process
+        pool) executor, which requires storages in shared memory. Without executor, all
+        transfers are executed by the calling thread.
+    """
+
+    def __init__(self, executor: Optional[concurrent.futures.Executor] = None):
+        self.executor = executor
+
+    def exchange(self, fields: Sequence["DistributedStorage"]) -> None:
+        for phase in range(2):
+            transfers_by_rank: Dict[int, List[Tuple[HaloTransfer, np.ndarray, np.ndarray]]] = {}
+            for field in fields:
+                for transfer in field.halo_transfers()[phase]:
+                    transfers_by_rank.setdefault(transfer.dst_rank, []).append(
+                        (transfer, field[transfer.src_rank], field[transfer.dst_rank])
+                    )
+            in_shared_memory = all(
+                isinstance(storage, SharedMemoryStorage)
+                for field in fields
+                for storage in field.storages
+            )
+            if self.executor is None or not in_shared_memory or len(transfers_by_rank) < 2:
+                for transfers in transfers_by_rank.values():
+                    _copy_transfers(transfers)
+            else:
+                # every task only writes to the halos of its subdomain
+                futures = [
+                    self.executor.submit(_copy_transfers, transfers)
+                    for transfers in transfers_by_rank.values()
+                ]
+                for future in futures:
+                    future.result()
@@ -185,6 +185,12 @@ class StencilObject(abc.ABC):
                     RuntimeWarning,
                 )
 
+            if self.field_info[name].access == AccessKind.READ_WRITE and not field.flags.writeable:
+                raise ValueError(
+                    f"Field '{name}' is written by the stencil but the passed array is read-only "
+                    "(e.g. a broadcast view)."
+                )
+
             field_dtype = self.field_info[name].dtype
             if not field.dtype == field_dtype:
                 raise TypeError(
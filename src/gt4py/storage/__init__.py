@@ -17,7 +17,9 @@
 """GridTools storages classes."""
 
 
-from .storage import Storage, empty, from_array, ones, zeros
+from .accounting import memory_report, memory_tag, track_high_water_mark
+from .allocators import memory_pool
+from .storage import Storage, empty, from_array, from_file, ones, zeros
 
 
 _numpy_patch = None
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Accounting of the memory allocated for storages and stencil temporaries.
+
+When enabled through ``gt4py.config.storage_settings["memory_accounting"]`` (or
+``GT_STORAGE_MEMORY_ACCOUNTING=1``), every storage created through the :mod:`gt4py.storage`
+API and every temporary field allocated by the NumPy backend is recorded (size including
+padding, backend, creation site and an optional tag) while its memory is alive. The hooks
+cost a weak reference and a few frame lookups per allocation. NumPy stencils only record
+their temporaries if accounting was enabled when they were generated.
+
+Examples
+--------
+>>> with memory_tag("dycore"):  # doctest: +SKIP
+...     u = gt4py.storage.zeros(backend, origin, shape, dtype)
+>>> with track_high_water_mark() as tracker:  # doctest: +SKIP
+...     step(state)
+>>> print(tracker.peak_bytes, memory_report())  # doctest: +SKIP
+"""
+
+import collections
+import contextlib
+import os
+import sys
+import threading
+import weakref
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from gt4py import config as gt_config
+
+
+_GT4PY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class AllocationRecord(NamedTuple):
+    #: Sequence number of the allocation (see :func:`memory_snapshot`)
+    serial: int
+    #: ``"storage"`` or ``"temporary"``
+    kind: str
+    #: Size in bytes including padding
+    nbytes: int
+    backend: Optional[str]
+    #: ``"file:line (function)"`` of the first caller outside of GT4Py, or the stencil name
+    site: str
+    tag: Optional[str]
+
+
+class MemoryReportEntry(NamedTuple):
+    kind: str
+    backend: Optional[str]
+    site: str
+    tag: Optional[str]
+    count: int
+    nbytes: int
+
+
+class MemoryReport(NamedTuple):
+    bytes_in_use: int
+    peak_bytes: int
+    #: Live allocations grouped by kind, backend, creation site and tag (largest first)
+    entries: List[MemoryReportEntry]
+
+    def __str__(self) -> str:
+        lines = [
+            f"GT4Py memory in use: {_format_bytes(self.bytes_in_use)} "
+            f"(peak: {_format_bytes(self.peak_bytes)})"
+        ]
+        for entry in self.entries:
+            tag = f" [{entry.tag}]" if entry.tag else ""
+            lines.append(
+                f"  {_format_bytes(entry.nbytes):>10} {entry.count:>6}x {entry.kind:<9} "
+                f"{entry.backend or '':<16} {entry.site}{tag}"
+            )
+        return "\n".join(lines)
+
+
+def _format_bytes(nbytes: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(nbytes) < 1024 or unit == "GiB":
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return ""
+
+
+class HighWaterMark:
+    """Largest amount of memory in use while the tracker is active."""
+
+    def __init__(self, bytes_in_use: int):
+        self.start_bytes = bytes_in_use
+        self.peak_bytes = bytes_in_use
+
+    @property
+    def increase_bytes(self) -> int:
+        """Peak memory in use relative to the start of the tracking."""
+        return self.peak_bytes - self.start_bytes
+
+
+class _BufferRef(weakref.ref):
+    __slots__ = ("key",)
+
+
+class _Registry:
+    def __init__(self) -> None:
+        # weak reference callbacks may run from the garbage collector while the lock is held
+        self._lock = threading.RLock()
+        self._records: Dict[int, AllocationRecord] = {}
+        self._refs: Dict[int, _BufferRef] = {}
+        self._serial = 0
+        self.bytes_in_use = 0
+        self.peak_bytes = 0
+        self.trackers: List[HighWaterMark] = []
+
+    def register(self, buffer: Any, kind: str, nbytes: int, backend, site: str, tag) -> None:
+        with self._lock:
+            key = self._serial + 1
+            try:
+                ref = _BufferRef(buffer, self._release)
+            except TypeError:
+                # e.g. device buffers without weak reference support are not accounted
+                return
+            ref.key = key
+            self._refs[key] = ref
+            self._serial = key
+            self._records[key] = AllocationRecord(key, kind, nbytes, backend, site, tag)
+            self.bytes_in_use += nbytes
+            if self.bytes_in_use > self.peak_bytes:
+                self.peak_bytes = self.bytes_in_use
+            for tracker in self.trackers:
+                if self.bytes_in_use > tracker.peak_bytes:
+                    tracker.peak_bytes = self.bytes_in_use
+
+    def _release(self, ref: _BufferRef) -> None:
+        with self._lock:
+            record = self._records.pop(ref.key, None)
+            self._refs.pop(ref.key, None)
+            if record is not None:
+                self.bytes_in_use -= record.nbytes
+
+    def records(self, since: int = 0) -> List[AllocationRecord]:
+        with self._lock:
+            return [record for record in self._records.values() if record.serial > since]
+
+    def set_tag(self, buffer: Any, tag: Optional[str]) -> bool:
+        with self._lock:
+            for key, ref in self._refs.items():
+                if ref() is buffer:
+                    self._records[key] = self._records[key]._replace(tag=tag)
+                    return True
+        return False
+
+    @property
+    def serial(self) -> int:
+        return self._serial
+
+
+_registry = _Registry()
+_tags = threading.local()
+
+
+def _creation_site() -> str:
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_GT4PY_PATH):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def _current_tag() -> Optional[str]:
+    stack = getattr(_tags, "stack", None)
+    return stack[-1] if stack else None
+
+
+def register_storage(storage) -> None:
+    """Record the raw buffer of a newly allocated storage (called by the storage constructor)."""
+    if not gt_config.storage_settings["memory_accounting"]:
+        return
+    raw_buffer = storage._raw_buffer
+    _registry.register(
+        raw_buffer, "storage", raw_buffer.nbytes, storage.backend, _creation_site(), _current_tag()
+    )
+
+
+def register_temporary(array, stencil_name: str, field_name: str) -> None:
+    """Record a temporary field allocated by a generated stencil (called from the stencil)."""
+    if not gt_config.storage_settings["memory_accounting"]:
+        return
+    _registry.register(
+        array, "temporary", array.nbytes, None, f"{stencil_name}: {field_name}", _current_tag()
+    )
+
+
+def set_tag(storage, tag: Optional[str]) -> None:
+    """Tag the memory of a storage (e.g. with the name of the field) in the memory report."""
+    if not _registry.set_tag(storage._raw_buffer, tag):
+        raise ValueError("The memory of the storage is not accounted for.")
+
+
+@contextlib.contextmanager
+def memory_tag(tag: str) -> Iterator[None]:
+    """Tag the memory allocated in the (thread-local) context in the memory report."""
+    if not hasattr(_tags, "stack"):
+        _tags.stack = []
+    _tags.stack.append(tag)
+    try:
+        yield
+    finally:
+        _tags.stack.pop()
+
+
+@contextlib.contextmanager
+def track_high_water_mark() -> Iterator[HighWaterMark]:
+    """Record the peak memory in use (by all threads) while the context is active."""
+    with _registry._lock:
+        tracker = HighWaterMark(_registry.bytes_in_use)
+        _registry.trackers.append(tracker)
+    try:
+        yield tracker
+    finally:
+        with _registry._lock:
+            _registry.trackers.remove(tracker)
+
+
+def memory_snapshot() -> int:
+    """Marker for reporting only the allocations made afterwards (e.g. to find leaks)."""
+    return _registry.serial
+
+
+def memory_in_use() -> int:
+    """Bytes currently allocated for storages and temporaries."""
+    return _registry.bytes_in_use
+
+
+def memory_report(since: Optional[int] = None) -> MemoryReport:
+    """Report the live allocations grouped by kind, backend, creation site and tag.
+
+    Parameters
+    ----------
+    since: int, optional
+        Only report allocations made after the :func:`memory_snapshot` returning `since`
+        which are still alive, e.g. storages leaked by a time step.
+    """
+    groups: Dict[tuple, List[int]] = collections.defaultdict(lambda: [0, 0])
+    for record in _registry.records(since or 0):
+        group = groups[(record.kind, record.backend, record.site, record.tag)]
+        group[0] += 1
+        group[1] += record.nbytes
+    entries = sorted(
+        (MemoryReportEntry(*key, count, nbytes) for key, (count, nbytes) in groups.items()),
+        key=lambda entry: entry.nbytes,
+        reverse=True,
+    )
+    return MemoryReport(
+        bytes_in_use=_registry.bytes_in_use, peak_bytes=_registry.peak_bytes, entries=entries
+    )
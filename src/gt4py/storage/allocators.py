@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Allocators of the raw 1-D buffers underlying CPU storages.
+
+:func:`gt4py.storage.utils.allocate_cpu` requests its (over-allocated) raw buffer from the
+active allocator, which by default is plain :func:`numpy.empty`. A :class:`PoolAllocator`
+recycles buffers of released storages instead; it is enabled globally through
+``gt4py.config.storage_settings["memory_pool"]`` or scoped with :func:`memory_pool`.
+Buffers of a :class:`SharedMemoryAllocator` live in named shared memory segments, which
+other processes can attach to.
+"""
+
+import contextlib
+import threading
+import weakref
+from collections import defaultdict
+from multiprocessing import shared_memory
+from typing import Any, DefaultDict, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+from gt4py import config as gt_config
+
+
+#: Smallest size class in bytes
+MIN_BLOCK_SIZE = 64
+
+
+def size_class(nbytes: int) -> int:
+    """Round up to one of four size classes per power of two (at most 25% overhead)."""
+    if nbytes <= MIN_BLOCK_SIZE:
+        return MIN_BLOCK_SIZE
+    step = 1 << ((nbytes - 1).bit_length() - 3)
+    return -(-nbytes // step) * step
+
+
+class NumPyAllocator:
+    """Allocate every buffer with :func:`numpy.empty`."""
+
+    def empty(self, size: int, dtype: np.dtype) -> np.ndarray:
+        return np.empty(size, dtype)
+
+
+class MemoryMapAllocator:
+    """Allocate buffers backed by a file through :class:`numpy.memmap`.
+
+    Parameters
+    ----------
+    path: str or path-like
+        File containing the raw buffer (including padding) of the storage.
+    mode: str
+        ``"r"``, ``"r+"``, ``"w+"`` or ``"c"``, see :class:`numpy.memmap`.
+    """
+
+    def __init__(self, path, mode: str = "r+"):
+        self.path = path
+        self.mode = mode
+
+    def empty(self, size: int, dtype: np.dtype) -> np.ndarray:
+        return np.memmap(self.path, dtype=dtype, mode=self.mode, shape=(size,))
+
+
+class SharedMemoryAllocator:
+    """Allocate every buffer in a new :class:`multiprocessing.shared_memory.SharedMemory` segment.
+
+    The segment is unlinked when the buffer (and all views of it) is garbage collected in the
+    creating process. Other processes can map the same memory with :meth:`attach` as long
+    as the segment exists.
+    """
+
+    def __init__(self):
+        # finalizers may run from the garbage collector while the lock is held
+        self._lock = threading.RLock()
+        #: Names of the segments by the address of their buffer
+        self._segment_names: Dict[int, str] = {}
+
+    def empty(self, size: int, dtype: np.dtype) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        segment = shared_memory.SharedMemory(create=True, size=max(size * dtype.itemsize, 1))
+        return self._register(segment, dtype, size, unlink=True)
+
+    def attach(self, name: str, dtype: np.dtype) -> np.ndarray:
+        """Map the whole segment `name` created by another process (the segment is not unlinked)."""
+        dtype = np.dtype(dtype)
+        segment = shared_memory.SharedMemory(name=name)
+        return self._register(segment, dtype, segment.size // dtype.itemsize, unlink=False)
+
+    def segment_name(self, buffer: np.ndarray) -> Optional[str]:
+        """Name of the segment starting at the first element of `buffer` (`None` if unknown)."""
+        with self._lock:
+            return self._segment_names.get(buffer.ctypes.data)
+
+    def _register(
+        self, segment: shared_memory.SharedMemory, dtype: np.dtype, size: int, *, unlink: bool
+    ) -> np.ndarray:
+        buffer = np.frombuffer(segment.buf, dtype=dtype, count=size)
+        address = buffer.ctypes.data
+        with self._lock:
+            self._segment_names[address] = segment.name
+        weakref.finalize(buffer, self._release, segment, address, unlink)
+        return buffer
+
+    def _release(self, segment: shared_memory.SharedMemory, address: int, unlink: bool) -> None:
+        with self._lock:
+            self._segment_names.pop(address, None)
+        segment.close()
+        if unlink:
+            segment.unlink()
+
+
+class MemoryPoolStats(NamedTuple):
+    #: Bytes of the blocks currently handed out (rounded up to the size class)
+    bytes_in_use: int
+    #: Bytes of the released blocks kept for reuse
+    bytes_pooled: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class PoolAllocator:
+    """Recycle the raw buffers of garbage-collected storages, grouped in size classes.
+
+    Buffers are numpy views of pooled blocks through an intermediate :class:`memoryview`,
+    so numpy does not collapse the base of derived views beyond the buffer: the block is
+    returned to the pool only when no view of its memory is alive any more.
+
+    Parameters
+    ----------
+    max_pooled_bytes: int, optional
+        Released blocks exceeding this total are freed instead of being pooled.
+    """
+
+    def __init__(self, max_pooled_bytes: Optional[int] = None):
+        self.max_pooled_bytes = max_pooled_bytes
+        self._free_blocks: DefaultDict[int, List[np.ndarray]] = defaultdict(list)
+        # finalizers may run from the garbage collector while the lock is held
+        self._lock = threading.RLock()
+        self._closed = False
+        self._bytes_in_use = 0
+        self._bytes_pooled = 0
+        self._hits = 0
+        self._misses = 0
+
+    def empty(self, size: int, dtype: np.dtype) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        block_size = size_class(size * dtype.itemsize)
+        with self._lock:
+            free_blocks = self._free_blocks[block_size]
+            if free_blocks:
+                block = free_blocks.pop()
+                self._bytes_pooled -= block_size
+                self._hits += 1
+            else:
+                block = None
+                self._misses += 1
+            self._bytes_in_use += block_size
+        if block is None:
+            block = np.empty(block_size, dtype=np.uint8)
+
+        buffer = np.frombuffer(memoryview(block), dtype=dtype, count=size)
+        weakref.finalize(buffer, self._release, block)
+        return buffer
+
+    def _release(self, block: np.ndarray) -> None:
+        with self._lock:
+            self._bytes_in_use -= block.nbytes
+            if self._closed or (
+                self.max_pooled_bytes is not None
+                and self._bytes_pooled + block.nbytes > self.max_pooled_bytes
+            ):
+                return
+            self._free_blocks[block.nbytes].append(block)
+            self._bytes_pooled += block.nbytes
+
+    def clear(self) -> None:
+        """Free all pooled blocks (blocks in use are not affected)."""
+        with self._lock:
+            self._free_blocks.clear()
+            self._bytes_pooled = 0
+
+    def close(self) -> None:
+        """Free all pooled blocks and stop pooling blocks released in the future."""
+        with self._lock:
+            self._closed = True
+            self.clear()
+
+    @property
+    def stats(self) -> MemoryPoolStats:
+        with self._lock:
+            return MemoryPoolStats(
+                bytes_in_use=self._bytes_in_use,
+                bytes_pooled=self._bytes_pooled,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+
+_numpy_allocator = NumPyAllocator()
+shared_memory_allocator = SharedMemoryAllocator()
+_global_pool: Optional[PoolAllocator] = None
+_scoped_allocators = threading.local()
+
+
+def get_allocator():
+    """Return the innermost scoped allocator or the globally configured one."""
+    global _global_pool
+
+    stack = getattr(_scoped_allocators, "stack", None)
+    if stack:
+        return stack[-1]
+    if not gt_config.storage_settings["memory_pool"]:
+        return _numpy_allocator
+    if _global_pool is None:
+        _global_pool = PoolAllocator(gt_config.storage_settings["memory_pool_max_bytes"])
+    return _global_pool
+
+
+@contextlib.contextmanager
+def scoped_allocator(allocator) -> Iterator[Any]:
+    """Allocate the CPU storages created in the (thread-local) context with `allocator`."""
+    if not hasattr(_scoped_allocators, "stack"):
+        _scoped_allocators.stack = []
+    _scoped_allocators.stack.append(allocator)
+    try:
+        yield allocator
+    finally:
+        _scoped_allocators.stack.remove(allocator)
+
+
+@contextlib.contextmanager
+def memory_pool(max_pooled_bytes: Optional[int] = None) -> Iterator[PoolAllocator]:
+    """Allocate the storages created in the (thread-local) context from a dedicated pool.
+
+    The pooled memory is freed when leaving the context, storages created inside remain valid.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import gt4py.storage
+    >>> with memory_pool() as pool:
+    ...     for step in range(3):
+    ...         tmp = gt4py.storage.empty("numpy", (0, 0, 0), (8, 8, 8), np.float64)
+    ...         del tmp
+    >>> pool.stats.hits, pool.stats.misses
+    (2, 1)
+    """
+    pool = PoolAllocator(max_pooled_bytes)
+    try:
+        with scoped_allocator(pool):
+            yield pool
+    finally:
+        pool.close()
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Checkpoint files holding many storages.
+
+A checkpoint file contains the raw data blocks of all fields, each starting at a multiple
+of :data:`BLOCK_ALIGNMENT` bytes and stored in the memory order of the saving backend,
+followed by a JSON header describing the fields (dtype, shape, mask, default origin,
+backend and layout) and a fixed-size trailer locating the header::
+
+    [block 0] [padding] [block 1] ... [JSON header] [header offset: u64] [header size: u64] [magic]
+
+Uncompressed blocks are loaded through a memory map of the file, i.e. copied once from
+the page cache into the new storages.
+
+Examples
+--------
+>>> save("state.gtckpt", {"u": u, "v": v}, strip_halo=True)  # doctest: +SKIP
+>>> fields = load("state.gtckpt", backend="gtmc")  # doctest: +SKIP
+"""
+
+import bz2
+import concurrent.futures
+import json
+import lzma
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .storage import Storage, empty, zeros
+
+
+MAGIC = b"GT4PYCKP"
+VERSION = 1
+
+#: Alignment of the data blocks in the file (in bytes)
+BLOCK_ALIGNMENT = 4096
+
+_TRAILER = struct.Struct(f"<QQ{len(MAGIC)}s")
+
+#: Factories of the (streaming) compressor and decompressor objects by compression name
+_CODECS: Dict[str, Tuple[Callable[[], Any], Callable[[], Any]]] = {
+    "zlib": (zlib.compressobj, zlib.decompressobj),
+    "bz2": (bz2.BZ2Compressor, bz2.BZ2Decompressor),
+    "lzma": (lzma.LZMACompressor, lzma.LZMADecompressor),
+}
+
+_writer: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+
+def _memory_order(storage: Storage) -> Tuple[int, ...]:
+    """Dimensions of `storage` from the largest to the smallest stride of the backend layout."""
+    layout = [index for index in storage.layout_map if index is not None]
+    return tuple(int(dim) for dim in np.argsort(layout, kind="stable"))
+
+
+def _region(storage: Storage, strip_halo: bool) -> Tuple[Tuple[int, int], ...]:
+    """Return the saved index range of each axis (without the `default_origin` halo if stripped)."""
+    if not strip_halo:
+        return tuple((0, size) for size in storage.shape)
+    return tuple(
+        (min(origin, size), max(size - origin, min(origin, size)))
+        for origin, size in zip(storage.default_origin, storage.shape)
+    )
+
+
+def _host_array(storage: Storage, region: Sequence[Tuple[int, int]], axes: Sequence[int]):
+    storage.device_to_host()
+    array = storage.view(np.ndarray)[tuple(slice(start, stop) for start, stop in region)]
+    return array.transpose(axes)
+
+
+def _contiguous_chunks(array: np.ndarray) -> Iterator[np.ndarray]:
+    """Split `array` along its leading dimensions into C-contiguous chunks (in order)."""
+    if array.flags.c_contiguous:
+        yield array
+    else:
+        for sub_array in array:
+            yield from _contiguous_chunks(sub_array)
+
+
+def _compression_of(
+    name: str, compression: Union[None, str, Mapping[str, Optional[str]]]
+) -> Optional[str]:
+    if isinstance(compression, Mapping):
+        compression = compression.get(name, None)
+    if compression is not None and compression not in _CODECS:
+        raise ValueError(f"Unknown compression '{compression}' (available: {', '.join(_CODECS)}).")
+    return compression
+
+
+def _write(path, blocks: List[Tuple[str, Dict[str, Any], np.ndarray]]) -> None:
+    tmp_path = f"{os.fspath(path)}.tmp"
+    fields = {}
+    with open(tmp_path, "wb") as f:
+        for name, info, array in blocks:
+            offset = -(-f.tell() // BLOCK_ALIGNMENT) * BLOCK_ALIGNMENT
+            f.write(b"\0" * (offset - f.tell()))
+            compressor = _CODECS[info["compression"]][0]() if info["compression"] else None
+            for chunk in _contiguous_chunks(array):
+                data = memoryview(chunk).cast("B")
+                f.write(compressor.compress(data) if compressor else data)
+            if compressor:
+                f.write(compressor.flush())
+            fields[name] = {**info, "offset": offset, "nbytes": f.tell() - offset}
+
+        header = json.dumps({"version": VERSION, "fields": fields}).encode()
+        header_offset = f.tell()
+        f.write(header)
+        f.write(_TRAILER.pack(header_offset, len(header), MAGIC))
+    os.replace(tmp_path, path)
+
+
+def save(
+    path,
+    fields: Mapping[str, Storage],
+    *,
+    strip_halo: bool = False,
+    compression: Union[None, str, Mapping[str, Optional[str]]] = None,
+    asynchronous: bool = False,
+) -> Optional[concurrent.futures.Future]:
+    """Write storages to a checkpoint file.
+
+    Parameters
+    ----------
+    path: str or path-like
+        The file is first written to ``<path>.tmp`` and renamed when complete.
+    fields: mapping
+        Storages by name.
+    strip_halo: bool
+        Do not save the halo points, assumed to be `default_origin` wide on both sides of
+        every dimension. The halo of loaded storages is filled with zeros.
+    compression: str or mapping, optional
+        ``"zlib"``, ``"bz2"`` or ``"lzma"`` for all fields, or per field name.
+    asynchronous: bool
+        Snapshot the data and write the file in a background thread, so the storages can
+        be modified right away. Files are written in the order of the calls.
+
+    Returns
+    -------
+    A :class:`concurrent.futures.Future` completing when the file is written if
+    `asynchronous`, otherwise `None`.
+    """
+    global _writer
+
+    blocks = []
+    for name, storage in fields.items():
+        if not isinstance(storage, Storage):
+            raise TypeError(f"Field '{name}' is not a storage.")
+        region = _region(storage, strip_halo)
+        axes = _memory_order(storage)
+        array = _host_array(storage, region, axes)
+        if asynchronous:
+            array = np.array(array, order="C")
+        info = {
+            "dtype": storage.dtype.str,
+            "shape": [int(size) for size in storage.shape],
+            "mask": [bool(m) for m in storage.mask],
+            "default_origin": [int(origin) for origin in storage.default_origin],
+            "backend": storage.backend,
+            "layout_map": list(storage.layout_map),
+            "axes": list(axes),
+            "region": [[int(start), int(stop)] for start, stop in region],
+            "compression": _compression_of(name, compression),
+        }
+        blocks.append((name, info, array))
+
+    if not asynchronous:
+        _write(path, blocks)
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="gt4py-storage-io"
+            )
+        return _writer.submit(_write, path, blocks)
+
+
+def read_header(path) -> Dict[str, Dict[str, Any]]:
+    """Return the descriptions of the fields stored in a checkpoint file by name."""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def _read_header(f) -> Dict[str, Dict[str, Any]]:
+    f.seek(-_TRAILER.size, os.SEEK_END)
+    header_offset, header_size, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+    if magic != MAGIC:
+        raise ValueError(f"'{f.name}' is not a GT4Py checkpoint file.")
+    f.seek(header_offset)
+    header = json.loads(f.read(header_size))
+    if header["version"] > VERSION:
+        raise ValueError(f"Unsupported checkpoint file version {header['version']}.")
+    return header["fields"]
+
+
+def load(path, backend: str, *, names: Optional[Sequence[str]] = None) -> Dict[str, Storage]:
+    """Read storages from a checkpoint file written by :func:`save`.
+
+    The storages are allocated for `backend` (which may differ from the saving backend)
+    with the shape, dtype, mask and default origin stored in the file.
+
+    Parameters
+    ----------
+    names: sequence of str, optional
+        Load only these fields (default: all fields).
+    """
+    with open(path, "rb") as f:
+        header = _read_header(f)
+        if names is not None:
+            missing = set(names) - set(header)
+            if missing:
+                raise KeyError(f"Fields {sorted(missing)} not found in '{path}'.")
+            header = {name: header[name] for name in names}
+        if not header:
+            return {}
+        file_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    result = {}
+    try:
+        # views of the map must be released before closing it, also if loading fails
+        with memoryview(file_map) as file_view:
+            for name, info in header.items():
+                dtype = np.dtype(info["dtype"])
+                region = [tuple(bounds) for bounds in info["region"]]
+                is_stripped = region != [(0, size) for size in info["shape"]]
+                storage = (zeros if is_stripped else empty)(
+                    backend,
+                    default_origin=info["default_origin"],
+                    shape=info["shape"],
+                    dtype=dtype,
+                    mask=info["mask"],
+                )
+                target = _host_array(storage, region, info["axes"])
+                with file_view[info["offset"] : info["offset"] + info["nbytes"]] as data:
+                    if info["compression"]:
+                        buffer = _CODECS[info["compression"]][1]().decompress(data)
+                    else:
+                        buffer = data
+                    target[...] = np.frombuffer(buffer, dtype=dtype, count=target.size).reshape(
+                        target.shape
+                    )
+                storage.host_to_device(force=True)
+                result[name] = storage
+    finally:
+        file_map.close()
+
+    return result
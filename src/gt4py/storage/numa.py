@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""NUMA-aware initialization of CPU storages.
+
+Linux places a memory page on the NUMA node of the thread which first writes to it. If a
+storage is initialized by a single thread, all its pages end up on one socket and the
+parallel loops of the multi-core backends running on the other sockets only get remote
+memory bandwidth. :func:`first_touch` initializes storages from several threads instead,
+partitioned like the OpenMP loops of the backends, and :func:`page_nodes` reports the
+resulting page placement.
+"""
+
+import concurrent.futures
+import ctypes
+import mmap
+import os
+import platform
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from gt4py import config as gt_config
+
+
+#: Storages smaller than this are always initialized by the calling thread
+FIRST_TOUCH_MIN_BYTES = 4 * 1024 * 1024
+
+_MOVE_PAGES_SYSCALLS = {"x86_64": 279, "aarch64": 239, "ppc64le": 301}
+
+
+def _partition(size: int, parts: int) -> List[Tuple[int, int]]:
+    """Split `range(size)` into `parts` contiguous chunks of (almost) equal size."""
+    return [(size * part // parts, size * (part + 1) // parts) for part in range(parts)]
+
+
+def _outermost_dim(storage) -> int:
+    """Dimension of `storage` with the largest stride according to the backend layout."""
+    layout = [index for index in storage.layout_map if index is not None]
+    return layout.index(min(layout))
+
+
+def first_touch(storage, value: Any, num_threads: Optional[int] = None) -> None:
+    """Assign `value` (a scalar or an array broadcastable to the storage) to `storage`.
+
+    Large CPU storages are split into contiguous chunks along the dimension with the
+    largest stride (the parallelized horizontal dimension of the multi-core backends, as
+    given by the layout map), and every chunk is written by a different thread pinned to
+    its share of the available CPUs, the same static partitioning as the OpenMP loops.
+
+    Parameters
+    ----------
+    num_threads: int, optional
+        Defaults to ``gt4py.config.storage_settings["first_touch_threads"]``, one thread
+        (or less) disables the parallel initialization.
+    """
+    from .storage import CPUStorage
+
+    if num_threads is None:
+        num_threads = gt_config.storage_settings["first_touch_threads"]
+    if (
+        num_threads <= 1
+        or not isinstance(storage, CPUStorage)
+        or storage.nbytes < FIRST_TOUCH_MIN_BYTES
+        or storage.ndim == 0
+    ):
+        storage[...] = value
+        return
+
+    array = storage.view(np.ndarray)
+    values = np.broadcast_to(value, array.shape)
+    dim = _outermost_dim(storage)
+    chunks = [
+        (start, stop)
+        for start, stop in _partition(array.shape[dim], min(num_threads, array.shape[dim]))
+        if stop > start
+    ]
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+
+    def touch(chunk_index: int) -> None:
+        start, stop = chunks[chunk_index]
+        index = (slice(None),) * dim + (slice(start, stop),)
+        cpu_start, cpu_stop = _partition(len(cpus), len(chunks))[chunk_index]
+        pinned = cpu_stop > cpu_start
+        if pinned:
+            os.sched_setaffinity(0, cpus[cpu_start:cpu_stop])
+        try:
+            # numpy releases the GIL while copying
+            array[index] = values[index]
+        finally:
+            if pinned:
+                os.sched_setaffinity(0, cpus)
+
+    with concurrent.futures.ThreadPoolExecutor(len(chunks)) as executor:
+        for future in [executor.submit(touch, i) for i in range(len(chunks))]:
+            future.result()
+
+
+def page_nodes(array: np.ndarray) -> np.ndarray:
+    """NUMA node of every memory page spanned by `array` (Linux only).
+
+    Pages which have not been written to yet are reported as ``-errno.ENOENT``.
+    """
+    syscall = _MOVE_PAGES_SYSCALLS.get(platform.machine())
+    if platform.system() != "Linux" or syscall is None:
+        raise NotImplementedError("Page placement can only be queried on Linux.")
+
+    array = np.asarray(array)
+    bounds = np.byte_bounds(array)
+    first_page = bounds[0] - bounds[0] % mmap.PAGESIZE
+    num_pages = max(-(-(bounds[1] - first_page) // mmap.PAGESIZE), 1)
+    pages = (ctypes.c_void_p * num_pages)(
+        *range(first_page, first_page + num_pages * mmap.PAGESIZE, mmap.PAGESIZE)
+    )
+    status = (ctypes.c_int * num_pages)()
+    libc = ctypes.CDLL(None, use_errno=True)
+    # move_pages(pid, count, pages, nodes=NULL, status, flags) only queries the placement
+    if libc.syscall(syscall, 0, ctypes.c_ulong(num_pages), pages, None, status, 0) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return np.ctypeslib.as_array(status).copy()
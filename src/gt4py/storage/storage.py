@@ -14,6 +14,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import contextlib
+
 import numpy as np
 
 
@@ -24,21 +26,58 @@ except ImportError:
 
 from gt4py import backend as gt_backend
 
+from . import accounting, allocators, numa
 from . import utils as storage_utils
 
 
-def empty(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
+def empty(
+    backend,
+    default_origin,
+    shape,
+    dtype,
+    mask=None,
+    *,
+    managed_memory=False,
+    path=None,
+    mode="w+",
+    shared_memory=False,
+):
+    if path is not None and shared_memory:
+        raise ValueError("A storage can not be both file-backed and in shared memory.")
     if gt_backend.from_name(backend).storage_info["device"] == "gpu":
+        if path is not None:
+            raise ValueError("File-backed storages are only supported for CPU backends.")
+        if shared_memory:
+            raise ValueError("Shared memory storages are only supported for CPU backends.")
         if managed_memory:
             storage_t = GPUStorage
         else:
             storage_t = ExplicitlySyncedGPUStorage
+    elif shared_memory:
+        storage_t = SharedMemoryStorage
     else:
         storage_t = CPUStorage
 
-    return storage_t(
-        shape=shape, dtype=dtype, backend=backend, default_origin=default_origin, mask=mask
+    allocation_context = (
+        allocators.scoped_allocator(allocators.MemoryMapAllocator(path, mode))
+        if path is not None
+        else contextlib.nullcontext()
     )
+    with allocation_context:
+        return storage_t(
+            shape=shape, dtype=dtype, backend=backend, default_origin=default_origin, mask=mask
+        )
+
+
+def from_file(backend, default_origin, shape, dtype, mask=None, *, path, mode="r+"):
+    """Open a storage backed by a file created with `empty(..., path=path)`.
+
+    `backend`, `default_origin`, `shape`, `dtype` and `mask` have to be the same as used
+    for creating the file, since the file contains the padded and aligned raw buffer.
+    """
+    if mode not in ("r", "r+", "c"):
+        raise ValueError(f"Invalid mode '{mode}' for opening an existing storage file.")
+    return empty(backend, default_origin, shape, dtype, mask, path=path, mode=mode)
 
 
 def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=False):
@@ -50,7 +89,7 @@ def ones(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fal
         mask=mask,
         managed_memory=managed_memory,
     )
-    storage[...] = 1
+    numa.first_touch(storage, 1)
     return storage
 
 
@@ -63,13 +102,80 @@ def zeros(backend, default_origin, shape, dtype, mask=None, *, managed_memory=Fa
         mask=mask,
         managed_memory=managed_memory,
     )
-    storage[...] = 0
+    numa.first_touch(storage, 0)
     return storage
 
 
+def _wrap_array(data, backend, default_origin, shape, dtype, mask):
+    """Wrap a compatible CPU buffer in a storage without copying.
+
+    Returns the storage, or `None` and the reason why `data` can not be used directly.
+    """
+    storage_info = gt_backend.from_name(backend).storage_info
+    if storage_info["device"] != "cpu" or (cp is not None and isinstance(data, cp.ndarray)):
+        return None, "only host buffers can be used with CPU backends"
+    if not isinstance(data, np.ndarray) and not hasattr(data, "__array_interface__"):
+        try:
+            memoryview(data)
+        except TypeError:
+            return None, "data does not expose its memory as a buffer"
+    array = np.asarray(data)
+
+    if mask is None:
+        mask = [True] * array.ndim
+    if array.ndim != sum(mask):
+        return None, "number of dimensions does not match the mask"
+    if shape is not None and tuple(storage_utils.normalize_shape(shape, mask)) != array.shape:
+        return None, f"shape {array.shape} does not match the requested shape"
+    if dtype is not None and np.dtype(dtype) != array.dtype:
+        return None, f"dtype {array.dtype} does not match the requested dtype"
+
+    storage = CPUStorage._wrap(array, backend, default_origin, mask)
+    if not storage_info["is_compatible_layout"](storage):
+        return None, "strides are not compatible with the layout of the backend"
+
+    alignment_bytes = storage_info["alignment"] * array.itemsize
+    if alignment_bytes > 1:
+        layout_map = [index for index in storage.layout_map if index is not None]
+        innermost = int(np.argmax(layout_map)) if layout_map else None
+        origin_offset = sum(o * s for o, s in zip(storage.default_origin, array.strides))
+        if (array.ctypes.data + origin_offset) % alignment_bytes or any(
+            stride % alignment_bytes for dim, stride in enumerate(array.strides) if dim != innermost
+        ):
+            return None, f"data at the default origin is not aligned to {alignment_bytes} bytes"
+
+    return storage, None
+
+
 def from_array(
-    data, backend, default_origin, shape=None, dtype=None, mask=None, *, managed_memory=False
+    data,
+    backend,
+    default_origin,
+    shape=None,
+    dtype=None,
+    mask=None,
+    *,
+    managed_memory=False,
+    copy=True,
 ):
+    """Create a storage with the content of `data`.
+
+    With `copy=False`, `data` (a NumPy array or any object supporting the buffer protocol)
+    is wrapped without copying, which requires a CPU backend and matching dtype, shape,
+    layout and alignment; otherwise a `ValueError` is raised. With `copy="if_needed"`,
+    the data is only copied if it can not be wrapped.
+    """
+    if copy not in (True, False, "if_needed"):
+        raise ValueError(f"Invalid copy argument '{copy}', expected True, False or 'if_needed'.")
+    if copy is not True:
+        storage, reason = _wrap_array(data, backend, default_origin, shape, dtype, mask)
+        if storage is not None:
+            return storage
+        if copy is False:
+            raise ValueError(
+                f"Data can not be used as '{backend}' storage without a copy: {reason}."
+            )
+
     is_cupy_array = cp is not None and isinstance(data, cp.ndarray)
     xp = cp if is_cupy_array else np
     if shape is None:
@@ -91,7 +197,7 @@ def from_array(
         else:
             storage[...] = cp.asnumpy(data)
     else:
-        storage[...] = data
+        numa.first_touch(storage, data)
 
     return storage
 
@@ -144,10 +250,20 @@ class Storage(np.ndarray):
         obj._backend = backend
         obj.is_stencil_view = True
         obj._mask = mask
+        obj._init_layout_info(alignment, layout_map)
         obj._check_data()
+        accounting.register_storage(obj)
 
         return obj
 
+    def _init_layout_info(self, alignment, layout_map):
+        # precomputed once, since views inherit them and slicing must stay cheap
+        self._alignment = alignment
+        self._layout_map = tuple(layout_map)
+        self._layout_order = tuple(
+            int(dim) for dim in reversed(np.argsort([i for i in layout_map if i is not None]))
+        )
+
     @property
     def backend(self):
         """The backend identifier string of the storage."""
@@ -164,15 +280,22 @@ class Storage(np.ndarray):
 
     @property
     def layout_map(self):
-        return gt_backend.from_name(self.backend).storage_info["layout_map"](self.mask)
+        return self._layout_map
 
-    def transpose(self, *axes):
-        res = super().transpose(*axes)
-        if res._is_consistent(self):
-            res.is_stencil_view = self.is_stencil_view
-        else:
-            res.is_stencil_view = False
-        return res
+    @property
+    def is_stencil_view(self):
+        """Whether the storage can be passed to stencils.
+
+        For views with the shape of the viewed storage, the layout and alignment are only
+        checked on first access (e.g. when the view is passed to a stencil).
+        """
+        if self._is_stencil_view is None:
+            self._is_stencil_view = self._has_stencil_layout()
+        return self._is_stencil_view
+
+    @is_stencil_view.setter
+    def is_stencil_view(self, value):
+        self._is_stencil_view = value
 
     def __deepcopy__(self, memo={}):
         return self.copy()
@@ -205,36 +328,93 @@ class Storage(np.ndarray):
                         "Meta information can not be inferred when creating Storage views from other classes than Storage."
                     )
                 self.__dict__ = {**obj.__dict__, **self.__dict__}
-                self.is_stencil_view = False
                 if not hasattr(obj, "default_origin"):
-                    self.is_stencil_view = True
-                elif self._is_consistent(obj):
-                    self.is_stencil_view = obj.is_stencil_view
+                    self._is_stencil_view = True
+                elif self.shape != obj.shape or not obj.is_stencil_view:
+                    self._is_stencil_view = False
+                else:
+                    # deferred, see `is_stencil_view`
+                    self._is_stencil_view = None
                 self._finalize_view(obj)
 
     def _is_consistent(self, obj):
-        if not self.shape == obj.shape:
-            return False
+        return self.shape == obj.shape and self._has_stencil_layout()
+
+    def _has_stencil_layout(self):
         # check strides
-        stride = 0
-        if len(self.strides) < len(self.layout_map):
+        strides = self.strides
+        if len(strides) < len(self._layout_order):
             return False
-        for dim in reversed(np.argsort(self.layout_map)):
-            if self.strides[dim] < stride:
+        stride = 0
+        for dim in self._layout_order:
+            # broadcast dimensions (see `broadcast_to`) do not constrain the layout
+            if strides[dim] == 0:
+                continue
+            if strides[dim] < stride:
                 return False
-            stride = self.strides[dim]
+            stride = strides[dim]
 
         # check alignment
-        if (
-            self.ctypes.data + np.sum([o * s for o, s in zip(self.default_origin, self.strides)])
-        ) % gt_backend.from_name(self.backend).storage_info["alignment"]:
-            return False
-
-        return True
+        origin_offset = sum(o * s for o, s in zip(self.default_origin, strides))
+        return not (self.ctypes.data + origin_offset) % self._alignment
 
     def _finalize_view(self, obj):
         pass
 
+    def broadcast_to(self, shape, mask=None, default_origin=None):
+        """Read-only view of the storage extended along the dimensions it is masked in.
+
+        The new dimensions have stride 0, so no memory is allocated or copied and the view
+        can be passed to the stencils of any backend in place of a field with more dimensions.
+
+        Parameters
+        ----------
+        shape: tuple of ints
+            Shape of the view, (normalized to) the dimensions selected by `mask`.
+        mask: list of booleans, optional
+            Mask of the view (all dimensions by default), which must include the
+            dimensions of the storage.
+        default_origin: tuple of ints, optional
+            Default origin of the view, by default the one of the storage with 0 along
+            the new dimensions.
+        """
+        if mask is None:
+            mask = [True] * len(self.mask)
+        mask = [bool(m) for m in mask]
+        if len(mask) != len(self.mask) or any(m and not n for m, n in zip(self.mask, mask)):
+            raise ValueError(f"Mask {mask} does not include the dimensions of the storage.")
+        shape = tuple(storage_utils.normalize_shape(shape, mask))
+
+        dims = [dim for dim, m in enumerate(mask) if m]
+        strides = []
+        origin = []
+        old_dims = iter(zip(self.shape, self.strides, self.default_origin))
+        for dim, size in zip(dims, shape):
+            if self.mask[dim]:
+                old_size, stride, old_origin = next(old_dims)
+                if size != old_size:
+                    raise ValueError(
+                        f"Can not broadcast dimension {dim} of size {old_size} to size {size}."
+                    )
+            else:
+                stride, old_origin = 0, 0
+            strides.append(stride)
+            origin.append(old_origin)
+        if default_origin is not None:
+            origin = storage_utils.normalize_default_origin(default_origin, mask)
+
+        array = np.lib.stride_tricks.as_strided(
+            self.view(np.ndarray), shape=shape, strides=strides, writeable=False
+        )
+        res = array.view(_ViewableNdarray).view(type(self))
+        res.__dict__.update(self.__dict__)
+        res.default_origin = tuple(origin)
+        res._mask = mask
+        storage_info = gt_backend.from_name(self.backend).storage_info
+        res._init_layout_info(storage_info["alignment"], storage_info["layout_map"](mask))
+        res.is_stencil_view = None
+        return res
+
     def synchronize(self):
         pass
 
@@ -329,11 +509,24 @@ class CPUStorage(Storage):
             default_origin, shape, layout_map, dtype, alignment * dtype.itemsize
         )
         obj = field.view(_ViewableNdarray)
-        obj = obj.view(CPUStorage)
+        obj = obj.view(cls)
         obj._raw_buffer = raw_buffer
         obj.default_origin = default_origin
         return obj
 
+    @classmethod
+    def _wrap(cls, array, backend, default_origin, mask):
+        obj = array.view(_ViewableNdarray)
+        obj = obj.view(cls)
+        obj._raw_buffer = array
+        obj.default_origin = tuple(storage_utils.normalize_default_origin(default_origin, mask))
+        obj._backend = backend
+        obj.is_stencil_view = True
+        obj._mask = mask
+        storage_info = gt_backend.from_name(backend).storage_info
+        obj._init_layout_info(storage_info["alignment"], storage_info["layout_map"](mask))
+        return obj
+
     def _check_data(self):
         # check that memory of field is within raw_buffer and that field is a view of raw_buffer
         if (
@@ -353,6 +546,85 @@ class CPUStorage(Storage):
         res[...] = self
         return res
 
+    def flush(self):
+        """Write changes to the file backing the storage, if any (see `empty(..., path=...)`)."""
+        if isinstance(self._raw_buffer, np.memmap):
+            self._raw_buffer.flush()
+
+
+class SharedMemoryStorage(CPUStorage):
+    """CPU storage in a shared memory segment, which is not copied when pickled.
+
+    Pickling (e.g. for sending the storage to a worker of a `multiprocessing` pool) only
+    transfers the name of the segment and the shape, strides, dtype, origin and mask of the
+    storage; unpickling maps the same memory, so writes are visible in all processes. The
+    segment is freed when the storage created with `empty(..., shared_memory=True)` and all
+    its views are garbage collected, it has to be kept alive while other processes use it.
+    """
+
+    @classmethod
+    def _construct(cls, backend, dtype, default_origin, shape, alignment, layout_map):
+        with allocators.scoped_allocator(allocators.shared_memory_allocator):
+            obj = super()._construct(backend, dtype, default_origin, shape, alignment, layout_map)
+        obj._segment_name = allocators.shared_memory_allocator.segment_name(obj._raw_buffer)
+        return obj
+
+    @classmethod
+    def _attach(
+        cls,
+        segment_name,
+        offset,
+        shape,
+        strides,
+        dtype,
+        backend,
+        default_origin,
+        mask,
+        is_stencil_view,
+    ):
+        raw_buffer = allocators.shared_memory_allocator.attach(segment_name, dtype)
+        array = np.ndarray(shape, dtype=dtype, buffer=raw_buffer, offset=offset, strides=strides)
+        obj = cls._wrap(array, backend, default_origin, mask)
+        obj._raw_buffer = raw_buffer
+        obj._segment_name = segment_name
+        obj.is_stencil_view = is_stencil_view
+        return obj
+
+    def __reduce__(self):
+        if not np.may_share_memory(self, self._raw_buffer):
+            # e.g. results of reductions, which are not allocated in the segment
+            return super().__reduce__()
+        return (
+            type(self)._attach,
+            (
+                self._segment_name,
+                self.ctypes.data - self._raw_buffer.ctypes.data,
+                self.shape,
+                self.strides,
+                self.dtype,
+                self.backend,
+                self.default_origin,
+                self.mask,
+                self.is_stencil_view,
+            ),
+        )
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    def copy(self):
+        res = empty(
+            shape=self.shape,
+            dtype=self.dtype,
+            backend=self.backend,
+            default_origin=self.default_origin,
+            mask=self.mask,
+            shared_memory=True,
+        )
+        res.is_stencil_view = self.is_stencil_view
+        res[...] = self
+        return res
+
 
 class ExplicitlySyncedGPUStorage(Storage):
     class SyncState:
@@ -507,6 +779,13 @@ class ExplicitlySyncedGPUStorage(Storage):
         )
         return res
 
+    def broadcast_to(self, shape, mask=None, default_origin=None):
+        res = super().broadcast_to(shape, mask=mask, default_origin=default_origin)
+        res._device_field = cp.lib.stride_tricks.as_strided(
+            self._device_field, shape=res.shape, strides=res.strides
+        )
+        return res
+
     def _finalize_view(self, base):
 
         if self.shape != base.shape or self.strides != base.strides:
@@ -23,6 +23,8 @@ import numpy as np
 import gt4py.utils as gt_util
 from gt4py.definitions import Index, Shape
 
+from . import allocators
+
 
 try:
     import cupy as cp
@@ -201,7 +203,7 @@ def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_b
 
 def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     def allocate_f(size, dtype):
-        raw_buffer = np.empty(size, dtype)
+        raw_buffer = allocators.get_allocator().empty(size, dtype)
         return raw_buffer, raw_buffer
 
     return allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f)
@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import enum
-from typing import Any, ClassVar, Dict, Generic, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union, cast
 
 import pydantic
 from pydantic import validator
@@ -299,6 +299,34 @@ class CartesianOffset(Node):
         return {"i": self.i, "j": self.j, "k": self.k}
 
 
+class HorizontalExtent(Node):
+    """
+    Horizontal region relative to the compute domain.
+
+    Bounds are given as (smallest, largest) offset in each horizontal dimension,
+    e.g. `i=(-1, 2)` extends the compute domain by one point to the left and two to the right.
+    """
+
+    i: Tuple[int, int]
+    j: Tuple[int, int]
+
+    @classmethod
+    def zero(cls) -> "HorizontalExtent":
+        return cls(i=(0, 0), j=(0, 0))
+
+    def shifted(self, offset: CartesianOffset) -> "HorizontalExtent":
+        return HorizontalExtent(
+            i=(self.i[0] + offset.i, self.i[1] + offset.i),
+            j=(self.j[0] + offset.j, self.j[1] + offset.j),
+        )
+
+    def union(self, other: "HorizontalExtent") -> "HorizontalExtent":
+        return HorizontalExtent(
+            i=(min(self.i[0], other.i[0]), max(self.i[1], other.i[1])),
+            j=(min(self.j[0], other.j[0]), max(self.j[1], other.j[1])),
+        )
+
+
 class ScalarAccess(LocNode):
     name: SymbolRef
     kind = ExprKind.SCALAR
@@ -217,11 +217,26 @@ class GTCppCodegen(codegen.TemplatedGenerator):
     )
 
     @classmethod
-    def apply(cls, root: LeafNode, **kwargs: Any) -> str:
+    def apply(cls, root: LeafNode, *, format_source: bool = True, **kwargs: Any) -> str:
         if not isinstance(root, gtcpp.Program):
             raise ValueError("apply() requires gtcpp.Progam root node")
         if "gt_backend_t" not in kwargs:
             raise TypeError("apply() missing 1 required keyword-only argument: 'gt_backend_t'")
         generated_code = super().apply(root, offset_limit=_offset_limit(root), **kwargs)
-        formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
-        return formatted_code
+        if format_source:
+            generated_code = codegen.format_source("cpp", generated_code, style="LLVM")
+        return generated_code
+
+    @classmethod
+    def apply_to(
+        cls, sink: codegen.TextSink, root: LeafNode, *, format_source: bool = True, **kwargs: Any
+    ) -> None:
+        if format_source:
+            with codegen.formatting_sink("cpp", sink, style="LLVM") as formatted_sink:
+                cls.apply_to(formatted_sink, root, format_source=False, **kwargs)
+            return
+        if not isinstance(root, gtcpp.Program):
+            raise ValueError("apply_to() requires gtcpp.Progam root node")
+        if "gt_backend_t" not in kwargs:
+            raise TypeError("apply_to() missing 1 required keyword-only argument: 'gt_backend_t'")
+        super().apply_to(sink, root, offset_limit=_offset_limit(root), **kwargs)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import math
+import operator
+import struct
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from eve import NodeTranslator
+from gtc import common, gtir
+from gtc.common import (
+    ArithmeticOperator,
+    BuiltInLiteral,
+    ComparisonOperator,
+    DataType,
+    LogicalOperator,
+    NativeFunction,
+    UnaryOperator,
+)
+
+
+#: Largest integer exponent of `pow()` which is expanded into multiplications
+POW_EXPANSION_MAX_EXPONENT = 4
+
+LiteralValue = Union[bool, int, float]
+
+_INTEGER_BITS: Dict[DataType, int] = {
+    DataType.INT8: 8,
+    DataType.INT16: 16,
+    DataType.INT32: 32,
+    DataType.INT64: 64,
+}
+
+_FLOAT_DTYPES = (DataType.FLOAT32, DataType.FLOAT64)
+
+
+def _to_dtype(value: LiteralValue, dtype: DataType) -> Optional[LiteralValue]:
+    """Convert a Python value following C++ `static_cast` semantics (`None` if not representable)."""
+    if dtype == DataType.BOOL:
+        return bool(value)
+    if dtype in _INTEGER_BITS:
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        int_value = int(value)  # truncation towards zero
+        bits = _INTEGER_BITS[dtype]
+        return int_value if -(2 ** (bits - 1)) <= int_value < 2 ** (bits - 1) else None
+    if dtype in _FLOAT_DTYPES:
+        float_value = float(value)
+        if dtype == DataType.FLOAT32:
+            try:
+                float_value = struct.unpack("f", struct.pack("f", float_value))[0]
+            except OverflowError:
+                return None
+        return float_value if math.isfinite(float_value) else None
+    return None
+
+
+def _literal_value(node: gtir.Expr) -> Optional[LiteralValue]:
+    """Python value of a literal node or `None` if the node is not a foldable literal."""
+    if not isinstance(node, gtir.Literal):
+        return None
+    value = node.value
+    if node.dtype == DataType.BOOL:
+        if value in (BuiltInLiteral.TRUE, "True"):
+            return True
+        if value in (BuiltInLiteral.FALSE, "False"):
+            return False
+        return None
+    if isinstance(value, BuiltInLiteral):
+        return None
+    try:
+        if node.dtype in _INTEGER_BITS:
+            return _to_dtype(int(value), node.dtype)
+        if node.dtype in _FLOAT_DTYPES:
+            return _to_dtype(float(value), node.dtype)
+    except ValueError:
+        pass
+    return None
+
+
+def _make_literal(
+    value: Optional[LiteralValue], dtype: Optional[DataType]
+) -> Optional[gtir.Literal]:
+    if value is None or dtype is None:
+        return None
+    value = _to_dtype(value, dtype)
+    if value is None:
+        return None
+    if dtype == DataType.BOOL:
+        return gtir.Literal(
+            value=BuiltInLiteral.TRUE if value else BuiltInLiteral.FALSE, dtype=dtype
+        )
+    return gtir.Literal(value=repr(value), dtype=dtype)
+
+
+def _is_neutral_element(
+    op: Any, value: LiteralValue, dtype: Optional[DataType], *, is_left: bool
+) -> bool:
+    """Check if the literal `value` is a neutral element of `op` on the given side.
+
+    Signed zeros are taken into account: `x + 0.0` is `+0.0` for `x == -0.0`, so only `-0.0`
+    is neutral in float additions and only `+0.0` in float subtractions.
+    """
+    is_float = dtype in _FLOAT_DTYPES
+    if op == ArithmeticOperator.ADD:
+        return value == 0 and (not is_float or math.copysign(1.0, value) < 0)
+    if op == ArithmeticOperator.SUB:
+        return not is_left and value == 0 and (not is_float or math.copysign(1.0, value) > 0)
+    if op == ArithmeticOperator.MUL:
+        return value == 1
+    if op == ArithmeticOperator.DIV:
+        return not is_left and value == 1
+    if op == LogicalOperator.AND:
+        return value is True
+    if op == LogicalOperator.OR:
+        return value is False
+    return False
+
+
+#: Expressions which are cheap enough to be repeated by the expansion of `pow()`
+_REPEATABLE_EXPRS = (gtir.FieldAccess, gtir.ScalarAccess, gtir.Literal)
+
+
+def _divide(left: LiteralValue, right: LiteralValue) -> Optional[LiteralValue]:
+    if right == 0:
+        return None
+    if isinstance(left, int) and isinstance(right, int):
+        quotient = abs(left) // abs(right)
+        return quotient if (left < 0) == (right < 0) else -quotient
+    return left / right
+
+
+_BINARY_OPERATORS: Dict[Any, Callable[[Any, Any], Optional[LiteralValue]]] = {
+    ArithmeticOperator.ADD: operator.add,
+    ArithmeticOperator.SUB: operator.sub,
+    ArithmeticOperator.MUL: operator.mul,
+    ArithmeticOperator.DIV: _divide,
+    ComparisonOperator.GT: operator.gt,
+    ComparisonOperator.LT: operator.lt,
+    ComparisonOperator.GE: operator.ge,
+    ComparisonOperator.LE: operator.le,
+    ComparisonOperator.EQ: operator.eq,
+    ComparisonOperator.NE: operator.ne,
+    LogicalOperator.AND: lambda left, right: left and right,
+    LogicalOperator.OR: lambda left, right: left or right,
+}
+
+_NATIVE_FUNCTIONS: Dict[NativeFunction, Callable[..., LiteralValue]] = {
+    NativeFunction.ABS: abs,
+    NativeFunction.MIN: min,
+    NativeFunction.MAX: max,
+    NativeFunction.FLOOR: math.floor,
+    NativeFunction.CEIL: math.ceil,
+    NativeFunction.TRUNC: math.trunc,
+}
+
+
+class _GTIRSimplification(NodeTranslator):
+    """
+    Folds constant expressions and applies algebraic simplifications.
+
+    - operations on literals are evaluated (respecting the dtype of the result)
+    - neutral elements are removed: `x + 0`, `x - 0`, `x * 1`, `x / 1`, `+x`,
+      `x and True`, `x or False` (for floats only `x + -0.0` and `x - 0.0`)
+    - `pow(x, n)` with small integer `n` and an access or literal `x` is expanded into
+      multiplications
+    - ternary operators and if statements with constant conditions are replaced by
+      the taken branch
+
+    Precondition: all dtype transitions are explicit (run after `upcast`)
+    Postcondition: the stencil computes the same values, `changed` is set if anything was folded
+    """
+
+    def __init__(self) -> None:
+        self.changed = False
+
+    def _replaced(self, node: Any) -> Any:
+        self.changed = True
+        return node
+
+    def visit_UnaryOp(self, node: gtir.UnaryOp, **kwargs: Any) -> gtir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        value = _literal_value(expr)
+        if node.op == UnaryOperator.POS:
+            return self._replaced(expr)
+        if value is not None:
+            folded = _make_literal(
+                not value if node.op == UnaryOperator.NOT else -value, expr.dtype
+            )
+            if folded:
+                return self._replaced(folded)
+        return gtir.UnaryOp(op=node.op, expr=expr, loc=node.loc)
+
+    def visit_BinaryOp(self, node: gtir.BinaryOp, **kwargs: Any) -> gtir.Expr:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        left_value = _literal_value(left)
+        right_value = _literal_value(right)
+
+        if left_value is not None and right_value is not None:
+            folded = _make_literal(_BINARY_OPERATORS[node.op](left_value, right_value), node.dtype)
+            if folded:
+                return self._replaced(folded)
+
+        if right_value is not None and left.dtype == node.dtype:
+            if _is_neutral_element(node.op, right_value, node.dtype, is_left=False):
+                return self._replaced(left)
+        if left_value is not None and right.dtype == node.dtype:
+            if _is_neutral_element(node.op, left_value, node.dtype, is_left=True):
+                return self._replaced(right)
+
+        # absorbing elements of logical operators (expressions are side effect free)
+        if isinstance(node.op, LogicalOperator):
+            absorbing = node.op == LogicalOperator.OR
+            if absorbing in (left_value, right_value):
+                return self._replaced(
+                    gtir.Literal(
+                        value=BuiltInLiteral.TRUE if absorbing else BuiltInLiteral.FALSE,
+                        dtype=DataType.BOOL,
+                    )
+                )
+
+        return gtir.BinaryOp(op=node.op, left=left, right=right, loc=node.loc)
+
+    def visit_TernaryOp(self, node: gtir.TernaryOp, **kwargs: Any) -> gtir.Expr:
+        cond = self.visit(node.cond, **kwargs)
+        true_expr = self.visit(node.true_expr, **kwargs)
+        false_expr = self.visit(node.false_expr, **kwargs)
+        value = _literal_value(cond)
+        if value is not None:
+            return self._replaced(true_expr if value else false_expr)
+        return gtir.TernaryOp(cond=cond, true_expr=true_expr, false_expr=false_expr, loc=node.loc)
+
+    def visit_Cast(self, node: gtir.Cast, **kwargs: Any) -> gtir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        if expr.dtype == node.dtype:
+            return self._replaced(expr)
+        value = _literal_value(expr)
+        if value is not None:
+            folded = _make_literal(value, node.dtype)
+            if folded:
+                return self._replaced(folded)
+        return gtir.Cast(dtype=node.dtype, expr=expr, loc=node.loc)
+
+    def visit_NativeFuncCall(self, node: gtir.NativeFuncCall, **kwargs: Any) -> gtir.Expr:
+        args = self.visit(node.args, **kwargs)
+        values = [_literal_value(arg) for arg in args]
+
+        if node.func in _NATIVE_FUNCTIONS and all(value is not None for value in values):
+            folded = _make_literal(_NATIVE_FUNCTIONS[node.func](*values), node.dtype)
+            if folded:
+                return self._replaced(folded)
+
+        if (
+            node.func == NativeFunction.POW
+            and values[1] is not None
+            and isinstance(args[0], _REPEATABLE_EXPRS)
+            and args[0].dtype == node.dtype
+        ):
+            exponent = values[1]
+            if float(exponent).is_integer() and 0 <= exponent <= POW_EXPANSION_MAX_EXPONENT:
+                if exponent > 0:
+                    result: gtir.Expr = args[0]
+                    for _ in range(int(exponent) - 1):
+                        result = gtir.BinaryOp(
+                            op=ArithmeticOperator.MUL, left=result, right=args[0]
+                        )
+                    return self._replaced(result)
+                one = _make_literal(1, node.dtype)
+                if one:
+                    return self._replaced(one)
+
+        return gtir.NativeFuncCall(func=node.func, args=args, loc=node.loc)
+
+    def _visit_stmts(self, stmts: List[gtir.Stmt], **kwargs: Any) -> List[gtir.Stmt]:
+        result: List[gtir.Stmt] = []
+        for stmt in stmts:
+            visited = self.visit(stmt, **kwargs)
+            if isinstance(visited, list):
+                result.extend(visited)
+            else:
+                result.append(visited)
+        return result
+
+    def _visit_if_stmt(
+        self, node: Union[gtir.FieldIfStmt, gtir.ScalarIfStmt], **kwargs: Any
+    ) -> Union[gtir.Stmt, List[gtir.Stmt]]:
+        cond = self.visit(node.cond, **kwargs)
+        value = _literal_value(cond)
+        if value is not None:
+            self.changed = True
+            branch = node.true_branch if value else node.false_branch
+            return self._visit_stmts(branch.body, **kwargs) if branch else []
+
+        if_stmt_class = (
+            gtir.FieldIfStmt if cond.kind == common.ExprKind.FIELD else gtir.ScalarIfStmt
+        )
+        return if_stmt_class(
+            cond=cond,
+            true_branch=self.visit(node.true_branch, **kwargs),
+            false_branch=self.visit(node.false_branch, **kwargs),
+            loc=node.loc,
+        )
+
+    visit_FieldIfStmt = _visit_if_stmt
+    visit_ScalarIfStmt = _visit_if_stmt
+
+    def visit_BlockStmt(self, node: gtir.BlockStmt, **kwargs: Any) -> gtir.BlockStmt:
+        return gtir.BlockStmt(body=self._visit_stmts(node.body, **kwargs), loc=node.loc)
+
+    def visit_VerticalLoop(self, node: gtir.VerticalLoop, **kwargs: Any) -> gtir.VerticalLoop:
+        return gtir.VerticalLoop(
+            interval=node.interval,
+            loop_order=node.loop_order,
+            temporaries=node.temporaries,
+            body=self._visit_stmts(node.body, **kwargs),
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: gtir.Stencil, **kwargs: Any) -> gtir.Stencil:
+        vertical_loops = self.visit(node.vertical_loops, **kwargs)
+        # a stencil needs at least one (possibly empty) vertical loop
+        vertical_loops = [loop for loop in vertical_loops if loop.body] or vertical_loops[:1]
+        return gtir.Stencil(
+            name=node.name, params=node.params, vertical_loops=vertical_loops, loc=node.loc
+        )
+
+
+def simplify(node: gtir.Stencil) -> gtir.Stencil:
+    """Fold constants and simplify expressions until no further simplification applies."""
+    while True:
+        simplifier = _GTIRSimplification()
+        node = simplifier.visit(node)
+        if not simplifier.changed:
+            return node
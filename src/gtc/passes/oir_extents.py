@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, Set, Tuple
+
+from eve import NodeVisitor
+from gtc import common, oir
+from gtc.common import HorizontalExtent
+
+
+class _AccessCollector(NodeVisitor):
+    """Collects written field names and read horizontal offsets of a horizontal execution."""
+
+    def visit_FieldAccess(
+        self, node: oir.FieldAccess, *, reads: Set[Tuple[str, int, int]], **kwargs: Any
+    ) -> None:
+        reads.add((node.name, node.offset.i, node.offset.j))
+
+    def visit_AssignStmt(
+        self,
+        node: oir.AssignStmt,
+        *,
+        reads: Set[Tuple[str, int, int]],
+        writes: Set[str],
+        **kwargs: Any,
+    ) -> None:
+        if isinstance(node.left, oir.FieldAccess):
+            writes.add(node.left.name)
+        self.visit(node.right, reads=reads, **kwargs)
+
+    @classmethod
+    def apply(cls, node: oir.HorizontalExecution) -> Tuple[Set[str], Set[Tuple[str, int, int]]]:
+        reads: Set[Tuple[str, int, int]] = set()
+        writes: Set[str] = set()
+        instance = cls()
+        instance.visit(node.body, reads=reads, writes=writes)
+        instance.visit(node.mask, reads=reads, writes=writes)
+        return writes, reads
+
+
+def compute_horizontal_execution_extents(node: oir.Stencil) -> Dict[int, HorizontalExtent]:
+    """Compute the minimal extent each `HorizontalExecution` needs to be computed on.
+
+    The result maps the `id()` of every horizontal execution of `node` to its extent, so it is
+    only valid for this stencil instance.
+
+    The horizontal executions are walked backwards and the extents required by readers are
+    accumulated. The extent of a horizontal execution is the union of the extents required for
+    all fields it writes. Reading a field with an offset propagates the execution extent, shifted
+    by the offset, to the producers of that field (same algorithm as
+    `gt4py.analysis.ComputeExtentsPass`). API fields are only required on the compute domain,
+    temporaries are required on the union of all extents they are read with. Executions which
+    do not write anything read later with an offset get a zero extent.
+    """
+    fields_extents: DefaultDict[str, HorizontalExtent] = defaultdict(HorizontalExtent.zero)
+    horizontal_execution_extents: Dict[int, HorizontalExtent] = {}
+
+    horizontal_executions = node.iter_tree().if_isinstance(oir.HorizontalExecution).to_list()
+    for horizontal_execution in reversed(horizontal_executions):
+        writes, reads = _AccessCollector.apply(horizontal_execution)
+        extent = HorizontalExtent.zero()
+        for name in writes:
+            extent = extent.union(fields_extents[name])
+        for name, i, j in reads:
+            fields_extents[name] = fields_extents[name].union(
+                extent.shifted(common.CartesianOffset(i=i, j=j, k=0))
+            )
+        horizontal_execution_extents[id(horizontal_execution)] = extent
+
+    return horizontal_execution_extents
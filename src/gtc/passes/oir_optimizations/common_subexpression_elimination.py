@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import collections
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from eve import Node, NodeTranslator, NodeVisitor, parallel
+from gtc import oir
+
+
+_CANDIDATE_TYPES = (oir.UnaryOp, oir.BinaryOp, oir.TernaryOp, oir.NativeFuncCall, oir.Cast)
+
+#: Position of an expression node in the horizontal execution: (statement index, `id()` of the node)
+_ExprLocation = Tuple[int, int]
+
+#: Structural hash of an expression and the versions of the symbols it reads
+_ExprKey = Tuple[int, FrozenSet[Tuple[str, int]]]
+
+_NO_READS: FrozenSet[Tuple[str, int]] = frozenset()
+
+
+def _local_name(index: int) -> str:
+    return f"cse_{index}"
+
+
+class _ExprKeyCollector(NodeVisitor):
+    """Computes keys of all expressions in a list of statements.
+
+    The key of an expression is its structural hash (see `eve.Node.structural_hash`) and
+    the version of every symbol it reads, where the version of a symbol is increased on every
+    assignment. Two structurally equal expressions with the same key thus evaluate to the
+    same value.
+    """
+
+    def __init__(self) -> None:
+        self.keys: Dict[_ExprLocation, _ExprKey] = {}
+        self.sizes: Dict[_ExprKey, int] = {}
+        #: Unconditionally evaluated candidate expressions in order of appearance
+        self.candidates: List[Tuple[int, _ExprKey, oir.Expr]] = []
+
+    def visit_Node(
+        self,
+        node: Node,
+        *,
+        stmt_idx: int,
+        versions: Dict[str, int],
+        conditional: bool = False,
+        **kwargs: Any,
+    ) -> Tuple[FrozenSet[Tuple[str, int]], int]:
+        reads: Set[Tuple[str, int]] = set()
+        size = 1
+        for name, child in node.iter_children():
+            if name == "loc":
+                continue
+            branch_conditional = conditional or (isinstance(node, oir.TernaryOp) and name != "cond")
+            child_reads, child_size = self.visit(
+                child, stmt_idx=stmt_idx, versions=versions, conditional=branch_conditional
+            )
+            reads |= child_reads
+            size += child_size
+        if isinstance(node, (oir.FieldAccess, oir.ScalarAccess)):
+            reads.add((node.name, versions.get(node.name, 0)))
+
+        frozen_reads = frozenset(reads)
+        if isinstance(node, oir.Expr):
+            key = (node.structural_hash(), frozen_reads)
+            self.keys[(stmt_idx, id(node))] = key
+            self.sizes[key] = size
+            if isinstance(node, _CANDIDATE_TYPES) and not conditional:
+                self.candidates.append((stmt_idx, key, node))
+        return frozen_reads, size
+
+    def generic_visit(self, node: Any, **kwargs: Any) -> Tuple[FrozenSet[Tuple[str, int]], int]:
+        if isinstance(node, (list, tuple)):
+            items = [self.visit(item, **kwargs) for item in node]
+            return (
+                frozenset().union(*(reads for reads, _ in items)),
+                sum(size for _, size in items),
+            )
+        return _NO_READS, 0
+
+    def visit_AssignStmt(
+        self, node: oir.AssignStmt, *, stmt_idx: int, versions: Dict[str, int], **kwargs: Any
+    ) -> Tuple[FrozenSet[Tuple[str, int]], int]:
+        self.visit(node.right, stmt_idx=stmt_idx, versions=versions)
+        versions[node.left.name] = versions.get(node.left.name, 0) + 1
+        return _NO_READS, 0
+
+    @classmethod
+    def apply(cls, stmts: List[oir.Stmt]) -> "_ExprKeyCollector":
+        instance = cls()
+        versions: Dict[str, int] = {}
+        for stmt_idx, stmt in enumerate(stmts):
+            instance.visit(stmt, stmt_idx=stmt_idx, versions=versions)
+        return instance
+
+
+class _ReplaceExpr(NodeTranslator):
+    def visit_Expr(
+        self,
+        node: oir.Expr,
+        *,
+        keys: Dict[_ExprLocation, _ExprKey],
+        stmt_idx: int,
+        key: _ExprKey,
+        expr: oir.Expr,
+        name: str,
+        **kwargs: Any,
+    ) -> oir.Expr:
+        if keys.get((stmt_idx, id(node))) == key and node.structurally_equal(expr):
+            return oir.ScalarAccess(name=name, dtype=node.dtype)
+        return self.generic_visit(node, keys=keys, stmt_idx=stmt_idx, key=key, expr=expr, name=name)
+
+
+class _RenameLocalScalars(NodeTranslator):
+    def visit_LocalScalar(
+        self, node: oir.LocalScalar, *, names: Dict[str, str], **kwargs: Any
+    ) -> oir.LocalScalar:
+        if node.name not in names:
+            return node
+        return oir.LocalScalar(name=names[node.name], dtype=node.dtype, loc=node.loc)
+
+    def visit_ScalarAccess(
+        self, node: oir.ScalarAccess, *, names: Dict[str, str], **kwargs: Any
+    ) -> oir.ScalarAccess:
+        if node.name not in names:
+            return node
+        return oir.ScalarAccess(name=names[node.name], dtype=node.dtype, loc=node.loc)
+
+
+class CommonSubexpressionElimination(NodeTranslator):
+    """Replaces expressions evaluated repeatedly in a horizontal execution by local scalars.
+
+    Repeatedly picks the largest subexpression which is evaluated at least twice with the
+    same inputs (no assignment to any of the read symbols in between), assigns it to a new
+    `LocalScalar` before its first use and replaces all its occurrences by scalar accesses.
+    Expressions in the branches of a `TernaryOp` are not hoisted out of the branches.
+    The new local scalars are named `cse_<n>`, numbered in order of the horizontal
+    executions in the stencil.
+
+    Preconditions: none, best applied after `GreedyMerging` and `TemporariesToScalars`.
+    Postcondition: each unconditionally evaluated compound expression is computed only once.
+    """
+
+    @staticmethod
+    def _find_repeated(
+        collector: _ExprKeyCollector,
+    ) -> Optional[Tuple[int, _ExprKey, oir.Expr]]:
+        counts = collections.Counter(key for _, key, _ in collector.candidates)
+        repeated = [candidate for candidate in collector.candidates if counts[candidate[1]] > 1]
+        if not repeated:
+            return None
+        return max(repeated, key=lambda candidate: collector.sizes[candidate[1]])
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        # horizontal executions are independent, thus they can be transformed in parallel
+        horizontal_executions = node.iter_tree().if_isinstance(oir.HorizontalExecution).to_list()
+        transformed = parallel.map_visit(self, horizontal_executions, **kwargs)
+
+        # the local scalars of each horizontal execution are numbered from 0, thus they are
+        # renumbered to unique names in the stencil
+        n_locals = 0
+        for i, (original, result) in enumerate(zip(horizontal_executions, transformed)):
+            n_new = len(result.declarations) - len(original.declarations)
+            if n_locals and n_new:
+                names = {_local_name(k): _local_name(n_locals + k) for k in range(n_new)}
+                transformed[i] = _RenameLocalScalars().visit(result, names=names)
+            n_locals += n_new
+
+        return self.generic_visit(
+            node, transformed=dict(zip(map(id, horizontal_executions), transformed)), **kwargs
+        )
+
+    def visit_HorizontalExecution(
+        self,
+        node: oir.HorizontalExecution,
+        *,
+        transformed: Optional[Dict[int, oir.HorizontalExecution]] = None,
+        **kwargs: Any,
+    ) -> oir.HorizontalExecution:
+        if transformed is not None:
+            return transformed[id(node)]
+
+        body = node.body
+        declarations = list(node.declarations)
+        while True:
+            collector = _ExprKeyCollector.apply(body)
+            repeated = self._find_repeated(collector)
+            if repeated is None:
+                break
+            first_idx, key, expr = repeated
+            name = _local_name(len(declarations) - len(node.declarations))
+            declarations.append(oir.LocalScalar(name=name, dtype=expr.dtype))
+            new_body = body[:first_idx]
+            new_body.append(
+                oir.AssignStmt(left=oir.ScalarAccess(name=name, dtype=expr.dtype), right=expr)
+            )
+            for stmt_idx in range(first_idx, len(body)):
+                new_body.append(
+                    _ReplaceExpr().visit(
+                        body[stmt_idx],
+                        keys=collector.keys,
+                        stmt_idx=stmt_idx,
+                        key=key,
+                        expr=expr,
+                        name=name,
+                    )
+                )
+            body = new_body
+
+        return oir.HorizontalExecution(
+            body=body,
+            mask=node.mask,
+            declarations=declarations,
+            loc=node.loc,
+        )
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import collections
+from typing import Any, DefaultDict, List, Optional, Set, Union
+
+from eve import NodeTranslator
+from gtc import oir
+from gtc.common import BuiltInLiteral
+
+
+def _read_names(node: Optional[Union[oir.Expr, oir.Stmt]]) -> Set[str]:
+    """Names of all symbols accessed in an expression (or statement, including written ones)."""
+    return (
+        node.iter_tree().if_isinstance(oir.FieldAccess, oir.ScalarAccess).getattr("name").to_set()
+        if node
+        else set()
+    )
+
+
+def _is_dead(stmt: oir.Stmt, live: Set[str]) -> bool:
+    return isinstance(stmt, oir.AssignStmt) and stmt.left.name not in live
+
+
+def _mask_value(mask: Optional[oir.Expr]) -> Optional[bool]:
+    """Constant value of a mask if known at compile time (`True` for unmasked executions)."""
+    if mask is None:
+        return True
+    if isinstance(mask, oir.Literal) and isinstance(mask.value, BuiltInLiteral):
+        return mask.value == BuiltInLiteral.TRUE
+    return None
+
+
+class DeadCodeElimination(NodeTranslator):
+    """Removes computations which do not contribute to any API field.
+
+    1. Starting from assignments to API fields, collects all symbols which are (transitively)
+       read to compute them, including the masks of the corresponding horizontal executions.
+       Liveness is tracked per symbol, not per statement instance, since reads with vertical
+       offsets or in subsequent vertical iterations may access values written by any statement.
+    2. Removes horizontal executions whose mask is constant false and the masks which are
+       constant true.
+    3. Removes assignments to symbols which are never read, then horizontal executions without
+       statements, sections without horizontal executions at the start or end of a vertical loop
+       (inner ones are kept to keep the intervals contiguous) and empty vertical loops.
+    4. Removes declarations of local scalars and temporaries and caches which are not used any
+       more.
+    """
+
+    def visit_HorizontalExecution(
+        self, node: oir.HorizontalExecution, *, live: Set[str], **kwargs: Any
+    ) -> Optional[oir.HorizontalExecution]:
+        mask_value = _mask_value(node.mask)
+        if mask_value is False:
+            return None
+        body = [stmt for stmt in node.body if not _is_dead(stmt, live)]
+        if not body:
+            return None
+        used = _read_names(node.mask)
+        for stmt in body:
+            used |= _read_names(stmt)
+        return oir.HorizontalExecution(
+            body=body,
+            mask=None if mask_value else node.mask,
+            declarations=[decl for decl in node.declarations if decl.name in used],
+            loc=node.loc,
+        )
+
+    def visit_VerticalLoopSection(
+        self, node: oir.VerticalLoopSection, **kwargs: Any
+    ) -> oir.VerticalLoopSection:
+        horizontal_executions = [
+            horizontal_execution
+            for horizontal_execution in self.visit(node.horizontal_executions, **kwargs)
+            if horizontal_execution is not None
+        ]
+        return oir.VerticalLoopSection(
+            interval=node.interval, horizontal_executions=horizontal_executions, loc=node.loc
+        )
+
+    def visit_VerticalLoop(
+        self, node: oir.VerticalLoop, **kwargs: Any
+    ) -> Optional[oir.VerticalLoop]:
+        sections: List[oir.VerticalLoopSection] = self.visit(node.sections, **kwargs)
+        while sections and not sections[0].horizontal_executions:
+            sections.pop(0)
+        while sections and not sections[-1].horizontal_executions:
+            sections.pop()
+        if not sections:
+            return None
+        accessed = {
+            name
+            for section in sections
+            for name in section.iter_tree()
+            .if_isinstance(oir.FieldAccess, oir.ScalarAccess)
+            .getattr("name")
+        }
+        return oir.VerticalLoop(
+            loop_order=node.loop_order,
+            sections=sections,
+            caches=[cache for cache in node.caches if cache.name in accessed],
+            loc=node.loc,
+        )
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> oir.Stencil:
+        writers: DefaultDict[str, List[Set[str]]] = collections.defaultdict(list)
+        pending: List[str] = [
+            str(param.name) for param in node.params if isinstance(param, oir.FieldDecl)
+        ]
+        for horizontal_execution in node.iter_tree().if_isinstance(oir.HorizontalExecution):
+            if _mask_value(horizontal_execution.mask) is False:
+                continue
+            mask_reads = _read_names(horizontal_execution.mask)
+            for stmt in horizontal_execution.body:
+                if isinstance(stmt, oir.AssignStmt):
+                    writers[stmt.left.name].append(_read_names(stmt.right) | mask_reads)
+                else:
+                    # other statements are always kept, thus everything they access is live
+                    pending.extend(_read_names(stmt) | mask_reads)
+
+        live: Set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name in live:
+                continue
+            live.add(name)
+            for reads in writers[name]:
+                pending.extend(reads - live)
+
+        vertical_loops = [
+            vertical_loop
+            for vertical_loop in self.visit(node.vertical_loops, live=live, **kwargs)
+            if vertical_loop is not None
+        ]
+        accessed = {
+            name
+            for vertical_loop in vertical_loops
+            for name in vertical_loop.iter_tree().if_isinstance(oir.FieldAccess).getattr("name")
+        }
+        return oir.Stencil(
+            name=node.name,
+            params=node.params,
+            vertical_loops=vertical_loops,
+            declarations=[decl for decl in node.declarations if decl.name in accessed],
+            loc=node.loc,
+        )
@@ -84,8 +84,24 @@ class GreedyMerging(NodeTranslator):
                 if field in previous_reads
                 and any(o[:2] != (0, 0) for o in offsets ^ previous_reads[field])
             }
-            if not conflicting and horizontal_execution.mask == horizontal_executions[-1].mask:
-                horizontal_executions[-1].body += horizontal_execution.body
+            mask, previous_mask = horizontal_execution.mask, horizontal_executions[-1].mask
+            if mask is not None:
+                # the mask of merged executions is evaluated once before all statements
+                mask_reads: Dict[str, Set[Tuple[int, int, int]]] = defaultdict(set)
+                self.AccessCollector().visit(mask, accesses=mask_reads)
+                conflicting |= {field for field in mask_reads if field in previous_writes}
+            same_mask = mask is previous_mask or (
+                mask is not None and mask.structurally_equal(previous_mask)
+            )
+            if not conflicting and same_mask:
+                previous = horizontal_executions[-1]
+                horizontal_executions[-1] = oir.HorizontalExecution(
+                    id_=previous.id_,
+                    **{
+                        **dict(previous.iter_children()),
+                        "body": previous.body + horizontal_execution.body,
+                    },
+                )
                 for field, writes in current_writes.items():
                     previous_writes[field] |= writes
                 for field, reads in current_reads.items():
@@ -94,7 +110,11 @@ class GreedyMerging(NodeTranslator):
                 horizontal_executions.append(horizontal_execution)
                 previous_writes = current_writes
                 previous_reads = current_reads
-        result.horizontal_executions = horizontal_executions
+        # new nodes, since copies returned by generic_visit() must not be modified in place
+        result = oir.VerticalLoopSection(
+            id_=result.id_,
+            **{**dict(result.iter_children()), "horizontal_executions": horizontal_executions},
+        )
         if len(result.horizontal_executions) > len(node.horizontal_executions):
             raise GTCPostconditionError(
                 expected="the number of horizontal executions is equal or smaller than before"
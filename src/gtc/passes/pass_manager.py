@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Registry and pipeline execution of OIR passes.
+
+Passes are registered by name together with conditions on their input and output, which
+allows to select and reorder passes by name (e.g. through the ``oir_pipeline`` backend option)
+and to detect invalid pipelines early.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from eve import Node, validate_tree
+from gtc import oir
+from gtc.common import GTCPostconditionError, GTCPreconditionError
+from gtc.passes.oir_optimizations.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+from gtc.passes.oir_optimizations.dead_code_elimination import DeadCodeElimination
+from gtc.passes.oir_optimizations.horizontal_execution_merging import GreedyMerging
+from gtc.passes.oir_optimizations.temporaries import TemporariesToScalars
+
+
+class Condition(NamedTuple):
+    """Named predicate on a stencil, used as pass precondition or postcondition."""
+
+    description: str
+    check: Callable[[oir.Stencil], bool]
+
+
+class OIRPass(NamedTuple):
+    name: str
+    transform: Callable[[oir.Stencil], oir.Stencil]
+    #: Checked before the pass is applied, a violation raises `GTCPreconditionError`
+    preconditions: Tuple[Condition, ...] = ()
+    #: Checked after the pass if validation is enabled, a violation raises `GTCPostconditionError`
+    postconditions: Tuple[Condition, ...] = ()
+
+
+OIR_PASSES: Dict[str, OIRPass] = {}
+
+
+def register_oir_pass(
+    name: str,
+    transform: Callable[[oir.Stencil], oir.Stencil],
+    *,
+    preconditions: Sequence[Condition] = (),
+    postconditions: Sequence[Condition] = (),
+) -> OIRPass:
+    if name in OIR_PASSES:
+        raise ValueError(f"OIR pass '{name}' is already registered")
+    OIR_PASSES[name] = OIRPass(
+        name=name,
+        transform=transform,
+        preconditions=tuple(preconditions),
+        postconditions=tuple(postconditions),
+    )
+    return OIR_PASSES[name]
+
+
+def _count_nodes(node: oir.Stencil) -> int:
+    return sum(1 for _ in node.iter_tree().if_isinstance(Node))
+
+
+def _validate(node: oir.Stencil) -> None:
+    """Re-run the validators of all nodes (passes copy unchanged nodes without validation)."""
+    validate_tree(node)
+
+
+def run_oir_pipeline(
+    node: oir.Stencil,
+    pipeline: Optional[Sequence[str]] = None,
+    *,
+    validate: bool = False,
+    stats: Optional[List[Dict[str, Any]]] = None,
+) -> oir.Stencil:
+    """Apply the registered passes given by name in the given order.
+
+    Args:
+        node: OIR stencil to transform.
+        pipeline: names of the passes to apply, `DEFAULT_OIR_PIPELINE` if `None`.
+        validate: validate the stencil and check the pass postconditions after every pass.
+        stats: if given, receives records of the wall time [s] and node count change per pass.
+    """
+    pipeline = DEFAULT_OIR_PIPELINE if pipeline is None else pipeline
+    unknown = [name for name in pipeline if name not in OIR_PASSES]
+    if unknown:
+        raise ValueError(f"Unknown OIR passes: {unknown}, available: {list(OIR_PASSES)}")
+
+    node_count = _count_nodes(node) if stats is not None else 0
+    for name in pipeline:
+        oir_pass = OIR_PASSES[name]
+        for condition in oir_pass.preconditions:
+            if not condition.check(node):
+                raise GTCPreconditionError(expected=condition.description, oir_pass=name)
+
+        start_time = time.perf_counter()
+        node = oir_pass.transform(node)
+        elapsed_time = time.perf_counter() - start_time
+
+        if validate:
+            _validate(node)
+            for condition in oir_pass.postconditions:
+                if not condition.check(node):
+                    raise GTCPostconditionError(expected=condition.description, oir_pass=name)
+
+        if stats is not None:
+            previous_node_count, node_count = node_count, _count_nodes(node)
+            stats.append(
+                {
+                    "name": name,
+                    "time": elapsed_time,
+                    "node_count": node_count,
+                    "node_count_delta": node_count - previous_node_count,
+                }
+            )
+
+    return node
+
+
+def _has_no_empty_sections(node: oir.Stencil) -> bool:
+    return all(
+        section.horizontal_executions
+        for section in node.iter_tree().if_isinstance(oir.VerticalLoopSection).to_list()
+    )
+
+
+def _has_no_unused_temporaries(node: oir.Stencil) -> bool:
+    accessed = node.iter_tree().if_isinstance(oir.FieldAccess).getattr("name").to_set()
+    return all(decl.name in accessed for decl in node.declarations)
+
+
+def _has_no_single_execution_temporaries(node: oir.Stencil) -> bool:
+    temporaries = {decl.name for decl in node.declarations}
+    seen: Dict[str, int] = {}
+    for horizontal_execution in node.iter_tree().if_isinstance(oir.HorizontalExecution):
+        for name in (
+            horizontal_execution.iter_tree()
+            .if_isinstance(oir.FieldAccess)
+            .getattr("name")
+            .if_in(temporaries)
+            .to_set()
+        ):
+            seen[name] = seen.get(name, 0) + 1
+    return all(count > 1 for count in seen.values())
+
+
+register_oir_pass(
+    "greedy_merging",
+    lambda node: GreedyMerging().visit(node),
+    preconditions=[
+        Condition("no vertical loop section without horizontal executions", _has_no_empty_sections)
+    ],
+)
+register_oir_pass(
+    "temporaries_to_scalars",
+    lambda node: TemporariesToScalars().visit(node),
+    postconditions=[
+        Condition(
+            "no temporary accessed in a single horizontal execution",
+            _has_no_single_execution_temporaries,
+        )
+    ],
+)
+register_oir_pass(
+    "dead_code_elimination",
+    lambda node: DeadCodeElimination().visit(node),
+    postconditions=[Condition("all temporaries are accessed", _has_no_unused_temporaries)],
+)
+register_oir_pass(
+    "common_subexpression_elimination",
+    lambda node: CommonSubexpressionElimination().visit(node),
+)
+
+DEFAULT_OIR_PIPELINE: Tuple[str, ...] = (
+    "greedy_merging",
+    "temporaries_to_scalars",
+    "dead_code_elimination",
+    "common_subexpression_elimination",
+)
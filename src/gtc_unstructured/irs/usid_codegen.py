@@ -87,6 +87,15 @@ class UsidCodeGenerator(codegen.TemplatedGenerator):
         formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
         return formatted_code
 
+    @classmethod
+    def apply_to(cls, sink, root, *, format_source=True, **kwargs) -> None:
+        symbol_tbl_resolved = SymbolTblHelper().visit(root)
+        if format_source:
+            with codegen.formatting_sink("cpp", sink, style="LLVM") as formatted_sink:
+                super().apply_to(formatted_sink, symbol_tbl_resolved, **kwargs)
+        else:
+            super().apply_to(sink, symbol_tbl_resolved, **kwargs)
+
     def location_type_from_dimensions(self, dimensions):
         location_type = [dim for dim in dimensions if isinstance(dim, common.LocationType)]
         if len(location_type) != 1:
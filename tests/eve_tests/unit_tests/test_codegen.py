@@ -14,6 +14,10 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import hashlib
+import io
+import sys
+import warnings
 from typing import Callable, Optional, Set, Type
 
 import pytest
@@ -43,9 +47,9 @@ def test_name(name_with_cases):  # noqa: F811  # pytest fixture not detected
 def fmt_tpl_maker(skeleton, keys, valid=True):
     if valid:
         transformed_keys = {k: "{{{key}}}".format(key=k) for k in keys}
-        return eve.codegen.FormatTemplate(skeleton.format(**transformed_keys))
     else:
-        return None
+        transformed_keys = {k: "{{--%{key}}}".format(key=k) for k in keys}
+    return eve.codegen.FormatTemplate(skeleton.format(**transformed_keys))
 
 
 def string_tpl_maker(skeleton, keys, valid=True):
@@ -100,6 +104,111 @@ def test_template_rendering(template_maker):
         template.render()
 
 
+def test_template_rendering_to_sink(template_maker):
+    skeleton = "aaa {s} bbbb {i} cccc"
+    data = {"s": "STRING", "i": 1}
+    template = template_maker(skeleton, data.keys())
+    sink = io.StringIO()
+    template.render_to(sink, data, i=2)
+    assert sink.getvalue() == "aaa STRING bbbb 2 cccc"
+
+    with pytest.raises(eve.codegen.TemplateRenderingError):
+        template.render_to(io.StringIO())
+
+
+def test_source_file_sink(tmp_path):
+    path = tmp_path / "source.cpp"
+    with eve.codegen.SourceFileSink(path, buffer_size=4) as sink:
+        for chunk in ("int main() {", "\n", "    return 0;\n}\n"):
+            sink.write(chunk)
+        assert not path.exists()
+
+    assert sink.closed
+    assert path.read_text() == "int main() {\n    return 0;\n}\n"
+    assert sink.size == len(path.read_bytes())
+    assert sink.hexdigest == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    with pytest.raises(ValueError, match="closed"):
+        sink.write("// more")
+
+    with pytest.raises(RuntimeError):
+        with eve.codegen.SourceFileSink(path) as sink:
+            sink.write("// incomplete")
+            raise RuntimeError()
+    assert path.read_text() == "int main() {\n    return 0;\n}\n"
+    assert list(tmp_path.iterdir()) == [path]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with eve.codegen.SourceFileSink(path, encoding="utf-16", buffer_size=1) as sink:
+            sink.write("// ñandú")
+            sink.write("\n")
+    assert path.read_text(encoding="utf-16") == "// ñandú\n"
+
+
+def test_format_source_cache(monkeypatch):
+    calls = []
+
+    @eve.codegen.register_formatter("cached_test_language")
+    def format_test_source(source, *, suffix=""):
+        calls.append(source)
+        return source.upper() + suffix
+
+    try:
+        assert eve.codegen.format_source("cached_test_language", "source") == "SOURCE"
+        assert eve.codegen.format_source("cached_test_language", "source") == "SOURCE"
+        assert eve.codegen.format_source("cached_test_language", "source", suffix="!") == "SOURCE!"
+        assert calls == ["source", "source"]
+
+        cache = eve.codegen._FormattedSourcesCache(max_size=2 * sys.getsizeof("SOURCE0"))
+        monkeypatch.setattr(eve.codegen, "_formatted_sources", cache)
+        for i in range(3):
+            assert eve.codegen.format_source("cached_test_language", f"source{i}") == f"SOURCE{i}"
+        assert len(cache) == 2 and cache.size <= cache.max_size
+        eve.codegen.format_source("cached_test_language", "source2")
+        eve.codegen.format_source("cached_test_language", "source0")
+        assert calls[-4:] == ["source0", "source1", "source2", "source0"]
+    finally:
+        del eve.codegen.SOURCE_FORMATTERS["cached_test_language"]
+
+
+def test_formatting_sink(monkeypatch):
+    @eve.codegen.register_formatter("piped_test_language")
+    def format_test_source(source, *, suffix=""):
+        return source.upper() + suffix
+
+    def upper_command(*, suffix=""):
+        script = f"import sys; sys.stdout.write(sys.stdin.read().upper() + {suffix!r})"
+        return [sys.executable, "-c", script]
+
+    try:
+        sink = io.StringIO()
+        with eve.codegen.formatting_sink("piped_test_language", sink, suffix="!") as formatted:
+            formatted.write("int main() {")
+            formatted.write(" return 0; }")
+        assert sink.getvalue() == "INT MAIN() { RETURN 0; }!"
+
+        monkeypatch.setitem(
+            eve.codegen._PIPED_FORMATTER_COMMANDS, format_test_source, upper_command
+        )
+        sink = io.StringIO()
+        with eve.codegen.formatting_sink("piped_test_language", sink, suffix="!") as formatted:
+            formatted.write("int main() {")
+            formatted.write(" return 0; }")
+        assert sink.getvalue() == "INT MAIN() { RETURN 0; }!"
+
+        monkeypatch.setitem(
+            eve.codegen._PIPED_FORMATTER_COMMANDS,
+            format_test_source,
+            lambda: [sys.executable, "-c", "import sys; sys.exit(1)"],
+        )
+        with pytest.raises(eve.codegen.FormattingError):
+            with eve.codegen.formatting_sink("piped_test_language", io.StringIO()) as formatted:
+                formatted.write("int main() { return 0; }")
+    finally:
+        del eve.codegen.SOURCE_FORMATTERS["piped_test_language"]
+
+
 # -- TemplatedGenerator tests --
 class _BaseTestGenerator(eve.codegen.TemplatedGenerator):
     KEYWORDS = ("BASE", "ONE")
@@ -218,6 +327,30 @@ def test_templated_generator(templated_generator, fixed_compound_node):
         assert rendered_code.find(keyword) >= 0
 
 
+def test_templated_generator_to_sink(templated_generator, fixed_compound_node):
+    sink = io.StringIO()
+    templated_generator.apply_to(sink, fixed_compound_node)
+    assert sink.getvalue() == templated_generator.apply(fixed_compound_node)
+
+    class RepeatingGenerator(templated_generator):
+        def visit_CompoundNode(self, node, **kwargs):
+            result = super().visit_CompoundNode(node, **kwargs)
+            return f"{result}\n--\n{result}"
+
+    sink = io.StringIO()
+    RepeatingGenerator.apply_to(sink, fixed_compound_node)
+    assert sink.getvalue() == RepeatingGenerator.apply(fixed_compound_node)
+
+    class TransformingGenerator(templated_generator):
+        def visit_CompoundNode(self, node, **kwargs):
+            return super().visit_CompoundNode(node, **kwargs).upper()
+
+    with pytest.raises(eve.codegen.TemplateRenderingError, match="cannot be streamed"):
+        TransformingGenerator.apply_to(io.StringIO(), fixed_compound_node)
+
+
 def test_templated_generator_exceptions(faulty_templated_generator, fixed_compound_node):
     with pytest.raises(eve.codegen.TemplateRenderingError, match="when rendering node"):
         faulty_templated_generator.apply(fixed_compound_node)
+    with pytest.raises(eve.codegen.TemplateRenderingError, match="when rendering node"):
+        faulty_templated_generator.apply_to(io.StringIO(), fixed_compound_node)
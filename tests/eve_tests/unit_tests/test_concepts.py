@@ -15,9 +15,14 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+import copy
+import pickle
+
 import pydantic
 import pytest
 
+from eve import concepts
+
 from .. import definitions
 
 
@@ -99,3 +104,65 @@ class TestNode:
             and isinstance(metadata["definition"], pydantic.fields.ModelField)
             for metadata in sample_node.__node_children__.values()
         )
+
+    def test_structural_hash(self, sample_node):
+        node_copy = sample_node.copy(update={"id_": "other_id"})
+        assert node_copy.structural_hash() == sample_node.structural_hash()
+        assert node_copy.structurally_equal(sample_node)
+        assert copy.deepcopy(sample_node).structural_hash() == sample_node.structural_hash()
+        assert pickle.loads(pickle.dumps(sample_node)).structurally_equal(sample_node)
+
+    def test_structural_hash_of_models(self, source_location):
+        other_loc = source_location.copy()
+        object.__setattr__(other_loc, "__fields_set__", set())
+        assert concepts._structural_hash(other_loc, {}) == concepts._structural_hash(
+            source_location, {}
+        )
+        moved_loc = source_location.copy(update={"line": source_location.line + 1})
+        assert concepts._structural_hash(moved_loc, {}) != concepts._structural_hash(
+            source_location, {}
+        )
+
+    def test_structural_hash_ignores_source_locations(self, source_location):
+        node = definitions.LocationNode(loc=source_location)
+        moved = node.copy(
+            update={"loc": source_location.copy(update={"line": source_location.line + 1})}
+        )
+        assert moved.structural_hash() == node.structural_hash()
+        assert moved.structurally_equal(node)
+
+    def test_structural_hash_mutation(self):
+        node = definitions.make_compound_node()
+        node_hash = node.structural_hash()
+        other = node.copy(deep=True)
+        assert other.structurally_equal(node)
+
+        other.simple.int_value += 1
+        assert other.structural_hash() != node_hash
+        assert not other.structurally_equal(node)
+        assert node.structural_hash() == node_hash
+
+        # changes in place of collections are also detected
+        node = definitions.make_node_with_symbol_table()
+        node_hash = node.structural_hash()
+        node.list_with_name.append(node.list_with_name[0].copy())
+        assert node.structural_hash() != node_hash
+        assert getattr(node, "_shash_", None) is None
+
+    def test_frozen_structural_hash(self, frozen_sample_node):
+        node_hash = frozen_sample_node.structural_hash()
+        assert frozen_sample_node._shash_ == node_hash
+
+    def test_structural_equality(self):
+        node = definitions.make_simple_node()
+        assert not node.structurally_equal(None)
+        assert not node.structurally_equal(node.dict())
+        assert not node.structurally_equal(node.copy(update={"int_value": node.int_value + 1}))
+        assert not definitions.make_compound_node().structurally_equal(
+            definitions.make_compound_node()
+        )
+
+        rebuilt = definitions.SimpleNode(**node.dict(exclude={"id_"}))
+        assert rebuilt.id_ != node.id_
+        assert rebuilt.structural_hash() == node.structural_hash()
+        assert rebuilt.structurally_equal(node)
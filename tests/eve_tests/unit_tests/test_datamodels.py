@@ -44,7 +44,7 @@ import factory
 import pytest
 import pytest_factoryboy as pytfboy
 
-from eve import datamodels, utils
+from eve import concepts, datamodels, utils, visitors
 
 
 T = TypeVar("T")
@@ -748,6 +748,22 @@ def test_non_instantiable():
         NonInstantiableModel2()
 
 
+def test_slots():
+    @datamodels.datamodel(slots=True)
+    class SlottedModel:
+        value: int
+        other: List[int] = datamodels.field(default_factory=list)
+
+    assert SlottedModel.__datamodel_params__.slots is True
+    model = SlottedModel(value=1)
+    assert not hasattr(model, "__dict__")
+    assert model.value == 1 and model.other == []
+    with pytest.raises(AttributeError):
+        model.undeclared = 1
+    with pytest.raises(TypeError, match="'value'"):
+        SlottedModel(value="1")
+
+
 # Test module functions
 def test_info_functions():
     @datamodels.datamodel
@@ -856,3 +872,110 @@ def test_concrete_field_type_validation(
     for value in wrong_values:
         with pytest.raises((TypeError, ValueError), match="'value'"):
             Model(value=value)
+
+
+# Test slotted nodes
+class SlottedExpr(datamodels.SlottedNode):
+    pass
+
+
+class SlottedLiteral(SlottedExpr):
+    value: int
+    description: str = "literal"
+
+
+class SlottedOffset(datamodels.SlottedNode, frozen=True):
+    i: int
+
+
+class SlottedSum(SlottedExpr):
+    terms: List[SlottedExpr]
+    offsets: List[SlottedOffset] = datamodels.field(default_factory=list)
+    loc_: str = ""
+
+
+def _make_slotted_tree():
+    return SlottedSum(
+        terms=[SlottedLiteral(value=1), SlottedLiteral(value=2)], offsets=[SlottedOffset(i=1)]
+    )
+
+
+def test_slotted_node_fields():
+    tree = _make_slotted_tree()
+    assert not hasattr(tree, "__dict__")
+    assert isinstance(tree, concepts.AbstractNode)
+    assert list(SlottedSum.__node_children__) == ["terms", "offsets"]
+    assert list(SlottedSum.__node_impl_fields__) == ["loc_"]
+    assert [name for name, _ in tree.iter_children()] == ["terms", "offsets"]
+    assert [name for name, _ in tree.iter_impl_fields()] == ["loc_"]
+    assert [type(node) for node in tree.iter_tree().if_isinstance(datamodels.SlottedNode)] == [
+        SlottedSum,
+        SlottedLiteral,
+        SlottedLiteral,
+        SlottedOffset,
+    ]
+    with pytest.raises(TypeError, match="'terms'"):
+        SlottedSum(terms=[1])
+
+
+def test_slotted_node_frozen():
+    import attr
+
+    assert SlottedOffset.__node_frozen__ is True and SlottedSum.__node_frozen__ is False
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        SlottedOffset(i=1).i = 2
+
+    class FrozenChild(SlottedOffset):
+        j: int = 0
+
+    assert FrozenChild.__node_frozen__ is True
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        FrozenChild(i=1).j = 2
+
+
+def test_slotted_node_construct_trusted():
+    literal = SlottedLiteral.construct_trusted(value="not validated")
+    assert literal.value == "not validated" and literal.description == "literal"
+
+    tree = SlottedSum.construct_trusted(terms=[literal])
+    assert tree.offsets == [] and tree.loc_ == ""
+    assert tree.offsets is not SlottedSum.construct_trusted(terms=[]).offsets
+
+
+def test_slotted_node_visitors():
+    class Collector(visitors.NodeVisitor):
+        def visit_SlottedExpr(self, node, *, names, **kwargs):
+            names.append(type(node).__name__)
+            self.generic_visit(node, names=names, **kwargs)
+
+        def visit_SlottedOffset(self, node, *, names, **kwargs):
+            names.append(f"offset {node.i}")
+
+    class Incrementer(visitors.NodeTranslator):
+        def visit_SlottedLiteral(self, node, **kwargs):
+            return SlottedLiteral(value=node.value + 1)
+
+    tree = _make_slotted_tree()
+    names: List[str] = []
+    Collector().visit(tree, names=names)
+    assert names == ["SlottedSum", "SlottedLiteral", "SlottedLiteral", "offset 1"]
+
+    tree_copy = visitors.NodeTranslator().visit(tree)
+    assert tree_copy == tree and tree_copy is not tree
+    assert tree_copy.terms[0] is not tree.terms[0]
+
+    incremented = Incrementer().visit(tree)
+    assert [term.value for term in incremented.terms] == [2, 3]
+    assert [term.value for term in tree.terms] == [1, 2]
+
+
+def test_slotted_node_structural_hash():
+    tree = _make_slotted_tree()
+    hash_value = tree.structural_hash()
+    assert hash_value == _make_slotted_tree().structural_hash()
+    assert tree.structurally_equal(_make_slotted_tree())
+
+    tree.terms[0].value = 10
+    assert tree.structural_hash() != hash_value
+    assert not tree.structurally_equal(_make_slotted_tree())
+    assert SlottedOffset(i=1).structural_hash() == SlottedOffset(i=1).structural_hash()
@@ -110,3 +110,51 @@ def test_iter_tree(tree):
         traversals.append([value for value in eve.iter_tree(tree, order)])
 
     assert all(len(traversals[0]) == len(t) for t in traversals)
+
+
+def _recursive_iter_tree_pre(node, key=None):
+    yield key, node
+    for child_key, child in eve.iterators.generic_iter_children(node, with_keys=True):
+        yield from _recursive_iter_tree_pre(child, child_key)
+
+
+def _recursive_iter_tree_post(node, key=None):
+    for child_key, child in eve.iterators.generic_iter_children(node, with_keys=True):
+        yield from _recursive_iter_tree_post(child, child_key)
+    yield key, node
+
+
+@pytest.mark.parametrize(
+    ["order", "reference"],
+    [
+        (eve.iterators.TraversalOrder.PRE_ORDER, _recursive_iter_tree_pre),
+        (eve.iterators.TraversalOrder.POST_ORDER, _recursive_iter_tree_post),
+    ],
+)
+def test_iter_tree_dfs_keys(dfs_ordered_tree, order, reference):
+    expected = list(reference(dfs_ordered_tree))
+    items = list(eve.iter_tree(dfs_ordered_tree, order, with_keys=True))
+    assert [key for key, _ in items] == [key for key, _ in expected]
+    assert all(item is expected_item for (_, item), (_, expected_item) in zip(items, expected))
+    values = list(eve.iter_tree(dfs_ordered_tree, order))
+    assert all(item is value for (_, item), value in zip(items, values))
+
+
+def test_iter_tree_levels_keys(bfs_ordered_tree):
+    items = list(eve.iterators.iter_tree_levels(bfs_ordered_tree, with_keys=True))
+    n_children = len(bfs_ordered_tree.children)
+    assert items[0] == (None, bfs_ordered_tree)
+    assert items[1] == ("children", bfs_ordered_tree.children)
+    assert [key for key, _ in items[2 : 2 + n_children]] == list(range(n_children))
+    assert all(item is child for (_, item), child in zip(items[2:], bfs_ordered_tree.children))
+
+
+@pytest.mark.parametrize("order", [*eve.iterators.TraversalOrder])
+def test_iter_tree_deep(order):
+    depth = 5000
+    tree = Tree(children=[0])
+    for value in range(1, depth):
+        tree = Tree(children=[value, tree])
+
+    values = [value for value in eve.iter_tree(tree, order) if isinstance(value, int)]
+    assert sorted(values) == list(range(depth))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2020, CSCS - Swiss National Supercomputing Center, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+
+import pytest
+
+import eve
+from eve import parallel
+from eve.utils import UIDGenerator
+
+from .. import definitions
+
+
+class IntIncrementer(eve.NodeTranslator):
+    def __init__(self):
+        self.visited = 0
+
+    def visit_SimpleNode(self, node, *, increment, **kwargs):
+        self.visited += 1
+        # validated construction: new nodes get new sequential ids
+        return definitions.SimpleNode(
+            **{**node.dict(exclude={"id_"}), "int_value": node.int_value + increment}
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_map_visit(max_workers):
+    nodes = [definitions.make_simple_node() for _ in range(7)]
+    visitor = IntIncrementer()
+    results = parallel.map_visit(visitor, nodes, max_workers=max_workers, increment=2)
+
+    assert [result.int_value for result in results] == [node.int_value + 2 for node in nodes]
+    assert len({result.id_ for result in results}) == len(nodes)
+    assert visitor.visited == 0
+
+
+def test_map_visit_with_executor():
+    nodes = [definitions.make_simple_node() for _ in range(3)]
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        results = parallel.map_visit(IntIncrementer(), nodes, executor=executor, increment=2)
+
+    assert [result.int_value for result in results] == [node.int_value + 2 for node in nodes]
+
+
+def test_deterministic_ids():
+    nodes = [definitions.make_simple_node() for _ in range(7)]
+    start = UIDGenerator.reserve_sequence(10 ** 9)
+
+    # the same ids as generated by visiting the nodes in order in this process
+    with UIDGenerator.sequence_block(start, 10 ** 9):
+        expected = [copy.copy(IntIncrementer()).visit(node, increment=1) for node in nodes]
+        next_id = UIDGenerator.sequential_id()
+
+    for max_workers in (1, 2, 3):
+        with UIDGenerator.sequence_block(start, 10 ** 9):
+            with parallel.workers(max_workers):
+                assert parallel.map_visit(IntIncrementer(), nodes, increment=1) == expected
+            assert UIDGenerator.sequential_id() == next_id
+
+
+def test_workers():
+    assert parallel._max_workers == 1
+    with parallel.workers(4):
+        assert parallel._max_workers == 4
+        with parallel.workers(None):
+            assert parallel._max_workers >= 1
+        assert parallel._max_workers == 4
+    assert parallel._max_workers == 1
+
+
+def test_shared_executor():
+    nodes = [definitions.make_simple_node() for _ in range(3)]
+    with parallel.workers(2):
+        assert parallel._executor is None
+        parallel.map_visit(IntIncrementer(), nodes, increment=1)
+        executor = parallel._executor
+        assert executor is not None
+        parallel.map_visit(IntIncrementer(), nodes, increment=1)
+        assert parallel._executor is executor
+    assert parallel._executor is None
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2020, CSCS - Swiss National Supercomputing Center, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import eve
+from eve import datamodels, exceptions, serialization
+from eve.typingx import List
+
+from .. import definitions
+
+
+def test_round_trip(sample_node):
+    loaded = serialization.loads(serialization.dumps(sample_node))
+    assert loaded == sample_node
+    assert type(loaded) is type(sample_node)
+    assert loaded.__fields_set__ == set(type(sample_node).__fields__)
+    assert eve.validate_tree(loaded) == sample_node
+
+
+def test_round_trip_file(sample_node):
+    buffer = io.BytesIO()
+    serialization.dump([sample_node, {"node": sample_node}], buffer)
+    buffer.seek(0)
+    loaded = serialization.load(buffer)
+    assert loaded == [sample_node, {"node": sample_node}]
+    assert loaded[0] is loaded[1]["node"]
+
+
+def test_persistent_ids():
+    node = definitions.make_simple_node()
+    data = serialization.dumps(
+        [node, node.id_], persistent_id=lambda value: "ID" if value == node.id_ else None
+    )
+    loaded = serialization.loads(data, persistent_load={"ID": "new_id"}.__getitem__)
+    assert loaded[0].id_ == loaded[1] == "new_id"
+    assert loaded[0].dict(exclude={"id_"}) == node.dict(exclude={"id_"})
+
+
+def test_compact_format():
+    import pickle
+
+    nodes = [definitions.make_compound_node() for _ in range(10)]
+    assert len(serialization.dumps(nodes)) < len(pickle.dumps(nodes, protocol=5))
+
+
+def test_symbol_table():
+    node = definitions.make_node_with_symbol_table()
+    loaded = serialization.loads(serialization.dumps(node))
+    assert loaded == node
+    assert loaded.symtable_[node.node_with_name.name] is loaded.node_with_name
+
+
+class SlottedLiteral(datamodels.SlottedNode):
+    value: int
+
+
+class SlottedSum(datamodels.SlottedNode, frozen=True):
+    terms: List[SlottedLiteral]
+
+
+def test_slotted_nodes():
+    tree = SlottedSum(terms=[SlottedLiteral(value=1), SlottedLiteral(value=2)])
+    loaded = serialization.loads(serialization.dumps(tree))
+    assert loaded == tree
+    assert loaded.structural_hash() == tree.structural_hash()
+
+
+def test_invalid_data(sample_node):
+    data = serialization.dumps(sample_node)
+    with pytest.raises(exceptions.EveValueError, match="not a serialized"):
+        serialization.loads(data[1:])
+    with pytest.raises(exceptions.EveValueError, match="format version"):
+        serialization.loads(
+            serialization._HEADER.pack(serialization._MAGIC, serialization.FORMAT_VERSION + 1)
+            + data[serialization._HEADER.size :]
+        )
+
+
+def test_changed_node_definition():
+    tree = SlottedSum(terms=[SlottedLiteral(value=1)])
+    data = serialization.dumps(tree)
+
+    schema = serialization._schemas.pop(SlottedLiteral)
+    try:
+        serialization._schemas[SlottedLiteral] = serialization._NodeSchema(
+            SlottedLiteral, ("value", "new_field")
+        )
+        with pytest.raises(exceptions.EveValueError, match="SlottedLiteral"):
+            serialization.loads(data)
+    finally:
+        serialization._schemas[SlottedLiteral] = schema
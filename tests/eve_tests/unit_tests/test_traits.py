@@ -17,6 +17,9 @@
 
 from __future__ import annotations
 
+import collections.abc
+import copy
+
 import pytest
 
 import eve
@@ -58,7 +61,7 @@ class TestSymbolTable:
     def test_symbol_table_creation(self, symtable_node_and_expected_symbols):
         node, expected_symbols = symtable_node_and_expected_symbols
         collected_symtable = node.symtable_
-        assert isinstance(node.symtable_, dict)
+        assert isinstance(node.symtable_, collections.abc.Mapping)
         assert all(isinstance(key, str) for key in collected_symtable)
 
     def test_symbol_table_collection(self, symtable_node_and_expected_symbols):
@@ -69,3 +72,62 @@ class TestSymbolTable:
             collected_symtable[symbol_name] is symbol_node
             for symbol_name, symbol_node in expected_symbols.items()
         )
+
+    def test_symbol_table_lazy_collection(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        assert node.symtable_._symbols is None
+        assert dict(node.symtable_) == expected_symbols
+        assert node.symtable_._symbols is not None
+
+    def test_symbol_table_incremental_update(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        assert dict(node.symtable_) == expected_symbols
+        list_symbols = [child._symbols_ for child in node.list_with_name]
+
+        old_name = node.node_with_name.name
+        node.node_with_name = definitions.make_simple_node_with_symbol_name()
+        assert old_name not in node.symtable_
+        assert node.symtable_[node.node_with_name.name] is node.node_with_name
+        assert [child._symbols_ for child in node.list_with_name] == list_symbols
+
+    def test_symbol_table_of_rebuilt_nodes(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        assert dict(node.symtable_) == expected_symbols
+        compound_symbols = node.compound_with_name._symbols_
+
+        new_node = definitions.make_simple_node_with_symbol_name()
+        rebuilt = node.__class__(
+            **{**dict(node.iter_children()), "list_with_name": [*node.list_with_name, new_node]}
+        )
+        assert rebuilt.symtable_ == {**expected_symbols, new_node.name: new_node}
+        assert all(rebuilt.symtable_[child.name] is child for child in rebuilt.list_with_name)
+        # symbols of the reused child nodes are not collected again
+        assert rebuilt.compound_with_name._symbols_ is compound_symbols
+
+    @pytest.mark.skipif(not __debug__, reason="in-place changes are only detected in debug mode")
+    def test_symbol_table_in_place_update(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        assert dict(node.symtable_) == expected_symbols
+
+        new_node = definitions.make_simple_node_with_symbol_name()
+        node.list_with_name.append(new_node)
+        assert node.symtable_[new_node.name] is new_node
+
+        old_name = node.list_with_name[0].name
+        other_node = definitions.make_simple_node_with_symbol_name()
+        node.list_with_name[0] = other_node
+        assert old_name not in node.symtable_
+        assert node.symtable_[other_node.name] is other_node
+
+    def test_symbol_table_of_copies(self, symtable_node_and_expected_symbols):
+        node, expected_symbols = symtable_node_and_expected_symbols
+        assert dict(node.symtable_) == expected_symbols
+
+        node_copy = copy.deepcopy(node)
+        assert node_copy.symtable_ == node.symtable_
+        assert node_copy.symtable_[node.node_with_name.name] is node_copy.node_with_name
+
+        new_node = definitions.make_simple_node_with_symbol_name()
+        node_copy = node.copy(update={"node_with_name": new_node})
+        assert node_copy.symtable_[new_node.name] is new_node
+        assert node.symtable_[node.node_with_name.name] is node.node_with_name
@@ -165,6 +165,18 @@ def test_shash(unique_data_items, hash_algorithm):
     assert len(hashes) == len(unique_data_items)
 
 
+def test_shash_nodes():
+    from eve.utils import shash
+
+    from .. import definitions
+
+    node = definitions.make_compound_node()
+    node_copy = node.copy(update={"id_": "other_id"})
+    assert shash(node) == shash(node_copy)
+    assert shash([node, 1]) == shash([node_copy, 1])
+    assert shash(node) != shash(definitions.make_compound_node())
+
+
 # -- CaseStyleConverter --
 @pytest.fixture
 def name_with_cases():
@@ -239,6 +251,36 @@ class TestUIDGenerator:
         with pytest.warns(RuntimeWarning, match="Unsafe reset"):
             UIDGenerator.reset_sequence(counter)
 
+    def test_sequence_block(self):
+        from eve.utils import UIDGenerator
+
+        start = UIDGenerator.reserve_sequence(3)
+        assert int(UIDGenerator.sequential_id()) == start + 3
+        with UIDGenerator.sequence_block(start, 3):
+            assert [int(UIDGenerator.sequential_id()) for _ in range(3)] == [
+                start,
+                start + 1,
+                start + 2,
+            ]
+        assert int(UIDGenerator.sequential_id()) == start + 4
+
+        with pytest.raises(RuntimeError, match="More than 3"):
+            with UIDGenerator.sequence_block(start, 3):
+                for _ in range(4):
+                    UIDGenerator.sequential_id()
+
+    def test_recording(self):
+        from eve.utils import UIDGenerator
+
+        with UIDGenerator.recording() as recorded:
+            first = UIDGenerator.sequential_id(prefix="a")
+            with UIDGenerator.recording() as inner_recorded:
+                second = UIDGenerator.sequential_id(width=8)
+        UIDGenerator.sequential_id()
+
+        assert inner_recorded == [(second, None, 8)]
+        assert recorded == [(first, "a", None), (second, None, 8)]
+
 
 # -- Iterators --
 def test_xiter():
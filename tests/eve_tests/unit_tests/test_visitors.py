@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from __future__ import annotations
+
+from typing import Any, ClassVar, Dict, List
+
+import pydantic
+import pytest
+
+import eve
+
+from .. import definitions
+
+
+class BaseExpr(eve.Node):
+    pass
+
+
+class Literal(BaseExpr):
+    value: int
+
+
+class Negation(BaseExpr):
+    expr: BaseExpr
+
+
+class Sum(BaseExpr):
+    terms: List[BaseExpr]
+
+
+class Total(eve.Node):
+    terms: List[Literal]
+    total: int = 0
+
+    validations: ClassVar[int] = 0
+
+    @pydantic.root_validator(skip_on_failure=True)
+    def _total_validator(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        cls.validations += 1
+        values["total"] = sum(term.value for term in values["terms"])
+        return values
+
+
+def _make_tree():
+    return Sum(terms=[Literal(value=1), Negation(expr=Literal(value=2)), Literal(value=3)])
+
+
+class ClassNameCollector(eve.NodeVisitor):
+    def visit_BaseExpr(self, node, *, names, **kwargs):
+        names.append("BaseExpr")
+        self.generic_visit(node, names=names, **kwargs)
+
+    def visit_Literal(self, node, *, names, **kwargs):
+        names.append("Literal")
+
+
+def test_dispatch():
+    names = []
+    ClassNameCollector().visit(_make_tree(), names=names)
+    assert names == ["BaseExpr", "Literal", "BaseExpr", "Literal", "Literal"]
+    assert ClassNameCollector._dispatch_table_[Sum] is ClassNameCollector.visit_BaseExpr
+    assert ClassNameCollector._dispatch_table_[Literal] is ClassNameCollector.visit_Literal
+    assert ClassNameCollector._dispatch_table_[list] is ClassNameCollector.generic_visit
+
+
+def test_dispatch_tables_of_subclasses():
+    class NegationCollector(ClassNameCollector):
+        @staticmethod
+        def visit_Negation(node, *, names, **kwargs):
+            names.append("Negation")
+
+    names = []
+    NegationCollector().visit(_make_tree(), names=names)
+    assert names == ["BaseExpr", "Literal", "Negation", "Literal"]
+
+    names = []
+    ClassNameCollector().visit(_make_tree(), names=names)
+    assert names == ["BaseExpr", "Literal", "BaseExpr", "Literal", "Literal"]
+
+
+def test_dispatch_invalidation():
+    class Collector(ClassNameCollector):
+        pass
+
+    names = []
+    Collector().visit(_make_tree(), names=names)
+    assert Negation in Collector._dispatch_table_
+
+    def visit_Negation(self, node, *, names, **kwargs):
+        names.append("Negation")
+
+    # methods added to a base class after the first visit
+    ClassNameCollector.visit_Negation = visit_Negation
+    try:
+        names = []
+        Collector().visit(_make_tree(), names=names)
+        assert names == ["BaseExpr", "Literal", "Negation", "Literal"]
+    finally:
+        del ClassNameCollector.visit_Negation
+
+    names = []
+    Collector().visit(_make_tree(), names=names)
+    assert names == ["BaseExpr", "Literal", "BaseExpr", "Literal", "Literal"]
+
+
+class LiteralIncrementer(eve.NodeTranslator):
+    def visit_Literal(self, node, **kwargs):
+        return Literal(value=node.value + 1)
+
+
+def test_translator_trusted_copy():
+    tree = Total(terms=[Literal(value=1), Literal(value=2)])
+    validations = Total.validations
+
+    tree_copy = eve.NodeTranslator().visit(tree)
+    assert Total.validations == validations
+    assert tree_copy == tree
+    assert tree_copy.id_ == tree.id_
+    assert tree_copy is not tree and tree_copy.terms[0] is not tree.terms[0]
+
+    incremented = LiteralIncrementer().visit(tree)
+    assert Total.validations == validations + 1
+    assert incremented.total == 5
+
+
+def test_translator_trusted_copy_symbol_table():
+    node = definitions.make_node_with_symbol_table()
+    node_copy = eve.NodeTranslator().visit(node)
+    assert node_copy == node
+    assert node_copy.symtable_[node.node_with_name.name] is node_copy.node_with_name
+
+
+@pytest.mark.parametrize("trusted_construction", [True, False])
+def test_translator_removes_nodes(trusted_construction):
+    class LiteralRemover(eve.NodeTranslator):
+        def visit_Literal(self, node, **kwargs):
+            return eve.NOTHING if node.value == 2 else self.generic_visit(node, **kwargs)
+
+    LiteralRemover.trusted_construction = trusted_construction
+    tree = LiteralRemover().visit(Total(terms=[Literal(value=1), Literal(value=2)]))
+    assert [term.value for term in tree.terms] == [1]
+    assert tree.total == 1
+
+
+def test_validate_tree():
+    tree = Total.construct_trusted(terms=[Literal(value=1), Literal(value=2)], total=0)
+    assert tree.id_.startswith("Total")
+    assert eve.validate_tree(tree).total == 3
+
+    invalid_tree = Total.construct_trusted(terms=[Literal.construct_trusted(value="x")], total=0)
+    with pytest.raises(pydantic.ValidationError):
+        eve.validate_tree(invalid_tree)
@@ -14,6 +14,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import hashlib
+
 import pytest
 
 import gt4py
@@ -122,6 +124,66 @@ def test_jit_extrainfo(builder):
 
     assert "pyext_file_path" in builder.caching.cache_info
     assert "pyext_md5" in builder.caching.cache_info
+    assert "pyext_sources_sha256" in builder.caching.cache_info
+
+
+def test_jit_ir_cache(builder, monkeypatch):
+    from gt4py.backend.gtc_backend.gtcpp.backend import GTCGTExtGenerator
+
+    ifirst = builder(simple_stencil, "gtc:gt:cpu_ifirst").with_caching("jit")
+    kfirst = builder(simple_stencil, "gtc:gt:cpu_kfirst").with_caching("jit")
+    cache_path = ifirst.caching.ir_cache_path("oir")
+    assert cache_path == kfirst.caching.ir_cache_path("oir")
+    assert ifirst.stencil_id.version in cache_path.name
+    assert gt4py.utils.slugify(gt4py.__version__) in cache_path.name
+
+    cache_path.unlink(missing_ok=True)
+    build_info = {}
+    oir = ifirst.with_changed_options(build_info=build_info).backend.make_oir()
+    assert cache_path.exists()
+    assert build_info["oir_cached"] is False and "oir_pipeline" in build_info
+
+    # the cached OIR is reused by other GTC backends without lowering the stencil again
+    def make_oir(self, definition_ir):
+        raise AssertionError("OIR should be loaded from the cache")
+
+    monkeypatch.setattr(GTCGTExtGenerator, "make_oir", make_oir)
+    build_info = {}
+    assert kfirst.with_changed_options(build_info=build_info).backend.make_oir() == oir
+    assert build_info == {"oir_cached": True}
+    # also when generating the sources without building them (e.g. with gtpyc)
+    computation = kfirst.backend.generate_computation()
+    assert "computation.hpp" in computation[f"{kfirst.options.name}_src"]
+
+    monkeypatch.undo()
+    rebuild = kfirst.with_changed_options(rebuild=True)
+    assert rebuild.caching.ir_cache_path("oir") == cache_path
+    rebuilt_oir = rebuild.backend.make_oir()
+    # lowered again: only the unique ids of the nodes are different
+    assert rebuilt_oir != oir and rebuilt_oir.structurally_equal(oir)
+
+    cache_path.write_bytes(b"outdated")
+    ifirst = builder(simple_stencil, "gtc:gt:cpu_ifirst").with_caching("jit")
+    with pytest.warns(RuntimeWarning, match="OIR cache file"):
+        assert ifirst.backend.make_oir().structurally_equal(oir)
+
+
+def test_streamed_extension_sources(builder, monkeypatch):
+    from gt4py.backend import pyext_builder
+
+    builder = builder(simple_stencil, "gtc:gt:cpu_ifirst").with_caching("jit")
+    monkeypatch.setattr(
+        pyext_builder, "build_pybind_ext", lambda name, *args, **kwargs: (name, None)
+    )
+    builder.backend.generate_extension()
+
+    build_path = builder.backend.pyext_build_dir_path
+    sources_sha256 = builder.backend_data["pyext_sources_sha256"]
+    assert set(sources_sha256) == {"computation.hpp", "bindings.cpp"}
+    for file_name, sha256 in sources_sha256.items():
+        assert hashlib.sha256((build_path / file_name).read_bytes()).hexdigest() == sha256
+    # streamed sources are not kept in memory
+    assert "computation_src" not in builder.backend_data
 
 
 def test_nocaching_paths(builder, tmp_path):
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+import gt4py.gtscript as gtscript
+from gt4py import distributed
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+
+
+@gtscript.stencil(backend="numpy")
+def laplacian(in_field: Field[np.float64], out_field: Field[np.float64], *, alpha: float):
+    with computation(PARALLEL), interval(...):
+        out_field = (  # noqa
+            alpha
+            * (in_field[1, 0, 0] + in_field[-1, 0, 0] + in_field[0, 1, 0] + in_field[0, -1, 0])
+            + (1.0 - 4.0 * alpha) * in_field[0, 0, 0]
+        )
+
+
+def test_decomposition():
+    decomposition = distributed.Decomposition((10, 7, 3), (3, 2), periodic=(True, False))
+    assert decomposition.size == 6
+    covered = np.zeros((10, 7), dtype=int)
+    for rank in range(decomposition.size):
+        (i_start, i_stop), (j_start, j_stop), k_bounds = decomposition.bounds(rank)
+        covered[i_start:i_stop, j_start:j_stop] += 1
+        assert k_bounds == (0, 3)
+    assert (covered == 1).all()
+
+    assert decomposition.rank((-1, 0)) == 2
+    assert decomposition.rank((0, -1)) is None
+    assert decomposition.block(decomposition.rank((2, 1))) == (2, 1)
+
+    with pytest.raises(ValueError):
+        distributed.Decomposition((2, 7, 3), (3, 2))
+
+
+def test_required_halo():
+    assert distributed.required_halo([laplacian]) == ((1, 1), (1, 1), (0, 0))
+    assert distributed.required_halo([laplacian], fields=["out_field"]) == ((0, 0),) * 3
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+@pytest.mark.parametrize("periodic", [(True, True), (False, True), (True, False)])
+def test_halo_exchange(use_executor, periodic):
+    decomposition = distributed.Decomposition((9, 8, 2), (3, 2), periodic=periodic)
+    halo = ((2, 1), (1, 2), (0, 0))
+    data = np.random.randn(*decomposition.domain)
+    field = distributed.DistributedStorage.from_array(data, "numpy", decomposition, halo)
+    np.testing.assert_equal(field.gather(), data)
+
+    if use_executor:
+        with distributed.Executor(max_workers=2) as executor:
+            executor.exchange(field)
+    else:
+        distributed.SharedMemoryTransport().exchange([field])
+
+    wrapped = np.pad(data, ((2, 1), (1, 2), (0, 0)), mode="wrap")
+    for rank in range(decomposition.size):
+        (i_start, i_stop), (j_start, j_stop), _ = decomposition.bounds(rank)
+        local = field[rank].view(np.ndarray)
+        expected = wrapped[i_start : i_stop + 3, j_start : j_stop + 3, :]
+        # halo points outside of a non-periodic domain are not exchanged
+        valid = np.ones(local.shape, dtype=bool)
+        if not periodic[0]:
+            valid[: 2 if i_start == 0 else 0] = False
+            valid[local.shape[0] - (1 if i_stop == 9 else 0) :] = False
+        if not periodic[1]:
+            valid[:, : 1 if j_start == 0 else 0] = False
+            valid[:, local.shape[1] - (2 if j_stop == 8 else 0) :] = False
+        np.testing.assert_equal(local[valid], expected[valid])
+        assert (local[~valid] == 0.0).all()
+
+
+def test_executor_run():
+    decomposition = distributed.Decomposition((12, 10, 3), (2, 2), periodic=(True, True))
+    halo = distributed.required_halo([laplacian])
+    data = np.random.randn(*decomposition.domain)
+    in_field = distributed.DistributedStorage.from_array(data, "numpy", decomposition, halo)
+    out_field = distributed.DistributedStorage("numpy", decomposition, halo, np.float64)
+
+    with distributed.Executor(max_workers=2) as executor:
+        executor.exchange(in_field)
+        executor.run(laplacian, in_field, out_field, alpha=0.1)
+        with pytest.raises(ValueError, match="implicit"):
+            executor.run(laplacian, in_field, out_field, alpha=0.1, origin=(0, 0, 0))
+
+    neighbors = sum(np.roll(data, shift, axis) for shift in (1, -1) for axis in (0, 1))
+    np.testing.assert_allclose(out_field.gather(), 0.1 * neighbors + 0.6 * data)
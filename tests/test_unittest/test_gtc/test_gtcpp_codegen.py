@@ -14,12 +14,28 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import io
+
 import pytest
 
 from gtc.gtcpp import gtcpp_codegen
 from gtc.gtcpp.gtcpp import GTLevel
 
+from .gtcpp_utils import ProgramFactory
+
 
 @pytest.mark.parametrize("root,expected", [(GTLevel(splitter=0, offset=5), 5)])
 def test_offset_limit(root, expected):
     assert gtcpp_codegen._offset_limit(root) == expected
+
+
+@pytest.mark.parametrize("format_source", [True, False])
+def test_apply_to(format_source):
+    program = ProgramFactory()
+    sink = io.StringIO()
+    gtcpp_codegen.GTCppCodegen.apply_to(
+        sink, program, gt_backend_t="cpu_ifirst", format_source=format_source
+    )
+    assert sink.getvalue() == gtcpp_codegen.GTCppCodegen.apply(
+        program, gt_backend_t="cpu_ifirst", format_source=format_source
+    )
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+from gtc import gtir
+from gtc.common import (
+    ArithmeticOperator,
+    BuiltInLiteral,
+    ComparisonOperator,
+    DataType,
+    LogicalOperator,
+    NativeFunction,
+)
+from gtc.passes.gtir_simplifier import _GTIRSimplification, simplify
+
+from .gtir_utils import (
+    BinaryOpFactory,
+    BlockStmtFactory,
+    FieldAccessFactory,
+    FieldDeclFactory,
+    FieldIfStmtFactory,
+    LiteralFactory,
+    ParAssignStmtFactory,
+    ScalarIfStmtFactory,
+    StencilFactory,
+    VerticalLoopFactory,
+)
+
+
+def _simplify_expr(expr):
+    return _GTIRSimplification().visit(expr)
+
+
+@pytest.mark.parametrize(
+    ["op", "left", "right", "dtype", "expected"],
+    [
+        (ArithmeticOperator.ADD, "1.5", "2.25", DataType.FLOAT64, "3.75"),
+        (ArithmeticOperator.MUL, "3", "-4", DataType.INT64, "-12"),
+        (ArithmeticOperator.DIV, "-7", "2", DataType.INT64, "-3"),
+        (ArithmeticOperator.DIV, "1.0", "3.0", DataType.FLOAT32, repr(0.3333333432674408)),
+    ],
+)
+def test_fold_arithmetic(op, left, right, dtype, expected):
+    testee = BinaryOpFactory(
+        op=op,
+        left=LiteralFactory(value=left, dtype=dtype),
+        right=LiteralFactory(value=right, dtype=dtype),
+    )
+    result = _simplify_expr(testee)
+    assert isinstance(result, gtir.Literal)
+    assert result.dtype == dtype
+    assert result.value == expected
+
+
+def test_no_fold_division_by_zero():
+    testee = BinaryOpFactory(
+        op=ArithmeticOperator.DIV,
+        left=LiteralFactory(value="1", dtype=DataType.INT64),
+        right=LiteralFactory(value="0", dtype=DataType.INT64),
+    )
+    assert isinstance(_simplify_expr(testee), gtir.BinaryOp)
+
+
+def test_fold_comparison():
+    testee = BinaryOpFactory(
+        op=ComparisonOperator.LT,
+        left=LiteralFactory(value="1.0", dtype=DataType.FLOAT64),
+        right=LiteralFactory(value="2.0", dtype=DataType.FLOAT64),
+    )
+    result = _simplify_expr(testee)
+    assert result.dtype == DataType.BOOL
+    assert result.value == BuiltInLiteral.TRUE
+
+
+@pytest.mark.parametrize(
+    ["op", "literal", "literal_is_left", "dtype"],
+    [
+        (ArithmeticOperator.ADD, "0", True, DataType.INT32),
+        (ArithmeticOperator.ADD, "0", False, DataType.INT32),
+        (ArithmeticOperator.ADD, "-0.0", False, DataType.FLOAT32),
+        (ArithmeticOperator.SUB, "0.0", False, DataType.FLOAT32),
+        (ArithmeticOperator.MUL, "1.0", True, DataType.FLOAT32),
+        (ArithmeticOperator.DIV, "1.0", False, DataType.FLOAT32),
+    ],
+)
+def test_neutral_elements(op, literal, literal_is_left, dtype):
+    field = FieldAccessFactory(name="foo", dtype=dtype)
+    literal_node = LiteralFactory(value=literal, dtype=dtype)
+    operands = {"left": literal_node, "right": field}
+    if not literal_is_left:
+        operands = {"left": field, "right": literal_node}
+    assert _simplify_expr(BinaryOpFactory(op=op, **operands)) == field
+
+
+@pytest.mark.parametrize(
+    ["op", "literal", "literal_is_left"],
+    [
+        # -0.0 + 0.0 is +0.0
+        (ArithmeticOperator.ADD, "0.0", True),
+        (ArithmeticOperator.ADD, "0.0", False),
+        (ArithmeticOperator.SUB, "-0.0", False),
+    ],
+)
+def test_no_simplification_of_signed_zeros(op, literal, literal_is_left):
+    field = FieldAccessFactory(name="foo")
+    literal_node = LiteralFactory(value=literal, dtype=field.dtype)
+    operands = {"left": literal_node, "right": field}
+    if not literal_is_left:
+        operands = {"left": field, "right": literal_node}
+    assert isinstance(_simplify_expr(BinaryOpFactory(op=op, **operands)), gtir.BinaryOp)
+
+
+def test_no_simplification_of_zero_minus_field():
+    testee = BinaryOpFactory(
+        op=ArithmeticOperator.SUB,
+        left=LiteralFactory(value="0.0"),
+        right=FieldAccessFactory(),
+    )
+    assert isinstance(_simplify_expr(testee), gtir.BinaryOp)
+
+
+def test_logical_absorbing_element():
+    testee = BinaryOpFactory(
+        op=LogicalOperator.AND,
+        left=FieldAccessFactory(dtype=DataType.BOOL),
+        right=LiteralFactory(value=BuiltInLiteral.FALSE, dtype=DataType.BOOL),
+    )
+    result = _simplify_expr(testee)
+    assert isinstance(result, gtir.Literal)
+    assert result.value == BuiltInLiteral.FALSE
+
+
+def test_fold_cast():
+    testee = gtir.Cast(dtype=DataType.FLOAT64, expr=LiteralFactory(value="2", dtype=DataType.INT64))
+    result = _simplify_expr(testee)
+    assert isinstance(result, gtir.Literal)
+    assert result.dtype == DataType.FLOAT64
+    assert result.value == "2.0"
+
+
+def test_pow_expansion():
+    field = FieldAccessFactory(name="foo", dtype=DataType.FLOAT64)
+    testee = gtir.NativeFuncCall(
+        func=NativeFunction.POW,
+        args=[
+            field,
+            gtir.Cast(dtype=DataType.FLOAT64, expr=LiteralFactory(value="3", dtype=DataType.INT64)),
+        ],
+    )
+    result = _simplify_expr(testee)
+    assert not result.iter_tree().if_isinstance(gtir.NativeFuncCall).to_list()
+    assert (
+        result.iter_tree().if_isinstance(gtir.BinaryOp).getattr("op").to_list()
+        == [ArithmeticOperator.MUL] * 2
+    )
+    assert result.iter_tree().if_isinstance(gtir.FieldAccess).getattr("name").to_set() == {"foo"}
+
+
+def test_no_pow_expansion_of_compound_base():
+    testee = gtir.NativeFuncCall(
+        func=NativeFunction.POW,
+        args=[
+            BinaryOpFactory(left__name="foo", right__name="bar"),
+            LiteralFactory(value="2.0"),
+        ],
+    )
+    result = _simplify_expr(testee)
+    assert isinstance(result, gtir.NativeFuncCall)
+    assert result.iter_tree().if_isinstance(gtir.FieldAccess).getattr("name").to_list() == [
+        "foo",
+        "bar",
+    ]
+
+
+def test_no_pow_expansion_for_non_integer_exponent():
+    testee = gtir.NativeFuncCall(
+        func=NativeFunction.POW,
+        args=[FieldAccessFactory(), LiteralFactory(value="0.5")],
+    )
+    assert isinstance(_simplify_expr(testee), gtir.NativeFuncCall)
+
+
+def test_ternary_op_with_constant_condition():
+    true_expr = FieldAccessFactory(name="foo")
+    testee = gtir.TernaryOp(
+        cond=BinaryOpFactory(
+            op=ComparisonOperator.GT,
+            left=LiteralFactory(value="2.0"),
+            right=LiteralFactory(value="1.0"),
+        ),
+        true_expr=true_expr,
+        false_expr=FieldAccessFactory(name="bar"),
+    )
+    assert _simplify_expr(testee) == true_expr
+
+
+def _constant_condition(value: bool):
+    return gtir.Literal(
+        value=BuiltInLiteral.TRUE if value else BuiltInLiteral.FALSE, dtype=DataType.BOOL
+    )
+
+
+def _params(*names):
+    return [FieldDeclFactory(name=name) for name in names]
+
+
+def test_dead_branch_elimination():
+    taken = ParAssignStmtFactory(left__name="taken", right__name="foo")
+    testee = StencilFactory(
+        vertical_loops__0__body=[
+            ScalarIfStmtFactory(
+                cond=_constant_condition(False),
+                true_branch=BlockStmtFactory(
+                    body=[ParAssignStmtFactory(left__name="dead", right__name="foo")]
+                ),
+                false_branch=BlockStmtFactory(body=[taken]),
+            )
+        ],
+        params=_params("taken", "dead", "foo"),
+    )
+    result = simplify(testee)
+    assert result.vertical_loops[0].body == [taken]
+
+
+def test_field_if_with_folded_condition():
+    testee = StencilFactory(
+        vertical_loops__0__body=[
+            ParAssignStmtFactory(left__name="foo", right__name="baz"),
+            FieldIfStmtFactory(
+                cond=BinaryOpFactory(
+                    op=LogicalOperator.OR,
+                    left=FieldAccessFactory(name="cond", dtype=DataType.BOOL),
+                    right=_constant_condition(True),
+                ),
+                true_branch=BlockStmtFactory(
+                    body=[ParAssignStmtFactory(left__name="bar", right__name="baz")]
+                ),
+            ),
+        ],
+        params=_params("foo", "bar", "baz", "cond"),
+    )
+    result = simplify(testee)
+    assert not result.iter_tree().if_isinstance(gtir.FieldIfStmt).to_list()
+    assert [stmt.left.name for stmt in result.vertical_loops[0].body] == ["foo", "bar"]
+
+
+def _dead_vertical_loop():
+    return VerticalLoopFactory(
+        body=[
+            ScalarIfStmtFactory(
+                cond=_constant_condition(False),
+                true_branch=BlockStmtFactory(
+                    body=[ParAssignStmtFactory(left__name="foo", right__name="bar")]
+                ),
+            )
+        ]
+    )
+
+
+def test_empty_vertical_loops_are_removed():
+    live_vertical_loop = VerticalLoopFactory(
+        body=[ParAssignStmtFactory(left__name="foo", right__name="bar")]
+    )
+    testee = StencilFactory(
+        vertical_loops=[_dead_vertical_loop(), live_vertical_loop, _dead_vertical_loop()],
+        params=_params("foo", "bar"),
+    )
+    assert [loop.body for loop in simplify(testee).vertical_loops] == [live_vertical_loop.body]
+
+
+def test_one_vertical_loop_is_kept():
+    testee = StencilFactory(
+        vertical_loops=[_dead_vertical_loop(), _dead_vertical_loop()],
+        params=_params("foo", "bar"),
+    )
+    vertical_loops = simplify(testee).vertical_loops
+    assert len(vertical_loops) == 1
+    assert not vertical_loops[0].body
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from gtc import oir
+from gtc.passes.oir_extents import compute_horizontal_execution_extents
+
+from .oir_utils import (
+    AssignStmtFactory,
+    HorizontalExecutionFactory,
+    StencilFactory,
+    TemporaryFactory,
+    VerticalLoopFactory,
+)
+
+
+def _extents(stencil):
+    extents = compute_horizontal_execution_extents(stencil)
+    return [
+        (extents[id(he)].i, extents[id(he)].j)
+        for he in stencil.iter_tree().if_isinstance(oir.HorizontalExecution)
+    ]
+
+
+def test_no_offsets():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp")]),
+            HorizontalExecutionFactory(body=[AssignStmtFactory(right__name="tmp")]),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    assert _extents(testee) == [((0, 0), (0, 0)), ((0, 0), (0, 0))]
+
+
+def test_offset_read_extends_producer():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp")]),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(right__name="tmp", right__offset__i=1)]
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(right__name="tmp", right__offset__j=-2)]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    assert _extents(testee) == [
+        ((0, 1), (-2, 0)),
+        ((0, 0), (0, 0)),
+        ((0, 0), (0, 0)),
+    ]
+
+
+def test_extents_accumulate_over_chains():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp1")])
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions=[
+                    HorizontalExecutionFactory(
+                        body=[
+                            AssignStmtFactory(
+                                left__name="tmp2", right__name="tmp1", right__offset__i=-1
+                            )
+                        ]
+                    ),
+                    HorizontalExecutionFactory(
+                        body=[AssignStmtFactory(right__name="tmp2", right__offset__i=-1)]
+                    ),
+                ]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    assert _extents(testee) == [
+        ((-2, 0), (0, 0)),
+        ((-1, 0), (0, 0)),
+        ((0, 0), (0, 0)),
+    ]
+
+
+def test_executions_with_equal_ids():
+    producer = HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="tmp")])
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            producer,
+            HorizontalExecutionFactory(
+                id_=producer.id_, body=[AssignStmtFactory(right__name="tmp", right__offset__i=1)]
+            ),
+        ],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    assert _extents(testee) == [((0, 1), (0, 0)), ((0, 0), (0, 0))]
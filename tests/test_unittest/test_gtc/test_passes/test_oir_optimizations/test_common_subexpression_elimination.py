@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from eve import parallel
+from eve.utils import UIDGenerator
+from gtc import oir
+from gtc.common import ArithmeticOperator, ComparisonOperator, DataType
+from gtc.passes.oir_optimizations.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    FieldAccessFactory,
+    HorizontalExecutionFactory,
+    StencilFactory,
+)
+
+
+def difference(name: str) -> oir.BinaryOp:
+    return oir.BinaryOp(
+        op=ArithmeticOperator.SUB,
+        left=FieldAccessFactory(name=name, offset__i=1),
+        right=FieldAccessFactory(name=name),
+    )
+
+
+def count_differences(node) -> int:
+    return len(
+        node.iter_tree()
+        .if_isinstance(oir.BinaryOp)
+        .filter(lambda op: op.op == ArithmeticOperator.SUB)
+        .to_list()
+    )
+
+
+def test_repeated_expression_is_computed_once():
+    testee = HorizontalExecutionFactory(
+        body=[
+            AssignStmtFactory(left__name="out1", right=difference("inp")),
+            AssignStmtFactory(
+                left__name="out2",
+                right=oir.BinaryOp(
+                    op=ArithmeticOperator.MUL, left=difference("inp"), right=difference("inp")
+                ),
+            ),
+        ]
+    )
+    transformed = CommonSubexpressionElimination().visit(testee)
+
+    assert count_differences(transformed) == 1
+    assert len(transformed.declarations) == 1
+    local = transformed.declarations[0]
+    assert local.dtype == DataType.FLOAT32
+    assert len(transformed.body) == 3
+    assert transformed.body[0].left.name == local.name
+    assert transformed.body[1].right.name == local.name
+    assert transformed.body[2].right.left.name == local.name
+    assert transformed.body[2].right.right.name == local.name
+
+
+def test_largest_expression_first():
+    product = oir.BinaryOp(op=ArithmeticOperator.MUL, left=difference("a"), right=difference("b"))
+    testee = HorizontalExecutionFactory(
+        body=[
+            AssignStmtFactory(left__name="out1", right=product),
+            AssignStmtFactory(left__name="out2", right=product.copy()),
+        ]
+    )
+    transformed = CommonSubexpressionElimination().visit(testee)
+
+    assert len(transformed.declarations) == 1
+    assert count_differences(transformed) == 2
+    assert isinstance(transformed.body[0].right, oir.BinaryOp)
+    assert transformed.body[0].right.op == ArithmeticOperator.MUL
+
+
+def test_intermediate_write_invalidates():
+    testee = HorizontalExecutionFactory(
+        body=[
+            AssignStmtFactory(left__name="out1", right=difference("inp")),
+            AssignStmtFactory(left__name="inp"),
+            AssignStmtFactory(left__name="out2", right=difference("inp")),
+        ]
+    )
+    transformed = CommonSubexpressionElimination().visit(testee)
+
+    assert not transformed.declarations
+    assert count_differences(transformed) == 2
+
+
+def test_ternary_branches_not_hoisted():
+    cond = oir.BinaryOp(
+        op=ComparisonOperator.GT, left=FieldAccessFactory(name="c"), right=FieldAccessFactory()
+    )
+    testee = HorizontalExecutionFactory(
+        body=[
+            AssignStmtFactory(
+                left__name="out1",
+                right=oir.TernaryOp(
+                    cond=cond, true_expr=difference("inp"), false_expr=FieldAccessFactory()
+                ),
+            ),
+            AssignStmtFactory(
+                left__name="out2",
+                right=oir.TernaryOp(
+                    cond=cond.copy(), true_expr=difference("inp"), false_expr=FieldAccessFactory()
+                ),
+            ),
+        ]
+    )
+    transformed = CommonSubexpressionElimination().visit(testee)
+
+    assert count_differences(transformed) == 2
+
+
+def test_stencil_stays_valid():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="out1", right=difference("inp")),
+            AssignStmtFactory(left__name="out2", right=difference("inp")),
+        ]
+    )
+    transformed = CommonSubexpressionElimination().visit(testee)
+
+    locals_ = transformed.iter_tree().if_isinstance(oir.LocalScalar).getattr("name").to_set()
+    assert len(locals_) == 1
+    assert locals_ <= set(transformed.symtable_)
+
+
+def test_parallel_execution():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[
+                    AssignStmtFactory(left__name="out1", right=difference(name)),
+                    AssignStmtFactory(left__name="out2", right=difference(name)),
+                ]
+            )
+            for name in ("a", "b", "c")
+        ]
+    )
+    start = UIDGenerator.reserve_sequence(10 ** 9)
+    with UIDGenerator.sequence_block(start, 10 ** 9):
+        transformed = CommonSubexpressionElimination().visit(testee)
+    with UIDGenerator.sequence_block(start, 10 ** 9), parallel.workers(2):
+        transformed_in_parallel = CommonSubexpressionElimination().visit(testee)
+
+    assert count_differences(transformed) == 3
+    assert transformed_in_parallel == transformed
+
+
+def test_local_names_are_unique_and_stable():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[
+                    AssignStmtFactory(left__name="out1", right=difference(name)),
+                    AssignStmtFactory(left__name="out2", right=difference(name)),
+                ]
+            )
+            for name in ("a", "b", "c")
+        ]
+    )
+
+    def local_names():
+        transformed = CommonSubexpressionElimination().visit(testee)
+        return [
+            [decl.name for decl in horizontal_execution.declarations]
+            for horizontal_execution in transformed.iter_tree().if_isinstance(
+                oir.HorizontalExecution
+            )
+        ]
+
+    assert local_names() == [["cse_0"], ["cse_1"], ["cse_2"]]
+    UIDGenerator.sequential_id(prefix="cse")
+    assert local_names() == [["cse_0"], ["cse_1"], ["cse_2"]]
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from gtc import common, oir
+from gtc.passes.oir_optimizations.dead_code_elimination import DeadCodeElimination
+
+from ...oir_utils import (
+    AssignStmtFactory,
+    FieldAccessFactory,
+    FieldDeclFactory,
+    HorizontalExecutionFactory,
+    IntervalFactory,
+    StencilFactory,
+    TemporaryFactory,
+    VerticalLoopFactory,
+    VerticalLoopSectionFactory,
+)
+
+
+def written_names(node):
+    return node.iter_tree().if_isinstance(oir.AssignStmt).getattr("left").getattr("name").to_list()
+
+
+def test_unused_temporary_is_removed():
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions__0__body=[
+            AssignStmtFactory(left__name="tmp", right__name="inp"),
+            AssignStmtFactory(left__name="out", right__name="inp"),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    assert written_names(transformed) == ["out"]
+    assert not transformed.declarations
+
+
+def test_transitively_used_temporaries_are_kept():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp1", right__name="inp")
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp2", right__name="tmp1", right__offset__k=1),
+                    AssignStmtFactory(left__name="out", right__name="tmp2"),
+                ]
+            ),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp1"), TemporaryFactory(name="tmp2")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    assert written_names(transformed) == ["tmp1", "tmp2", "out"]
+    assert len(transformed.declarations) == 2
+
+
+def test_empty_vertical_loops_are_removed():
+    testee = StencilFactory(
+        vertical_loops=[
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="tmp", right__name="inp")
+                ]
+            ),
+            VerticalLoopFactory(
+                sections__0__horizontal_executions__0__body=[
+                    AssignStmtFactory(left__name="out", right__name="inp")
+                ]
+            ),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    assert len(transformed.vertical_loops) == 1
+    assert written_names(transformed) == ["out"]
+
+
+def test_inner_empty_sections_are_kept():
+    def section(name, start, end):
+        return VerticalLoopSectionFactory(
+            interval=IntervalFactory(start=start, end=end),
+            horizontal_executions__0__body=[AssignStmtFactory(left__name=name, right__name="inp")],
+        )
+
+    first, second = common.AxisBound.from_start(1), common.AxisBound.from_end(-1)
+    testee = StencilFactory(
+        vertical_loops__0__sections=[
+            section("tmp", common.AxisBound.start(), first),
+            section("out", first, second),
+            section("tmp", second, common.AxisBound.end()),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    sections = transformed.vertical_loops[0].sections
+    assert len(sections) == 1
+    assert sections[0].interval.start == first
+
+    testee = StencilFactory(
+        vertical_loops__0__sections=[
+            section("out", common.AxisBound.start(), first),
+            section("tmp", first, second),
+            section("out", second, common.AxisBound.end()),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    sections = transformed.vertical_loops[0].sections
+    assert len(sections) == 3
+    assert not sections[1].horizontal_executions
+
+
+def test_constant_masks():
+    false_mask = oir.Literal(value=common.BuiltInLiteral.FALSE, dtype=common.DataType.BOOL)
+    true_mask = oir.Literal(value=common.BuiltInLiteral.TRUE, dtype=common.DataType.BOOL)
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="out1", right__name="inp")], mask=false_mask
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="out2", right__name="inp")], mask=true_mask
+            ),
+        ],
+        params=[
+            FieldDeclFactory(name="inp"),
+            FieldDeclFactory(name="out1"),
+            FieldDeclFactory(name="out2"),
+        ],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    horizontal_executions = transformed.vertical_loops[0].sections[0].horizontal_executions
+    assert len(horizontal_executions) == 1
+    assert horizontal_executions[0].mask is None
+    assert written_names(transformed) == ["out2"]
+
+
+def test_mask_of_dead_execution_is_removed():
+    mask = FieldAccessFactory(name="mask", dtype=common.DataType.BOOL)
+    testee = StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left=mask, right=mask.copy(update={"name": "cond"}))]
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="tmp", right__name="inp")], mask=mask.copy()
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="out", right__name="inp")],
+            ),
+        ],
+        params=[
+            FieldDeclFactory(name="cond", dtype=common.DataType.BOOL),
+            FieldDeclFactory(name="inp"),
+            FieldDeclFactory(name="out"),
+        ],
+        declarations=[
+            TemporaryFactory(name="mask", dtype=common.DataType.BOOL),
+            TemporaryFactory(name="tmp"),
+        ],
+    )
+    transformed = DeadCodeElimination().visit(testee)
+    assert written_names(transformed) == ["out"]
+    assert not transformed.declarations
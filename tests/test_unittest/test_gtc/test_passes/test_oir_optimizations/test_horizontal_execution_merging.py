@@ -14,9 +14,15 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from gtc import common
 from gtc.passes.oir_optimizations.horizontal_execution_merging import GreedyMerging
 
-from ...oir_utils import AssignStmtFactory, HorizontalExecutionFactory, VerticalLoopSectionFactory
+from ...oir_utils import (
+    AssignStmtFactory,
+    FieldAccessFactory,
+    HorizontalExecutionFactory,
+    VerticalLoopSectionFactory,
+)
 
 
 def test_zero_extent_merging():
@@ -88,3 +94,48 @@ def test_nonzero_extent_merging():
     assert transformed.horizontal_executions[0].body == sum(
         (he.body for he in testee.horizontal_executions), []
     )
+
+
+def test_mask_merging():
+    def mask_factory(name="mask"):
+        return FieldAccessFactory(name=name, dtype=common.DataType.BOOL)
+
+    testee = VerticalLoopSectionFactory(
+        horizontal_executions=[
+            HorizontalExecutionFactory(body=[AssignStmtFactory(left__name="foo")], mask=None),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="bar")], mask=mask_factory()
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="baz")], mask=mask_factory()
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="qux")], mask=mask_factory("other_mask")
+            ),
+        ]
+    )
+    transformed = GreedyMerging().visit(testee)
+    assert len(transformed.horizontal_executions) == 3
+    assert transformed.horizontal_executions[1].body == sum(
+        (he.body for he in testee.horizontal_executions[1:3]), []
+    )
+
+
+def test_mask_write_prevents_merging():
+    def mask_factory(name="mask"):
+        return FieldAccessFactory(name=name, dtype=common.DataType.BOOL)
+
+    testee = VerticalLoopSectionFactory(
+        horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left=mask_factory(), right=mask_factory("other_mask"))],
+                mask=mask_factory(),
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="foo", right__name="bar")],
+                mask=mask_factory(),
+            ),
+        ]
+    )
+    transformed = GreedyMerging().visit(testee)
+    assert len(transformed.horizontal_executions) == 2
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pydantic
+import pytest
+
+from eve import Node
+from gtc import oir
+from gtc.common import GTCPostconditionError, GTCPreconditionError
+from gtc.passes.pass_manager import (
+    DEFAULT_OIR_PIPELINE,
+    OIR_PASSES,
+    Condition,
+    OIRPass,
+    register_oir_pass,
+    run_oir_pipeline,
+)
+
+from ..oir_utils import (
+    AssignStmtFactory,
+    FieldDeclFactory,
+    HorizontalExecutionFactory,
+    StencilFactory,
+    TemporaryFactory,
+)
+
+
+@pytest.fixture
+def stencil():
+    return StencilFactory(
+        vertical_loops__0__sections__0__horizontal_executions=[
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="tmp", right__name="inp")]
+            ),
+            HorizontalExecutionFactory(
+                body=[AssignStmtFactory(left__name="out", right__name="tmp")]
+            ),
+        ],
+        params=[FieldDeclFactory(name="inp"), FieldDeclFactory(name="out")],
+        declarations=[TemporaryFactory(name="tmp")],
+    )
+
+
+def test_default_pipeline_records_stats(stencil):
+    stats = []
+    transformed = run_oir_pipeline(stencil, validate=True, stats=stats)
+
+    assert [record["name"] for record in stats] == list(DEFAULT_OIR_PIPELINE)
+    assert all(record["time"] >= 0 for record in stats)
+    node_count = sum(1 for _ in stencil.iter_tree().if_isinstance(Node))
+    assert stats[-1]["node_count"] == node_count + sum(
+        record["node_count_delta"] for record in stats
+    )
+    assert not transformed.declarations
+
+
+def test_pipeline_selection(stencil):
+    stats = []
+    transformed = run_oir_pipeline(stencil, ["temporaries_to_scalars"], stats=stats)
+
+    assert [record["name"] for record in stats] == ["temporaries_to_scalars"]
+    assert len(transformed.vertical_loops[0].sections[0].horizontal_executions) == 2
+    assert transformed.declarations
+
+
+def test_unknown_pass(stencil):
+    with pytest.raises(ValueError, match="no_such_pass"):
+        run_oir_pipeline(stencil, ["greedy_merging", "no_such_pass"])
+
+
+def test_duplicate_registration():
+    with pytest.raises(ValueError, match="already registered"):
+        register_oir_pass("greedy_merging", lambda node: node)
+
+
+def test_precondition_violation(stencil):
+    empty_section = stencil.vertical_loops[0].sections[0].copy(update={"horizontal_executions": []})
+    testee = stencil.copy(
+        update={
+            "vertical_loops": [
+                stencil.vertical_loops[0].copy(
+                    update={"sections": [empty_section]},
+                )
+            ]
+        }
+    )
+    with pytest.raises(GTCPreconditionError):
+        run_oir_pipeline(testee, ["greedy_merging"])
+
+
+def test_postcondition_checked_with_validation(stencil, monkeypatch):
+    monkeypatch.setitem(
+        OIR_PASSES,
+        "broken",
+        OIRPass(
+            name="broken",
+            transform=lambda node: node,
+            postconditions=(Condition("never satisfied", lambda node: False),),
+        ),
+    )
+    run_oir_pipeline(stencil, ["broken"])
+    with pytest.raises(GTCPostconditionError, match="never satisfied"):
+        run_oir_pipeline(stencil, ["broken"], validate=True)
+
+
+def test_validation_between_passes(stencil, monkeypatch):
+    def drop_declarations(node: oir.Stencil) -> oir.Stencil:
+        return node.copy(update={"declarations": []})
+
+    monkeypatch.setitem(OIR_PASSES, "drop", OIRPass(name="drop", transform=drop_declarations))
+    run_oir_pipeline(stencil, ["drop"])
+    with pytest.raises(pydantic.ValidationError):
+        run_oir_pipeline(stencil, ["drop"], validate=True)
@@ -916,3 +916,378 @@ def test_sum_gpu():
     )
 
     q1[i1 : i2 + 1, jslice, 0] = cp.sum(q2[i1 : i2 + 1, jslice, :], axis=2)
+
+
+def test_memory_pool_reuse():
+    shape = (10, 10, 10)
+    with gt_store.memory_pool() as pool:
+        stor = gt_store.empty("gtmc", default_origin=(1, 1, 1), shape=shape, dtype=np.float64)
+        address = stor._raw_buffer.ctypes.data
+        assert pool.stats.bytes_in_use >= stor._raw_buffer.nbytes
+        del stor
+        assert pool.stats.bytes_in_use == 0
+        assert pool.stats.bytes_pooled > 0
+
+        stor = gt_store.zeros("gtmc", default_origin=(1, 1, 1), shape=shape, dtype=np.float64)
+        assert stor._raw_buffer.ctypes.data == address
+        assert pool.stats.hits == 1 and pool.stats.misses == 1
+        assert pool.stats.hit_rate == 0.5
+        assert stor.is_stencil_view
+        assert (stor == 0).all()
+
+    assert pool.stats.bytes_pooled == 0
+    del stor
+    assert pool.stats.bytes_pooled == 0
+
+
+def test_memory_pool_views_keep_buffer_alive():
+    shape = (10, 10, 10)
+    with gt_store.memory_pool() as pool:
+        stor = gt_store.ones("gtmc", default_origin=(1, 1, 1), shape=shape, dtype=np.float64)
+        view = stor[1:, :, 2].view(np.ndarray)
+        del stor
+        assert pool.stats.bytes_pooled == 0
+
+        other = gt_store.zeros("gtmc", default_origin=(1, 1, 1), shape=shape, dtype=np.float64)
+        assert pool.stats.hits == 0
+        assert (view == 1).all()
+        del other, view
+        assert pool.stats.bytes_in_use == 0
+
+
+def test_memory_pool_max_pooled_bytes():
+    with gt_store.memory_pool(max_pooled_bytes=0) as pool:
+        stor = gt_store.empty("gtmc", default_origin=(0, 0, 0), shape=(4, 4, 4), dtype=np.float64)
+        del stor
+        assert pool.stats.bytes_pooled == 0
+        assert pool.stats.bytes_in_use == 0
+
+
+def test_memory_pool_size_classes():
+    from gt4py.storage.allocators import MIN_BLOCK_SIZE, size_class
+
+    assert size_class(1) == MIN_BLOCK_SIZE
+    for nbytes in [65, 100, 1000, 4097, 123456789]:
+        assert nbytes <= size_class(nbytes) <= 1.25 * nbytes
+    assert size_class(4096) == 4096
+
+
+@pytest.mark.parametrize("backend", ["gtx86", "gtmc"])
+def test_file_backed_storage(tmp_path, backend):
+    path = tmp_path / "field.bin"
+    params = dict(backend=backend, default_origin=(2, 2, 0), shape=(9, 7, 5), dtype=np.float64)
+    data = np.random.randn(9, 7, 5)
+
+    stor = gt_store.empty(**params, path=path)
+    assert isinstance(stor._raw_buffer, np.memmap)
+    assert stor.is_stencil_view
+    stor[...] = data
+    stor.flush()
+    reference = gt_store.from_array(data, **params)
+    assert stor.strides == reference.strides
+    del stor
+
+    restored = gt_store.from_file(**params, path=path, mode="r")
+    assert restored.is_stencil_view
+    np.testing.assert_equal(restored.view(np.ndarray), data)
+    with pytest.raises(ValueError):
+        restored[0, 0, 0] = 1.0
+
+    copy = restored.copy()
+    assert not isinstance(copy._raw_buffer, np.memmap)
+    np.testing.assert_equal(copy.view(np.ndarray), data)
+
+
+def test_file_backed_storage_invalid_mode(tmp_path):
+    with pytest.raises(ValueError):
+        gt_store.from_file(
+            "gtmc", (0, 0, 0), (3, 3, 3), np.float64, path=tmp_path / "field.bin", mode="w+"
+        )
+
+
+@pytest.mark.parametrize("copy", [False, "if_needed"])
+def test_from_array_without_copy(copy):
+    reference = gt_store.empty("gtmc", default_origin=(1, 1, 0), shape=(6, 5, 4), dtype=np.float64)
+    data = reference.view(np.ndarray)
+    data[...] = np.random.randn(6, 5, 4)
+
+    stor = gt_store.from_array(data, backend="gtmc", default_origin=(1, 1, 0), copy=copy)
+    assert np.shares_memory(stor, data)
+    assert stor.is_stencil_view
+    assert stor.default_origin == (1, 1, 0)
+    stor[2, 2, 2] = 42.0
+    assert data[2, 2, 2] == 42.0
+    with pytest.raises(ValueError, match="aligned"):
+        gt_store.from_array(data, backend="gtmc", default_origin=(2, 1, 0), copy=False)
+
+    # any buffer-protocol object
+    buffer = np.arange(24, dtype=np.float32)
+    stor = gt_store.from_array(
+        memoryview(buffer).cast("B").cast("f", (2, 3, 4)),
+        backend="numpy",
+        default_origin=(0, 0, 0),
+        copy=copy,
+    )
+    assert np.shares_memory(stor, buffer)
+    assert stor.shape == (2, 3, 4)
+
+
+@pytest.mark.parametrize(
+    "data, kwargs",
+    [
+        (np.zeros((6, 5, 4)), dict(backend="gtmc", dtype=np.float32)),
+        (np.zeros((6, 5, 4), order="F"), dict(backend="gtx86")),
+        (np.zeros((6, 5, 4)), dict(backend="gtmc")),
+        ([[[0.0]]], dict(backend="numpy")),
+    ],
+)
+def test_from_array_copy_if_needed(data, kwargs):
+    kwargs.setdefault("default_origin", (1, 0, 0) if np.asarray(data).shape[0] > 1 else (0, 0, 0))
+    with pytest.raises(ValueError, match="without a copy"):
+        gt_store.from_array(data, copy=False, **kwargs)
+
+    stor = gt_store.from_array(data, copy="if_needed", **kwargs)
+    assert not np.shares_memory(stor, np.asarray(data))
+    assert stor.is_stencil_view
+
+
+def _fill_shared_storage(stor, value):
+    stor[...] = value
+    return stor.sum()
+
+
+@pytest.mark.parametrize("backend", ["gtx86", "gtmc"])
+def test_shared_memory_storage_pickle(backend):
+    import pickle
+
+    stor = gt_store.empty(
+        backend, default_origin=(1, 2, 0), shape=(5, 6, 7), dtype=np.float64, shared_memory=True
+    )
+    reference = gt_store.empty(backend, default_origin=(1, 2, 0), shape=(5, 6, 7), dtype=np.float64)
+    assert isinstance(stor, gt_store.storage.SharedMemoryStorage)
+    assert stor.strides == reference.strides
+    stor[...] = np.random.randn(5, 6, 7)
+
+    pickled = pickle.dumps(stor)
+    assert len(pickled) < stor.nbytes
+    restored = pickle.loads(pickled)
+    assert isinstance(restored, gt_store.storage.SharedMemoryStorage)
+    assert restored.default_origin == stor.default_origin
+    assert restored.strides == stor.strides
+    assert restored.is_stencil_view
+    np.testing.assert_equal(restored.view(np.ndarray), stor.view(np.ndarray))
+    restored[1, 1, 1] = 42.0
+    assert stor[1, 1, 1] == 42.0
+
+    view = pickle.loads(pickle.dumps(stor[1:3, :, 2]))
+    assert not view.is_stencil_view
+    np.testing.assert_equal(view.view(np.ndarray), stor[1:3, :, 2].view(np.ndarray))
+
+    masked = gt_store.zeros(
+        backend, default_origin=(1, 0), shape=(5, 7), dtype=np.float64, mask=[True, False, True]
+    )
+    masked_shared = gt_store.empty(
+        backend,
+        default_origin=(1, 0),
+        shape=(5, 7),
+        dtype=np.float64,
+        mask=[True, False, True],
+        shared_memory=True,
+    )
+    restored = pickle.loads(pickle.dumps(masked_shared))
+    assert restored.mask == masked.mask
+    assert restored.strides == masked.strides
+
+
+def test_shared_memory_storage_multiprocessing():
+    import multiprocessing
+
+    stor = gt_store.zeros("gtmc", default_origin=(1, 1, 0), shape=(4, 4, 3), dtype=np.float64)
+    shared = gt_store.empty(
+        "gtmc", default_origin=(1, 1, 0), shape=(4, 4, 3), dtype=np.float64, shared_memory=True
+    )
+    with multiprocessing.Pool(1) as pool:
+        assert pool.apply(_fill_shared_storage, (shared, 2.0)) == 2.0 * shared.size
+        pool.apply(_fill_shared_storage, (stor, 2.0))
+    assert (shared == 2.0).all()
+    assert (stor == 0.0).all()
+    assert isinstance(shared.copy(), gt_store.storage.SharedMemoryStorage)
+
+
+def test_shared_memory_storage_gpu_backend():
+    with pytest.raises(ValueError, match="CPU"):
+        gt_store.empty("gtcuda", (0, 0, 0), (3, 3, 3), np.float64, shared_memory=True)
+
+
+@pytest.mark.parametrize(
+    "backend, mask", [("gtmc", None), ("gtx86", None), ("gtmc", [True, False, True])]
+)
+def test_first_touch(backend, mask):
+    from gt4py.storage import numa
+
+    shape = (64, 48, 200)
+    data = np.random.randn(*shape)
+    stor = gt_store.empty(backend, (3, 3, 0), shape, np.float64, mask=mask)
+    assert stor.nbytes >= numa.FIRST_TOUCH_MIN_BYTES or mask is not None
+    numa.first_touch(stor, 2.0, num_threads=4)
+    assert (stor == 2.0).all()
+
+    value = data[:, 0, :] if mask else data
+    numa.first_touch(stor, value, num_threads=4)
+    np.testing.assert_equal(stor.view(np.ndarray), value)
+
+    numa.first_touch(stor, 1.0, num_threads=1)
+    assert (stor == 1.0).all()
+
+
+def test_first_touch_config(monkeypatch):
+    import mmap
+
+    from gt4py import config as gt_config
+    from gt4py.storage import numa
+
+    monkeypatch.setitem(gt_config.storage_settings, "first_touch_threads", 3)
+    data = np.random.randn(64, 64, 160)
+    stor = gt_store.from_array(data, "gtmc", default_origin=(1, 1, 0))
+    np.testing.assert_equal(stor.view(np.ndarray), data)
+    assert (gt_store.ones("gtx86", (1, 1, 0), data.shape, np.float64) == 1.0).all()
+
+    try:
+        nodes = numa.page_nodes(stor)
+    except NotImplementedError:
+        pytest.skip("Page placement can not be queried on this platform.")
+    assert len(nodes) >= stor.nbytes // mmap.PAGESIZE
+    assert (nodes >= 0).all()
+
+
+def test_memory_accounting(monkeypatch):
+    from gt4py import config as gt_config
+    from gt4py.storage import accounting
+
+    monkeypatch.setitem(gt_config.storage_settings, "memory_accounting", True)
+    snapshot = accounting.memory_snapshot()
+    in_use = accounting.memory_in_use()
+    with gt_store.track_high_water_mark() as tracker:
+        with gt_store.memory_tag("state"):
+            stor = gt_store.empty("gtmc", (1, 1, 0), (10, 10, 10), np.float64)
+        tmp = gt_store.zeros("numpy", (0, 0, 0), (100, 10), np.float32, mask=[True, False, True])
+        accounting.set_tag(tmp, "tmp")
+        view = stor[1:3]
+        del tmp
+
+    assert stor._raw_buffer.nbytes >= stor.nbytes
+    assert accounting.memory_in_use() == in_use + stor._raw_buffer.nbytes
+    assert tracker.increase_bytes == stor._raw_buffer.nbytes + 100 * 10 * 4
+
+    report = gt_store.memory_report(since=snapshot)
+    assert len(report.entries) == 1
+    (entry,) = report.entries
+    assert (entry.kind, entry.backend, entry.tag, entry.count) == ("storage", "gtmc", "state", 1)
+    assert entry.nbytes == stor._raw_buffer.nbytes
+    assert entry.site.startswith(__file__)
+    assert "[state]" in str(report)
+
+    # views keep the memory alive
+    del stor
+    assert len(gt_store.memory_report(since=snapshot).entries) == 1
+    del view
+    assert not gt_store.memory_report(since=snapshot).entries
+    assert accounting.memory_in_use() == in_use
+
+
+def test_memory_accounting_temporaries(monkeypatch):
+    from gt4py import config as gt_config
+    from gt4py.gtscript import PARALLEL, Field, computation, interval
+    from gt4py.stencil_builder import StencilBuilder
+    from gt4py.storage import accounting
+
+    def definition(in_field: Field[np.float64], out_field: Field[np.float64]):
+        with computation(PARALLEL), interval(...):
+            tmp = in_field[1, 0, 0] + in_field[-1, 0, 0]
+            out_field = tmp[1, 0, 0] - tmp[-1, 0, 0]  # noqa: F841
+
+    def build():
+        builder = StencilBuilder(definition, backend=gt_backend.from_name("numpy")).with_options(
+            name="definition", module=__name__
+        )
+        return builder.build(), builder.stencil_source
+
+    # the hook is only generated while accounting is enabled, which changes the stencil id
+    monkeypatch.setitem(gt_config.storage_settings, "memory_accounting", False)
+    _, source = build()
+    assert "_gt_accounting" not in source
+    monkeypatch.setitem(gt_config.storage_settings, "memory_accounting", True)
+    stencil_class, source = build()
+    assert "_gt_accounting" in source
+
+    stencil = stencil_class()
+    in_field = gt_store.ones("numpy", (2, 0, 0), (10, 3, 3), np.float64)
+    out_field = gt_store.zeros("numpy", (2, 0, 0), (10, 3, 3), np.float64)
+
+    with gt_store.track_high_water_mark() as tracker:
+        stencil(in_field, out_field)
+    assert tracker.increase_bytes == 8 * 3 * 3 * 8
+
+    monkeypatch.setitem(gt_config.storage_settings, "memory_accounting", False)
+    snapshot = accounting.memory_snapshot()
+    stor = gt_store.zeros("numpy", (0, 0, 0), (3, 3, 3), np.float64)  # noqa: F841  # alive but untracked
+    stencil(in_field, out_field)
+    assert not gt_store.memory_report(since=snapshot).entries
+
+
+@pytest.mark.parametrize("backend", ["numpy", "debug", "gtx86", "gtmc"])
+@pytest.mark.parametrize(
+    "mask, shape", [([True, True, False], (4, 5)), ([False, False, True], (6,))]
+)
+def test_broadcast_to(backend, mask, shape):
+    data = np.random.randn(*shape)
+    stor = gt_store.from_array(data, backend, (1, 1, 1), mask=mask)
+    view = stor.broadcast_to((4, 5, 6))
+
+    assert view.shape == (4, 5, 6)
+    assert view.mask == [True, True, True]
+    assert np.shares_memory(view, stor)
+    assert all(view.strides[dim] == 0 for dim, m in enumerate(mask) if not m)
+    assert not view.flags.writeable
+    assert view.is_stencil_view
+    assert view.default_origin == tuple(1 if m else 0 for m in mask)
+    assert gt_backend.from_name(backend).storage_info["is_compatible_layout"](view)
+    expanded_shape = [size if m else 1 for size, m in zip(view.shape, mask)]
+    np.testing.assert_equal(
+        view.view(np.ndarray), np.broadcast_to(data.reshape(expanded_shape), view.shape)
+    )
+    with pytest.raises(ValueError, match="read-only"):
+        view[0, 0, 0] = 1.0
+
+
+def test_broadcast_to_invalid():
+    stor = gt_store.zeros("gtmc", (0, 0, 0), (4, 5, 6), np.float64, mask=[True, False, True])
+    with pytest.raises(ValueError, match="include"):
+        stor.broadcast_to((4, 6), mask=[True, False, False])
+    with pytest.raises(ValueError, match="size"):
+        stor.broadcast_to((3, 5, 6))
+
+
+@pytest.mark.parametrize("backend", ["numpy", "debug"])
+def test_broadcast_to_stencil(backend):
+    from gt4py import gtscript
+    from gt4py.gtscript import PARALLEL, Field, computation, interval
+
+    def definition(in_field: Field[np.float64], out_field: Field[np.float64]):
+        with computation(PARALLEL), interval(...):
+            out_field = in_field[1, 0, 0] + in_field[0, 0, 1]  # noqa: F841
+
+    stencil = gtscript.stencil(backend=backend, definition=definition)
+    data = np.random.randn(5, 4)
+    in_field = gt_store.from_array(data, backend, (0, 0, 0), mask=[True, True, False])
+    out_field = gt_store.zeros(backend, (0, 0, 0), (4, 4, 3), np.float64)
+
+    stencil(in_field.broadcast_to((5, 4, 4)), out_field)
+    np.testing.assert_allclose(
+        out_field.view(np.ndarray), np.repeat((data[1:] + data[:-1])[:, :, np.newaxis], 3, axis=2)
+    )
+
+    # broadcast views alias their memory, thus they cannot be written
+    out_ij = gt_store.zeros(backend, (0, 0, 0), (4, 4), np.float64, mask=[True, True, False])
+    with pytest.raises(ValueError, match="out_field"):
+        stencil(in_field.broadcast_to((5, 4, 4)), out_ij.broadcast_to((4, 4, 3)))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import zlib
+
+import numpy as np
+import pytest
+
+import gt4py.storage as gt_store
+from gt4py.storage import io as gt_storage_io
+
+
+def make_fields(backend):
+    u = gt_store.from_array(np.random.randn(10, 9, 6), backend, default_origin=(2, 2, 0))
+    mask = [True, False, True]
+    w = gt_store.from_array(np.random.randn(8, 6), backend, default_origin=(1, 0), mask=mask)
+    k = gt_store.from_array(
+        np.arange(5, dtype=np.int32), backend, default_origin=(0,), mask=[False, False, True]
+    )
+    return {"u": u, "w": w, "k": k}
+
+
+@pytest.mark.parametrize("compression", [None, "zlib", {"u": "lzma", "w": "bz2"}])
+@pytest.mark.parametrize("backend, load_backend", [("gtmc", "gtmc"), ("gtx86", "gtmc")])
+def test_save_load(tmp_path, backend, load_backend, compression):
+    path = tmp_path / "state.gtckpt"
+    fields = make_fields(backend)
+    gt_storage_io.save(path, fields, compression=compression)
+
+    header = gt_storage_io.read_header(path)
+    assert set(header) == set(fields)
+    assert all(info["offset"] % gt_storage_io.BLOCK_ALIGNMENT == 0 for info in header.values())
+    assert header["w"]["mask"] == [True, False, True]
+
+    loaded = gt_storage_io.load(path, load_backend)
+    for name, stor in fields.items():
+        assert loaded[name].backend == load_backend
+        assert loaded[name].dtype == stor.dtype
+        assert loaded[name].mask == stor.mask
+        assert loaded[name].default_origin == stor.default_origin
+        assert loaded[name].is_stencil_view
+        np.testing.assert_equal(loaded[name].view(np.ndarray), stor.view(np.ndarray))
+
+    assert list(gt_storage_io.load(path, load_backend, names=["k"])) == ["k"]
+    with pytest.raises(KeyError):
+        gt_storage_io.load(path, load_backend, names=["missing"])
+
+
+def test_load_corrupted(tmp_path):
+    path = tmp_path / "state.gtckpt"
+    gt_storage_io.save(path, make_fields("gtmc"), compression="zlib")
+    offset = gt_storage_io.read_header(path)["u"]["offset"]
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(b"\xff" * 16)
+
+    # the decompression error is raised, not an error from closing the file map
+    with pytest.raises(zlib.error):
+        gt_storage_io.load(path, "gtmc")
+    assert list(gt_storage_io.load(path, "gtmc", names=["k"])) == ["k"]
+
+
+def test_save_strip_halo(tmp_path):
+    path = tmp_path / "state.gtckpt"
+    fields = make_fields("gtmc")
+    gt_storage_io.save(path, fields, strip_halo=True)
+    assert gt_storage_io.read_header(path)["u"]["region"] == [[2, 8], [2, 7], [0, 6]]
+
+    loaded = gt_storage_io.load(path, "gtmc")
+    u = loaded["u"].view(np.ndarray)
+    np.testing.assert_equal(u[2:8, 2:7, :], fields["u"][2:8, 2:7, :].view(np.ndarray))
+    assert (u[:2] == 0).all() and (u[:, 7:] == 0).all()
+    np.testing.assert_equal(loaded["k"].view(np.ndarray), fields["k"].view(np.ndarray))
+
+
+def test_save_asynchronous(tmp_path):
+    path = tmp_path / "state.gtckpt"
+    fields = make_fields("gtx86")
+    expected = fields["u"].view(np.ndarray).copy()
+    future = gt_storage_io.save(path, fields, asynchronous=True)
+    fields["u"][...] = 0.0
+    assert future.result() is None
+
+    np.testing.assert_equal(gt_storage_io.load(path, "gtx86")["u"].view(np.ndarray), expected)
+
+
+def test_invalid_files(tmp_path):
+    path = tmp_path / "state.gtckpt"
+    with pytest.raises(ValueError, match="compression"):
+        gt_storage_io.save(path, make_fields("gtmc"), compression="zip")
+    with pytest.raises(TypeError):
+        gt_storage_io.save(path, {"u": np.zeros((3, 3, 3))})
+
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError, match="not a GT4Py checkpoint"):
+        gt_storage_io.load(path, "gtmc")